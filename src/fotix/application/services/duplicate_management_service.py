@@ -77,6 +77,66 @@ class DuplicateManagementService:
                 - 'backup_id': ID do backup criado (ou None se não criado)
                 - 'error': Mensagem de erro (se ocorrer)
         
+        Raises:
+            ValueError: Se o conjunto de duplicatas estiver vazio.
+        """
+        return self._process_duplicate_set(duplicate_set, create_backup, custom_selection)
+    
+    @measure_time
+    def process_duplicate_sets(
+        self,
+        duplicate_sets: List[DuplicateSet],
+        create_backup: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Processa vários conjuntos de duplicatas, usando a estratégia de seleção
+        para escolher o arquivo a manter em cada um.
+        
+        A seleção é feita de uma só vez para todos os conjuntos (ver
+        ISelectionStrategy.select_for_all), permitindo que a estratégia agrupe
+        as leituras de arquivos. Cada conjunto é então processado como em
+        process_duplicate_set; o tempo é medido uma única vez, para o lote.
+        
+        Args:
+            duplicate_sets: Conjuntos de arquivos duplicados a serem processados.
+            create_backup: Se True, cria backup dos arquivos antes de removê-los.
+        
+        Returns:
+            List[Dict[str, Any]]: Resultado de cada conjunto, na mesma ordem, no
+                formato retornado por process_duplicate_set.
+        
+        Raises:
+            ValueError: Se algum dos conjuntos de duplicatas estiver vazio.
+        """
+        if any(not duplicate_set.files for duplicate_set in duplicate_sets):
+            error_msg = "O conjunto de duplicatas está vazio"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        logger.info(f"Processando {len(duplicate_sets)} conjuntos de duplicatas")
+        files_to_keep = self.selection_strategy.select_for_all(duplicate_sets)
+        return [
+            self._process_duplicate_set(duplicate_set, create_backup, file_to_keep)
+            for duplicate_set, file_to_keep in zip(duplicate_sets, files_to_keep)
+        ]
+    
+    def _process_duplicate_set(
+        self,
+        duplicate_set: DuplicateSet,
+        create_backup: bool,
+        custom_selection: Optional[FileInfo]
+    ) -> Dict[str, Any]:
+        """
+        Implementação de process_duplicate_set, sem medição de tempo.
+        
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados a ser processado.
+            create_backup: Se True, cria backup dos arquivos antes de removê-los.
+            custom_selection: Arquivo a manter, ou None para usar a estratégia de seleção.
+        
+        Returns:
+            Dict[str, Any]: Resultado no formato descrito em process_duplicate_set.
+        
         Raises:
             ValueError: Se o conjunto de duplicatas estiver vazio.
         """
@@ -285,27 +345,24 @@ class DuplicateManagementService:
                     result['backup_id'] = "no_backup_for_zip_files"
             
             # Remover os arquivos duplicados (mover para a lixeira)
+            files_to_trash: List[FileInfo] = []
             for file_info in files_to_remove:
                 if file_info.in_zip:
                     logger.info(f"Arquivo {file_info.path} está dentro de um ZIP e não será removido.")
                     skipped_zip_files_info.append(file_info)
                 else:
-                    try:
-                        # _remove_file já tem a checagem in_zip, mas chamamos aqui para arquivos não-ZIP
-                        self._remove_file(file_info) 
-                        actual_removed_files_info.append(file_info)
-                    except Exception as e:
-                        # Se _remove_file falhar, o arquivo não foi removido
-                        logger.error(f"Falha ao remover o arquivo {file_info.path}: {str(e)}")
-                        # Adicionar ao erro geral ou tratar de forma específica?
-                        # Por enquanto, não adicionamos a actual_removed_files_info
-                        # e deixamos o erro geral da exceção ser pego abaixo se necessário.
-                        # Se uma exceção for pega aqui, ela será registrada e o processamento continua para outros arquivos.
-                        # Se quisermos parar tudo, podemos relançar a exceção.
-                        if result['error'] is None:
-                            result['error'] = f"Falha ao remover {file_info.path}. "
-                        else:
-                            result['error'] += f"Falha ao remover {file_info.path}. "
+                    files_to_trash.append(file_info)
+
+            # Todos os arquivos vão para a lixeira em uma única operação em lote;
+            # a falha de um arquivo não impede a remoção dos demais
+            failures = self._remove_files(files_to_trash)
+            for file_info in files_to_trash:
+                if file_info.path not in failures:
+                    actual_removed_files_info.append(file_info)
+                elif result['error'] is None:
+                    result['error'] = f"Falha ao remover {file_info.path}. "
+                else:
+                    result['error'] += f"Falha ao remover {file_info.path}. "
             
             result['kept_file'] = file_to_keep
             result['removed_files'] = actual_removed_files_info # Apenas os que foram realmente movidos/tentados
@@ -375,26 +432,39 @@ class DuplicateManagementService:
             logger.error(f"Erro ao criar backup: {str(e)}")
             raise
     
-    def _remove_file(self, file_info: FileInfo) -> None:
+    def _remove_files(self, files: List[FileInfo]) -> Dict[Path, Exception]:
         """
-        Remove um arquivo (move para a lixeira).
+        Remove vários arquivos (move para a lixeira) em uma única operação em lote.
         
         Args:
-            file_info: Informações sobre o arquivo a ser removido.
+            files: Informações sobre os arquivos a serem removidos. Arquivos
+                   dentro de ZIPs não podem ser removidos diretamente e são ignorados.
+            
+        Returns:
+            Dict[Path, Exception]: Erro de cada arquivo que não pôde ser removido.
             
         Raises:
-            Exception: Se ocorrer um erro durante a remoção.
+            Exception: Se a operação em lote falhar como um todo.
         """
-        if file_info.in_zip:
-            logger.info(f"Arquivo dentro de ZIP, não pode ser removido diretamente: {file_info.path}")
-            return
+        paths = []
+        for file_info in files:
+            if file_info.in_zip:
+                logger.info(f"Arquivo dentro de ZIP, não pode ser removido diretamente: {file_info.path}")
+            else:
+                logger.info(f"Removendo arquivo: {file_info.path}")
+                paths.append(file_info.path)
         
-        logger.info(f"Removendo arquivo: {file_info.path}")
+        if not paths:
+            return {}
         
         try:
-            # Mover o arquivo para a lixeira usando o serviço de sistema de arquivos
-            self.file_system_service.move_to_trash(file_info.path)
-            logger.info(f"Arquivo movido para a lixeira com sucesso: {file_info.path}")
+            # Mover os arquivos para a lixeira usando o serviço de sistema de arquivos
+            failures = self.file_system_service.move_many_to_trash(paths)
         except Exception as e:
-            logger.error(f"Erro ao remover arquivo {file_info.path}: {str(e)}")
+            logger.error(f"Erro ao remover arquivos: {str(e)}")
             raise
+        
+        for path, error in failures.items():
+            logger.error(f"Erro ao remover arquivo {path}: {str(error)}")
+        logger.info(f"Arquivos movidos para a lixeira com sucesso: {len(paths) - len(failures)}")
+        return failures
@@ -5,11 +5,19 @@ Este módulo fornece acesso às configurações da aplicação, como caminhos de
 níveis de log e outras configurações do sistema.
 """
 
+import functools
 import json
 import logging
 import os
+import uuid
 from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Set, Union
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; usa-se o json da biblioteca padrão
+    orjson = None
 
 # Configuração padrão
 DEFAULT_CONFIG = {
@@ -20,16 +28,79 @@ DEFAULT_CONFIG = {
     "default_scan_dir": str(Path.home()),
 }
 
+# Mapeamento imutável de nomes de nível de log para os valores do módulo logging
+_LOG_LEVELS = MappingProxyType({
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+})
+
 # Singleton para a configuração
 _config_instance = None
 
+# Diretórios pai já confirmados como existentes (evita mkdir repetido a cada gravação)
+_verified_parents: Set[Path] = set()
+
+
+def _dumps_config(config: Dict[str, Any]) -> bytes:
+    """
+    Serializa a configuração em JSON indentado com 4 espaços.
 
+    Usa sempre o json da biblioteca padrão: o orjson só indenta com 2 espaços,
+    e o arquivo deve ter o mesmo formato com ou sem ele instalado. O arquivo
+    é pequeno, então a serialização não pesa.
+
+    Args:
+        config: Dicionário com as configurações.
+
+    Returns:
+        bytes: Conteúdo JSON codificado em UTF-8.
+    """
+    return json.dumps(config, indent=4).encode('utf-8')
+
+
+def _loads_config(data: bytes) -> Dict[str, Any]:
+    """
+    Desserializa o conteúdo JSON da configuração, usando orjson quando disponível.
+
+    Args:
+        data: Conteúdo do arquivo de configuração.
+
+    Returns:
+        Dict[str, Any]: Dicionário com as configurações.
+
+    Raises:
+        ValueError: Se o conteúdo não for um JSON válido.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _ensure_parent_dir(file_path: Path) -> None:
+    """
+    Garante que o diretório pai do arquivo exista, criando-o apenas na primeira vez.
+
+    Args:
+        file_path: Caminho do arquivo cujo diretório pai deve existir.
+    """
+    parent = file_path.parent
+    if parent not in _verified_parents:
+        parent.mkdir(parents=True, exist_ok=True)
+        _verified_parents.add(parent)
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_config_path() -> Path:
     """
     Retorna o caminho padrão para o arquivo de configuração.
     
     O arquivo de configuração é armazenado no diretório de configuração do usuário,
-    que varia de acordo com o sistema operacional.
+    que varia de acordo com o sistema operacional. O resultado é calculado uma
+    única vez por processo (use get_default_config_path.cache_clear() para
+    recalculá-lo).
     
     Returns:
         Path: Caminho para o arquivo de configuração padrão.
@@ -41,8 +112,10 @@ def get_default_config_path() -> Path:
     else:
         config_dir = Path.home() / ".config" / "fotix"
     
-    # Garante que o diretório existe
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # Garante que o diretório existe (um stat basta quando ele já foi criado)
+    if not config_dir.is_dir():
+        config_dir.mkdir(parents=True, exist_ok=True)
+    _verified_parents.add(config_dir)
     
     return config_dir / "config.json"
 
@@ -70,15 +143,12 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any
     
     # Se o arquivo não existir, cria com as configurações padrão
     if not config_path.exists():
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
+        save_config(DEFAULT_CONFIG, config_path)
         return DEFAULT_CONFIG.copy()
     
     # Carrega o arquivo existente
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _loads_config(config_path.read_bytes())
         
         # Garante que todas as chaves padrão existam
         for key, value in DEFAULT_CONFIG.items():
@@ -86,7 +156,8 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any
                 config[key] = value
         
         return config
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # json.JSONDecodeError e orjson.JSONDecodeError derivam de ValueError
         raise ValueError(f"Arquivo de configuração inválido: {e}") from e
 
 
@@ -107,10 +178,32 @@ def save_config(config: Dict[str, Any], config_path: Optional[Union[str, Path]]
     else:
         config_path = Path(config_path)
     
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(config_path)
     
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=4)
+    # Gravar em um arquivo temporário no mesmo diretório e substituir o original
+    # de forma atômica, evitando um arquivo truncado em caso de falha
+    data = _dumps_config(config)
+    tmp_path = config_path.with_name(f".{config_path.name}.{uuid.uuid4().hex}.tmp")
+    # Criar com modo 0o666 para que a umask seja aplicada, como em open()
+    # (tempfile criaria o arquivo sempre com 0o600)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+    except FileNotFoundError:
+        # O diretório pai foi removido depois de verificado: criá-lo novamente
+        _verified_parents.discard(config_path.parent)
+        _ensure_parent_dir(config_path)
+        fd = os.open(tmp_path, flags, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def get_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
@@ -147,15 +240,7 @@ def get_log_level() -> int:
     config = get_config()
     level_str = config.get("log_level", "INFO").upper()
     
-    log_levels = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL
-    }
-    
-    return log_levels.get(level_str, logging.INFO)
+    return _LOG_LEVELS.get(level_str, logging.INFO)
 
 
 def get_backup_dir() -> Path:
@@ -174,14 +259,18 @@ def get_backup_dir() -> Path:
     return backup_dir
 
 
-def update_config(key: str, value: Any) -> None:
+def update_config(key: str, value: Any, save: bool = True) -> None:
     """
-    Atualiza uma configuração específica e salva no arquivo.
+    Atualiza uma configuração específica e, opcionalmente, salva no arquivo.
     
     Args:
         key: Chave da configuração a ser atualizada.
         value: Novo valor para a configuração.
+        save: Se True, grava a configuração no arquivo imediatamente. Use False
+              ao atualizar várias chaves em sequência e chame save_config uma
+              única vez ao final.
     """
     config = get_config()
     config[key] = value
-    save_config(config)
+    if save:
+        save_config(config)
@@ -7,42 +7,104 @@ Utiliza o algoritmo BLAKE3 para hashing eficiente e inclui otimizações como
 pré-filtragem por tamanho.
 """
 
+import logging
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Callable, Iterable
+from typing import Dict, List, Optional, Set, Tuple, Callable, Iterable, Iterator, Union
 
 import blake3
 
-from fotix.core.interfaces import IDuplicateFinderService
+from fotix.config import get_config
 from fotix.core.models import DuplicateSet, FileInfo
 from fotix.infrastructure.interfaces import IFileSystemService, IZipHandlerService
 from fotix.infrastructure.logging_config import get_logger
 from fotix.utils.helpers import measure_time
+from fotix.utils.image_utils import get_image_resolution_from_header, is_image_file
 
 # Obter logger para este módulo
 logger = get_logger(__name__)
 
-# Tamanho do bloco para leitura de arquivos (64KB)
-CHUNK_SIZE = 65536
+# Tamanho do bloco para leitura de arquivos (1MB), faixa em que SSDs e
+# discos atingem a banda sequencial máxima
+CHUNK_SIZE = 1024 * 1024
+
+# Tamanho a partir do qual arquivos locais são lidos via mmap (1MB), permitindo
+# que o BLAKE3 distribua o hashing entre vários núcleos
+MMAP_HASH_THRESHOLD = 1024 * 1024
+
+# Quantidade de bytes do início do arquivo usada na pré-filtragem por conteúdo (4KB)
+HEAD_HASH_SIZE = 4096
+
+# Tamanho máximo (16MB) dos grupos de exatamente dois arquivos comparados byte a
+# byte: apenas um dos arquivos precisa ser submetido ao BLAKE3
+PAIR_COMPARE_MAX_SIZE = 16 * 1024 * 1024
 
 # Tamanho mínimo para considerar arquivos como potenciais duplicatas (1KB)
 # Arquivos muito pequenos podem ter colisões de hash mais frequentes
 MIN_FILE_SIZE = 1024
 
+# Funções de chave usadas no agrupamento (executadas em C)
+_SIZE_KEY = attrgetter('size')
+_HASH_KEY = attrgetter('hash')
+
+
+def _local_file_info(file_path: Union[str, Path], size: int,
+                     creation_time: float, modification_time: float) -> FileInfo:
+    """
+    Cria um FileInfo para um arquivo local a partir dos dados obtidos na varredura.
+
+    Args:
+        file_path: Caminho do arquivo.
+        size: Tamanho do arquivo em bytes.
+        creation_time: Data de criação (timestamp).
+        modification_time: Data de modificação (timestamp).
+
+    Returns:
+        FileInfo: Informações do arquivo, ainda sem hash.
+    """
+    return FileInfo(
+        path=file_path,
+        size=size,
+        hash=None,  # Hash será calculado posteriormente se necessário
+        creation_time=creation_time,
+        modification_time=modification_time,
+        in_zip=False
+    )
+
+
+def _store_image_resolution(file_info: FileInfo, header: bytes) -> None:
+    """
+    Registra no FileInfo a resolução de uma imagem a partir dos bytes já lidos.
+
+    Aproveita os bytes lidos para o cálculo do hash, evitando que a estratégia de
+    seleção por resolução precise abrir a imagem novamente.
 
-class DuplicateFinderService(IDuplicateFinderService):
+    Args:
+        file_info: Informações sobre o arquivo.
+        header: Bytes do início do arquivo.
+    """
+    if file_info.resolution is None and is_image_file(file_info.path):
+        file_info.resolution = get_image_resolution_from_header(header)
+
+
+class DuplicateFinderService:
     """
     Implementação do serviço de detecção de duplicatas.
 
-    Esta classe implementa a interface IDuplicateFinderService, fornecendo
-    métodos para identificar arquivos duplicados com base em seu conteúdo.
+    Esta classe implementa a interface IDuplicateFinderService (por tipagem
+    estrutural, sem herdar do Protocol), fornecendo métodos para identificar
+    arquivos duplicados com base em seu conteúdo.
     Utiliza o algoritmo BLAKE3 para hashing eficiente e inclui otimizações
     como pré-filtragem por tamanho.
     """
 
     def __init__(self, file_system_service: IFileSystemService,
-                zip_handler_service: Optional[IZipHandlerService] = None):
+                zip_handler_service: Optional[IZipHandlerService] = None,
+                max_workers: Optional[int] = None):
         """
         Inicializa o serviço de detecção de duplicatas.
 
@@ -50,9 +112,14 @@ class DuplicateFinderService(IDuplicateFinderService):
             file_system_service: Serviço para operações no sistema de arquivos.
             zip_handler_service: Serviço opcional para manipulação de arquivos ZIP.
                                 Necessário apenas se include_zips=True for usado.
+            max_workers: Número de threads usadas no cálculo de hashes.
+                        Se None, usa o valor "max_workers" da configuração.
         """
         self.file_system_service = file_system_service
         self.zip_handler_service = zip_handler_service
+        if max_workers is None:
+            max_workers = get_config().get("max_workers", 4)
+        self.max_workers = max(1, int(max_workers))
         logger.debug("DuplicateFinderService inicializado")
 
     @measure_time
@@ -77,8 +144,12 @@ class DuplicateFinderService(IDuplicateFinderService):
 
         logger.info(f"Iniciando busca por duplicatas em {len(scan_paths)} caminhos (include_zips={include_zips})")
 
-        # Etapa 1: Coletar informações de todos os arquivos
+        # Etapa 1: Coletar informações de todos os arquivos. Os arquivos de diretórios
+        # são indexados por tamanho à medida que a varredura os produz, guardando
+        # apenas (caminho, ctime, mtime) até se saber se o tamanho se repete
         all_files: List[FileInfo] = []
+        entries_by_size: Dict[int, List[Tuple[str, float, float]]] = defaultdict(list)
+        total_dir_entries = 0
         total_paths = len(scan_paths)
 
         for i, path in enumerate(scan_paths):
@@ -87,9 +158,12 @@ class DuplicateFinderService(IDuplicateFinderService):
                 progress_callback(0.5 * i / total_paths)
 
             if path.is_dir():
-                # Processar diretório
-                files = self._process_directory(path, include_zips)
-                all_files.extend(files)
+                # Processar diretório (arquivos em ZIPs são adicionados a all_files)
+                for file_path, stat_result in self._scan_directory(path, include_zips, all_files):
+                    entries_by_size[stat_result.st_size].append(
+                        (file_path, stat_result.st_ctime, stat_result.st_mtime)
+                    )
+                    total_dir_entries += 1
             elif path.is_file():
                 # Processar arquivo individual
                 if include_zips and path.suffix.lower() == '.zip' and self.zip_handler_service:
@@ -98,103 +172,151 @@ class DuplicateFinderService(IDuplicateFinderService):
                     all_files.extend(zip_files)
                 else:
                     # Processar arquivo normal
-                    size = self.file_system_service.get_file_size(path)
-                    if size and size >= MIN_FILE_SIZE:
+                    # Tamanho e timestamps com um único stat
+                    metadata = self.file_system_service.get_metadata(path)
+                    if metadata and metadata[0] >= MIN_FILE_SIZE:
+                        size, creation_time, modification_time = metadata
                         file_info = FileInfo(
                             path=path,
                             size=size,
                             hash=None,  # Hash será calculado posteriormente se necessário
-                            creation_time=self.file_system_service.get_creation_time(path),
-                            modification_time=self.file_system_service.get_modification_time(path),
+                            creation_time=creation_time,
+                            modification_time=modification_time,
                             in_zip=False
                         )
                         all_files.append(file_info)
 
-        logger.info(f"Coletados {len(all_files)} arquivos para análise")
-
-        # Etapa 2: Agrupar arquivos por tamanho (pré-filtragem)
-        size_groups = self._group_files_by_size(all_files)
-
-        # Etapa 3: Para cada grupo de mesmo tamanho, calcular hashes e agrupar por hash
+        logger.info(f"Coletados {len(all_files) + total_dir_entries} arquivos para análise")
+
+        # Etapa 2: Agrupar arquivos por tamanho (pré-filtragem). Os tamanhos são
+        # contados antes, para que apenas arquivos com tamanho repetido sejam
+        # convertidos em FileInfo, ordenados e agrupados
+        size_counts = Counter(map(_SIZE_KEY, all_files))
+        for size, entries in entries_by_size.items():
+            size_counts[size] += len(entries)
+        candidate_files = [file_info for file_info in all_files if size_counts[file_info.size] > 1]
+        for size, entries in entries_by_size.items():
+            if size_counts[size] > 1:
+                candidate_files.extend(
+                    _local_file_info(file_path, size, ctime, mtime)
+                    for file_path, ctime, mtime in entries
+                )
+        entries_by_size.clear()
+        size_groups = self._group_files_by_size(candidate_files)
+
+        # Etapa 3: Calcular hashes apenas para arquivos em grupos de mesmo tamanho.
+        # A leitura e o hashing liberam o GIL, então as threads sobrepõem o I/O.
+        candidate_groups = [files for files in size_groups.values() if len(files) > 1]
+        hashed = 0
+        total_to_hash = 0
+
+        if candidate_groups:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Pré-filtrar arquivos grandes pelo início do conteúdo, evitando
+                # ler por inteiro arquivos que só coincidem no tamanho
+                candidate_groups = self._refine_groups_by_head_hash(candidate_groups, executor)
+
+                # Grupos com exatamente dois arquivos são comparados diretamente;
+                # os demais têm o hash de cada arquivo calculado
+                pairs = [files for files in candidate_groups
+                         if len(files) == 2 and files[0].size <= PAIR_COMPARE_MAX_SIZE]
+                files_to_hash = [f for files in candidate_groups
+                                 if len(files) != 2 or files[0].size > PAIR_COMPARE_MAX_SIZE
+                                 for f in files if f.hash is None]
+                total_to_hash = len(files_to_hash) + 2 * len(pairs)
+                pair_results = executor.map(self._hash_pair_if_equal, pairs)
+                hash_results = executor.map(self._calculate_file_hash_safe, files_to_hash)
+
+                for file_info, hash_value in zip(files_to_hash, hash_results):
+                    # Arquivos com erro ficam com hash None e são ignorados na etapa seguinte
+                    file_info.hash = hash_value
+                    hashed += 1
+                    if progress_callback:
+                        # Reportar progresso da fase de análise (50% a 100%)
+                        progress_callback(0.5 + 0.5 * hashed / total_to_hash)
+
+                for (first, second), (first_hash, second_hash) in zip(pairs, pair_results):
+                    first.hash = first_hash
+                    second.hash = second_hash
+                    hashed += 2
+                    if progress_callback:
+                        progress_callback(0.5 + 0.5 * hashed / total_to_hash)
+
+        if progress_callback and total_to_hash == 0:
+            progress_callback(1.0)
+
+        # Etapa 4: Agrupar por hash dentro de cada grupo de mesmo tamanho
         duplicate_sets: List[DuplicateSet] = []
-        total_size_groups = len(size_groups)
-        processed_groups = 0
-
-        for size, files in size_groups.items():
-            if len(files) > 1:  # Apenas grupos com mais de um arquivo podem ter duplicatas
-                # Calcular hash para cada arquivo no grupo
-                for file_info in files:
-                    if file_info.hash is None:  # Se o hash ainda não foi calculado
-                        try:
-                            file_info.hash = self._calculate_file_hash(file_info)
-                        except Exception as e:
-                            logger.warning(f"Erro ao calcular hash para {file_info.path}: {str(e)}")
-                            # Manter o hash como None, este arquivo será ignorado na etapa seguinte
-
-                # Agrupar por hash
-                hash_groups = self._group_files_by_hash(files)
-
-                # Criar DuplicateSet para cada grupo com mesmo hash
-                for hash_value, hash_files in hash_groups.items():
-                    if len(hash_files) > 1:  # Apenas grupos com mais de um arquivo são duplicatas
-                        duplicate_set = DuplicateSet(files=hash_files, hash=hash_value)
-                        duplicate_sets.append(duplicate_set)
-
-            processed_groups += 1
-            if progress_callback:
-                # Reportar progresso da fase de análise (50% a 100%)
-                progress_callback(0.5 + 0.5 * processed_groups / total_size_groups)
+
+        for files in candidate_groups:
+            hash_groups = self._group_files_by_hash(files)
+
+            # Criar DuplicateSet para cada grupo com mesmo hash. Os digests são
+            # convertidos para hexadecimal apenas aqui, na saída do serviço
+            for digest, hash_files in hash_groups.items():
+                if len(hash_files) > 1:  # Apenas grupos com mais de um arquivo são duplicatas
+                    hash_hex = digest.hex()
+                    # Arquivos idênticos têm a mesma resolução: compartilhar a já obtida
+                    resolution = next((f.resolution for f in hash_files if f.resolution), None)
+                    for file_info in hash_files:
+                        file_info.hash = hash_hex
+                        if file_info.resolution is None:
+                            file_info.resolution = resolution
+                    # add_files valida o hash e faz todos os arquivos compartilharem
+                    # o hash internado do conjunto
+                    duplicate_set = DuplicateSet()
+                    duplicate_set.add_files(hash_files)
+                    duplicate_sets.append(duplicate_set)
 
         # Ordenar os conjuntos de duplicatas por tamanho (do maior para o menor)
         # Isso é útil para a UI, mostrando primeiro as duplicatas que ocupam mais espaço
-        duplicate_sets.sort(key=lambda ds: ds.size, reverse=True)
+        duplicate_sets.sort(key=_SIZE_KEY, reverse=True)
 
         logger.info(f"Encontrados {len(duplicate_sets)} conjuntos de duplicatas")
         return duplicate_sets
 
-    def _process_directory(self, directory: Path, include_zips: bool) -> List[FileInfo]:
+    def _scan_directory(self, directory: Path, include_zips: bool,
+                        zip_files: List[FileInfo]) -> Iterator[Tuple[str, os.stat_result]]:
         """
-        Processa um diretório, coletando informações sobre seus arquivos.
+        Percorre um diretório produzindo os arquivos locais sem criar FileInfo.
+
+        Os arquivos locais são produzidos como pares (caminho em str, stat) à medida
+        que a varredura avança, de modo que objetos Path e FileInfo só precisem ser
+        criados para os arquivos que de fato compartilham o tamanho com outro arquivo.
+        Erros durante a varredura são registrados e encerram a iteração.
 
         Args:
             directory: Caminho para o diretório a ser processado.
             include_zips: Se True, também processa arquivos ZIP encontrados.
+            zip_files: Lista que recebe os arquivos encontrados dentro de ZIPs.
 
         Returns:
-            List[FileInfo]: Lista de informações sobre os arquivos encontrados.
+            Iterator[Tuple[str, os.stat_result]]: Arquivos locais com tamanho mínimo
+                (caminho e stat).
         """
         logger.debug(f"Processando diretório: {directory}")
-        files: List[FileInfo] = []
+        found = 0
 
         try:
-            # Listar todos os arquivos no diretório (recursivamente)
-            file_paths = list(self.file_system_service.list_directory_contents(directory))
-
-            for file_path in file_paths:
+            # Percorrer o diretório (recursivamente) obtendo o stat de cada
+            # arquivo uma única vez durante a própria enumeração
+            for file_path, stat_result in self.file_system_service.scan_directory_with_stat(directory):
                 # Verificar se é um arquivo ZIP
-                if include_zips and file_path.suffix.lower() == '.zip' and self.zip_handler_service:
+                if include_zips and self.zip_handler_service and os.path.splitext(file_path)[1].lower() == '.zip':
                     # Processar arquivo ZIP
-                    zip_files = self._process_zip(file_path)
-                    files.extend(zip_files)
+                    zip_entries = self._process_zip(Path(file_path))
+                    zip_files.extend(zip_entries)
+                    found += len(zip_entries)
 
                 # Processar arquivo normal
-                size = self.file_system_service.get_file_size(file_path)
-                if size and size >= MIN_FILE_SIZE:
-                    file_info = FileInfo(
-                        path=file_path,
-                        size=size,
-                        hash=None,  # Hash será calculado posteriormente se necessário
-                        creation_time=self.file_system_service.get_creation_time(file_path),
-                        modification_time=self.file_system_service.get_modification_time(file_path),
-                        in_zip=False
-                    )
-                    files.append(file_info)
+                if stat_result.st_size >= MIN_FILE_SIZE:
+                    found += 1
+                    yield file_path, stat_result
 
         except Exception as e:
             logger.error(f"Erro ao processar diretório {directory}: {str(e)}")
 
-        logger.debug(f"Encontrados {len(files)} arquivos no diretório {directory}")
-        return files
+        logger.debug(f"Encontrados {found} arquivos no diretório {directory}")
 
     def _process_zip(self, zip_path: Path) -> List[FileInfo]:
         """
@@ -245,7 +367,7 @@ class DuplicateFinderService(IDuplicateFinderService):
         logger.debug(f"Encontrados {len(files)} arquivos no ZIP {zip_path}")
         return files
 
-    def _calculate_file_hash(self, file_info: FileInfo) -> str:
+    def _calculate_file_hash(self, file_info: FileInfo) -> bytes:
         """
         Calcula o hash BLAKE3 de um arquivo.
 
@@ -253,40 +375,245 @@ class DuplicateFinderService(IDuplicateFinderService):
             file_info: Informações sobre o arquivo.
 
         Returns:
-            str: Hash do arquivo em formato hexadecimal.
+            bytes: Digest BLAKE3 do arquivo (32 bytes). A conversão para
+                   hexadecimal é feita apenas ao montar os DuplicateSet.
 
         Raises:
             FileNotFoundError: Se o arquivo não existir.
             PermissionError: Se não houver permissão para ler o arquivo.
             Exception: Outras exceções relacionadas a IO podem ser levantadas.
         """
-        logger.debug(f"Calculando hash para: {file_info.path}")
+        # Mensagens por arquivo só são formatadas se o nível DEBUG estiver ativo
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Calculando hash para: {file_info.path}")
 
-        # Criar um novo hasher BLAKE3
-        hasher = blake3.blake3()
+        # Criar um novo hasher BLAKE3 (multithread para entradas grandes)
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        # Referência local evita a busca do atributo a cada bloco
+        update = hasher.update
 
+        try:
+            use_mmap = not file_info.in_zip and file_info.size >= MMAP_HASH_THRESHOLD
+            if use_mmap:
+                # Arquivo grande: mapear em memória e processar todo o conteúdo em uma
+                # única chamada, deixando o BLAKE3 paralelizar o hashing
+                try:
+                    hasher.update_mmap(str(file_info.path))
+                except OSError as e:
+                    # Alguns sistemas de arquivos (rede, FUSE) não suportam mmap;
+                    # recomeçar com um hasher novo e ler em blocos
+                    logger.debug(f"mmap indisponível para {file_info.path}, lendo em blocos: {str(e)}")
+                    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                    update = hasher.update
+                    use_mmap = False
+
+            if not use_mmap:
+                # Arquivo normal ou dentro de um ZIP: processar em blocos. O primeiro
+                # bloco também fornece a resolução, se o arquivo for uma imagem.
+                # Os blocos são bytes novos, e não visões de um buffer reaproveitado:
+                # arquivos locais chegam aqui com menos de MMAP_HASH_THRESHOLD (um
+                # único bloco) e _hash_pair_if_equal guarda blocos entre leituras
+                chunks = iter(self._iter_file_content(file_info))
+                first_chunk = next(chunks, b"")
+                update(first_chunk)
+                _store_image_resolution(file_info, first_chunk)
+                for chunk in chunks:
+                    update(chunk)
+
+            # Obter o digest binário (metade do tamanho da representação hexadecimal)
+            digest = hasher.digest()
+            if debug_enabled:
+                logger.debug(f"Hash calculado para {file_info.path}: {digest.hex()}")
+            return digest
+
+        except Exception as e:
+            logger.error(f"Erro ao calcular hash para {file_info.path}: {str(e)}")
+            raise
+
+    def _refine_groups_by_head_hash(self, size_groups: List[List[FileInfo]],
+                                    executor: ThreadPoolExecutor) -> List[List[FileInfo]]:
+        """
+        Subdivide grupos de mesmo tamanho pelo hash dos primeiros bytes dos arquivos.
+
+        Grupos de arquivos com até HEAD_HASH_SIZE bytes são mantidos como estão,
+        pois o hash do início equivaleria ao hash completo.
+
+        Args:
+            size_groups: Grupos de arquivos com o mesmo tamanho (cada um com mais de um arquivo).
+            executor: Executor usado para ler os inícios dos arquivos em paralelo.
+
+        Returns:
+            List[List[FileInfo]]: Grupos que ainda podem conter duplicatas.
+        """
+        refined_groups = [files for files in size_groups if files[0].size <= HEAD_HASH_SIZE]
+        large_files = [f for files in size_groups if files[0].size > HEAD_HASH_SIZE for f in files]
+
+        if large_files:
+            head_groups = self._group_files_by_head_hash(large_files, executor)
+            refined_groups.extend(files for files in head_groups.values() if len(files) > 1)
+
+        return refined_groups
+
+    def _group_files_by_head_hash(self, files: List[FileInfo],
+                                  executor: ThreadPoolExecutor) -> Dict[Tuple[int, bytes], List[FileInfo]]:
+        """
+        Agrupa arquivos por tamanho e hash dos primeiros HEAD_HASH_SIZE bytes.
+
+        Args:
+            files: Lista de informações sobre arquivos.
+            executor: Executor usado para ler os inícios dos arquivos em paralelo.
+
+        Returns:
+            Dict[Tuple[int, bytes], List[FileInfo]]: Dicionário onde a chave é o par
+                                                    (tamanho, hash do início) e o valor é
+                                                    a lista de arquivos correspondentes.
+        """
+        head_groups = defaultdict(list)
+
+        for file_info, head_hash in zip(files, executor.map(self._calculate_head_hash_safe, files)):
+            if head_hash is not None:  # Ignorar arquivos que não puderam ser lidos
+                head_groups[(file_info.size, head_hash)].append(file_info)
+
+        logger.debug(f"Arquivos agrupados em {len(head_groups)} grupos pelo início do conteúdo")
+        return head_groups
+
+    def _calculate_head_hash_safe(self, file_info: FileInfo) -> Optional[bytes]:
+        """
+        Calcula um hash curto dos primeiros HEAD_HASH_SIZE bytes de um arquivo.
+
+        Args:
+            file_info: Informações sobre o arquivo.
+
+        Returns:
+            Optional[bytes]: Digest de 8 bytes do início do arquivo, ou None em caso de erro.
+        """
         try:
             if file_info.in_zip:
-                # Arquivo dentro de um ZIP
-                if not hasattr(file_info, 'content_provider') or file_info.content_provider is None:
+                if file_info.content_provider is None:
                     raise ValueError(f"Arquivo ZIP sem content_provider: {file_info.path}")
-
-                # Usar o content_provider para obter o conteúdo do arquivo
-                for chunk in file_info.content_provider():
-                    hasher.update(chunk)
+                chunks = file_info.content_provider()
             else:
-                # Arquivo normal no sistema de arquivos
-                for chunk in self.file_system_service.stream_file_content(file_info.path, CHUNK_SIZE):
-                    hasher.update(chunk)
+                chunks = self.file_system_service.stream_file_content(file_info.path, HEAD_HASH_SIZE)
+
+            head = b""
+            try:
+                for chunk in chunks:
+                    head += chunk
+                    if len(head) >= HEAD_HASH_SIZE:
+                        break
+            finally:
+                # Fechar o gerador para liberar o arquivo sem ler o restante
+                close = getattr(chunks, 'close', None)
+                if close is not None:
+                    close()
+
+            _store_image_resolution(file_info, head)
+            return blake3.blake3(head[:HEAD_HASH_SIZE]).digest(8)
+        except Exception as e:
+            logger.warning(f"Erro ao ler o início do arquivo {file_info.path}: {str(e)}")
+            return None
 
-            # Obter o hash em formato hexadecimal
-            hash_hex = hasher.hexdigest()
-            logger.debug(f"Hash calculado para {file_info.path}: {hash_hex}")
-            return hash_hex
+    def _iter_file_content(self, file_info: FileInfo) -> Iterable[bytes]:
+        """
+        Retorna um iterador sobre o conteúdo de um arquivo, local ou dentro de um ZIP.
+
+        Args:
+            file_info: Informações sobre o arquivo.
+
+        Returns:
+            Iterable[bytes]: Blocos do conteúdo do arquivo.
 
+        Raises:
+            ValueError: Se o arquivo estiver em um ZIP mas não tiver content_provider.
+        """
+        if file_info.in_zip:
+            # Arquivo dentro de um ZIP
+            if not hasattr(file_info, 'content_provider') or file_info.content_provider is None:
+                raise ValueError(f"Arquivo ZIP sem content_provider: {file_info.path}")
+
+            # Usar o content_provider para obter o conteúdo do arquivo
+            return file_info.content_provider()
+
+        # Arquivo normal no sistema de arquivos
+        return self.file_system_service.stream_file_content(file_info.path, CHUNK_SIZE)
+
+    def _hash_pair_if_equal(self, files: List[FileInfo]) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """
+        Compara dois arquivos de mesmo tamanho byte a byte, calculando um único hash.
+
+        Os dois conteúdos são lidos lado a lado; apenas o primeiro arquivo alimenta
+        o BLAKE3, pois se forem idênticos o hash do segundo é o mesmo. A leitura é
+        interrompida no primeiro bloco diferente.
+
+        Args:
+            files: Lista com exatamente dois arquivos de mesmo tamanho.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[bytes]]: O mesmo digest para os dois arquivos
+                se forem idênticos, ou (None, None) se forem diferentes. Em caso
+                de erro de leitura, cada arquivo tem o hash calculado separadamente.
+        """
+        first, second = files
+        first_chunks = second_chunks = None
+        try:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            update = hasher.update
+            first_chunks = iter(self._iter_file_content(first))
+            second_chunks = iter(self._iter_file_content(second))
+            # Os blocos dos dois arquivos podem ter tamanhos diferentes (ex.: ZIP),
+            # então o conteúdo ainda não comparado do segundo arquivo fica em buffer
+            pending = b""
+            is_first_chunk = True
+            for chunk in first_chunks:
+                update(chunk)
+                if is_first_chunk:
+                    _store_image_resolution(first, chunk)
+                    is_first_chunk = False
+                while len(pending) < len(chunk):
+                    next_chunk = next(second_chunks, None)
+                    if next_chunk is None:
+                        return None, None
+                    pending += next_chunk
+                if pending[:len(chunk)] != chunk:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Conteúdo diferente: {first.path} e {second.path}")
+                    return None, None
+                pending = pending[len(chunk):]
+            if pending or any(second_chunks):
+                return None, None
+
+            digest = hasher.digest()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Arquivos idênticos {first.path} e {second.path}: {digest.hex()}")
+            return digest, digest
         except Exception as e:
-            logger.error(f"Erro ao calcular hash para {file_info.path}: {str(e)}")
-            raise
+            logger.debug(f"Comparação direta falhou para {first.path} e {second.path}: {str(e)}")
+        finally:
+            for chunks in (first_chunks, second_chunks):
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+
+        return self._calculate_file_hash_safe(first), self._calculate_file_hash_safe(second)
+
+    def _calculate_file_hash_safe(self, file_info: FileInfo) -> Optional[bytes]:
+        """
+        Calcula o hash de um arquivo sem propagar exceções.
+
+        Usado pelas threads de hashing: erros são registrados e o arquivo
+        recebe hash None, sendo ignorado no agrupamento.
+
+        Args:
+            file_info: Informações sobre o arquivo.
+
+        Returns:
+            Optional[bytes]: Digest do arquivo, ou None se não for possível calculá-lo.
+        """
+        try:
+            return self._calculate_file_hash(file_info)
+        except Exception as e:
+            logger.warning(f"Erro ao calcular hash para {file_info.path}: {str(e)}")
+            return None
 
     def _group_files_by_size(self, files: List[FileInfo]) -> Dict[int, List[FileInfo]]:
         """
@@ -299,15 +626,16 @@ class DuplicateFinderService(IDuplicateFinderService):
             Dict[int, List[FileInfo]]: Dicionário onde a chave é o tamanho em bytes
                                       e o valor é uma lista de arquivos com esse tamanho.
         """
-        size_groups = defaultdict(list)
-
-        for file_info in files:
-            size_groups[file_info.size].append(file_info)
+        # Ordenar pela chave e agrupar em uma única passada (chave avaliada em C)
+        size_groups = {
+            size: list(group)
+            for size, group in groupby(sorted(files, key=_SIZE_KEY), key=_SIZE_KEY)
+        }
 
         logger.debug(f"Arquivos agrupados em {len(size_groups)} grupos por tamanho")
         return size_groups
 
-    def _group_files_by_hash(self, files: List[FileInfo]) -> Dict[str, List[FileInfo]]:
+    def _group_files_by_hash(self, files: List[FileInfo]) -> Dict[Union[bytes, str], List[FileInfo]]:
         """
         Agrupa arquivos por hash.
 
@@ -315,14 +643,17 @@ class DuplicateFinderService(IDuplicateFinderService):
             files: Lista de informações sobre arquivos.
 
         Returns:
-            Dict[str, List[FileInfo]]: Dicionário onde a chave é o hash
-                                      e o valor é uma lista de arquivos com esse hash.
+            Dict[Union[bytes, str], List[FileInfo]]: Dicionário onde a chave é o hash
+                                      (digest binário durante a busca) e o valor é
+                                      uma lista de arquivos com esse hash.
         """
-        hash_groups = defaultdict(list)
-
-        for file_info in files:
-            if file_info.hash:  # Ignorar arquivos sem hash (erro ao calcular)
-                hash_groups[file_info.hash].append(file_info)
-
-        logger.debug(f"Arquivos agrupados em {len(hash_groups)} grupos por hash")
+        # Ignorar arquivos sem hash (erro ao calcular)
+        hashed_files = sorted((f for f in files if f.hash), key=_HASH_KEY)
+        hash_groups = {
+            hash_value: list(group)
+            for hash_value, group in groupby(hashed_files, key=_HASH_KEY)
+        }
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Arquivos agrupados em {len(hash_groups)} grupos por hash")
         return hash_groups
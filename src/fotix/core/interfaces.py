@@ -70,3 +70,19 @@ class ISelectionStrategy(Protocol):
             é responsabilidade de outro componente.
         """
         ...
+    
+    def select_for_all(self, duplicate_sets: List[DuplicateSet]) -> List[FileInfo]:
+        """
+        Seleciona o arquivo a ser mantido em cada um dos conjuntos de duplicatas.
+        
+        Args:
+            duplicate_sets: Conjuntos de arquivos duplicados.
+        
+        Returns:
+            List[FileInfo]: O arquivo selecionado de cada conjunto, na mesma ordem.
+        
+        Note:
+            Processar vários conjuntos de uma vez permite que as implementações
+            agrupem as leituras de arquivos de todos eles.
+        """
+        ...
@@ -6,13 +6,18 @@ como FileInfo e DuplicateSet, usando dataclasses para garantir tipagem forte
 e validação de dados.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Callable, Iterable
+from typing import List, Optional, Callable, Iterable, Tuple
 
+# Em Python >= 3.10 as dataclasses são geradas com __slots__, eliminando o
+# __dict__ por instância (menos memória e acesso a atributos mais rápido).
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileInfo:
     """
     Representa informações sobre um arquivo no sistema.
@@ -32,6 +37,8 @@ class FileInfo:
         internal_path: Se in_zip=True, este é o caminho do arquivo dentro do ZIP.
         content_provider: Se in_zip=True, esta é uma função que retorna um iterador para o conteúdo do arquivo.
         original_path: Caminho original do arquivo, usado para restauração de backups.
+        resolution: Resolução (largura, altura) da imagem, extraída do cabeçalho durante
+                    o cálculo do hash, ou None se não for imagem ou não estiver disponível.
     """
 
     path: Path
@@ -44,6 +51,12 @@ class FileInfo:
     internal_path: Optional[str] = None
     content_provider: Optional[Callable[[], Iterable[bytes]]] = None
     original_path: Optional[Path] = None
+    resolution: Optional[Tuple[int, int]] = None
+
+    # Nome e extensão do arquivo, calculados no primeiro acesso e reutilizados
+    # (evita que o pathlib reprocesse o caminho a cada comparação)
+    _filename: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _extension: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -51,14 +64,15 @@ class FileInfo:
 
         Converte strings para Path se necessário e garante que os tipos estão corretos.
         """
-        # Converter strings para Path se necessário
-        if isinstance(self.path, str):
+        # Converter strings para Path se necessário. A comparação exata de tipo é
+        # mais barata que isinstance e já descarta None e objetos Path, o caso comum
+        if type(self.path) is str:
             self.path = Path(self.path)
 
-        if self.zip_path is not None and isinstance(self.zip_path, str):
+        if type(self.zip_path) is str:
             self.zip_path = Path(self.zip_path)
 
-        if self.original_path is not None and isinstance(self.original_path, str):
+        if type(self.original_path) is str:
             self.original_path = Path(self.original_path)
 
     @property
@@ -69,7 +83,10 @@ class FileInfo:
         Returns:
             str: Nome do arquivo.
         """
-        return self.path.name
+        filename = self._filename
+        if filename is None:
+            filename = self._filename = self.path.name
+        return filename
 
     @property
     def extension(self) -> str:
@@ -79,7 +96,10 @@ class FileInfo:
         Returns:
             str: Extensão do arquivo (com o ponto), ou string vazia se não tiver extensão.
         """
-        return self.path.suffix
+        extension = self._extension
+        if extension is None:
+            extension = self._extension = self.path.suffix
+        return extension
 
     @property
     def creation_datetime(self) -> Optional[datetime]:
@@ -106,7 +126,7 @@ class FileInfo:
         return None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DuplicateSet:
     """
     Representa um conjunto de arquivos duplicados.
@@ -159,8 +179,41 @@ class DuplicateSet:
             ValueError: Se o arquivo tiver um hash diferente dos outros no conjunto.
         """
         if self.hash is None:
-            self.hash = file.hash
+            # Internar o hash para que todos os conjuntos e arquivos com o mesmo
+            # conteúdo compartilhem um único objeto str
+            self.hash = sys.intern(file.hash) if isinstance(file.hash, str) else file.hash
         elif file.hash != self.hash:
             raise ValueError(f"Arquivo com hash diferente: {file.hash} != {self.hash}")
 
+        # Substituir a cópia do arquivo pelo objeto compartilhado do conjunto
+        file.hash = self.hash
         self.files.append(file)
+
+    def add_files(self, files: Iterable[FileInfo]) -> None:
+        """
+        Adiciona vários arquivos ao conjunto de duplicatas.
+
+        Equivale a chamar add_file para cada arquivo, mas a definição do hash do
+        conjunto é resolvida uma única vez; os demais arquivos apenas têm o hash
+        validado antes de serem adicionados.
+
+        Args:
+            files: Arquivos a serem adicionados.
+
+        Raises:
+            ValueError: Se algum arquivo tiver um hash diferente dos outros no conjunto.
+        """
+        files = iter(files)
+        if self.hash is None:
+            first_file = next(files, None)
+            if first_file is None:
+                return
+            self.add_file(first_file)
+
+        set_hash = self.hash
+        append = self.files.append
+        for file in files:
+            if file.hash != set_hash:
+                raise ValueError(f"Arquivo com hash diferente: {file.hash} != {set_hash}")
+            file.hash = set_hash
+            append(file)
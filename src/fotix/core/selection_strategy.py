@@ -6,15 +6,19 @@ estratégias para selecionar automaticamente qual arquivo manter de um conjunto
 de duplicatas, com base em critérios como data, resolução ou nome.
 """
 
+import logging
+import math
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Type, Callable
+from typing import List, Optional, Dict, Any, Set, Type, Callable, Tuple
 
 from fotix.core.interfaces import ISelectionStrategy
 from fotix.core.models import DuplicateSet, FileInfo
 from fotix.infrastructure.interfaces import IFileSystemService
 from fotix.infrastructure.logging_config import get_logger
-from fotix.utils.helpers import measure_time
 from fotix.utils.image_utils import (
     get_image_resolution,
     get_image_resolution_from_bytes,
@@ -25,13 +29,63 @@ from fotix.utils.image_utils import (
 # Obter logger para este módulo
 logger = get_logger(__name__)
 
+# Número de threads usadas na leitura antecipada das resoluções das imagens
+SELECTION_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
 
-class BaseSelectionStrategy(ISelectionStrategy, ABC):
+# Funções de chave usadas nas comparações entre arquivos (executadas em C)
+_CREATION_TIME_KEY = attrgetter('creation_time')
+_MODIFICATION_TIME_KEY = attrgetter('modification_time')
+_QUALITY_KEY = itemgetter(1)
+
+
+def _filename_length(file_info: FileInfo) -> int:
+    """
+    Retorna o comprimento do nome do arquivo, usado como chave de comparação.
+
+    Args:
+        file_info: Informações sobre o arquivo.
+
+    Returns:
+        int: Número de caracteres do nome do arquivo.
+    """
+    return len(file_info.filename)
+
+
+def _tied_best_files(files: List[FileInfo], key: Callable[[FileInfo], Optional[float]],
+                     maximize: bool) -> List[FileInfo]:
+    """
+    Retorna, em uma única passada, todos os arquivos empatados no melhor valor da chave.
+
+    Args:
+        files: Arquivos a serem comparados.
+        key: Função que extrai o valor comparado; arquivos com valor None são ignorados.
+        maximize: Se True, o melhor valor é o maior; caso contrário, o menor.
+
+    Returns:
+        List[FileInfo]: Arquivos empatados no melhor valor, na ordem original,
+        ou todos os arquivos se nenhum tiver valor definido.
+    """
+    best_files: List[FileInfo] = []
+    best_value = -math.inf if maximize else math.inf
+    for file_info in files:
+        value = key(file_info)
+        if value is None:
+            continue
+        if value == best_value:
+            best_files.append(file_info)
+        elif (value > best_value) if maximize else (value < best_value):
+            best_value = value
+            best_files = [file_info]
+    return best_files or list(files)
+
+
+class BaseSelectionStrategy(ABC):
     """
     Classe base abstrata para estratégias de seleção de arquivos duplicados.
 
     Implementa a interface ISelectionStrategy e define métodos comuns
-    para todas as estratégias concretas.
+    para todas as estratégias concretas. A interface é satisfeita por
+    tipagem estrutural, sem herdar do Protocol.
     """
 
     def __init__(self, file_system_service: Optional[IFileSystemService] = None):
@@ -44,8 +98,9 @@ class BaseSelectionStrategy(ISelectionStrategy, ABC):
                                 acessar o conteúdo dos arquivos.
         """
         self.file_system_service = file_system_service
+        # Imagens cuja resolução não pôde ser lida durante o lote atual (ver _prefetch)
+        self._unreadable_images: Set[Path] = set()
 
-    @measure_time
     def select_file_to_keep(self, duplicate_set: DuplicateSet) -> FileInfo:
         """
         Recebe um conjunto de arquivos duplicados e retorna o arquivo que deve ser mantido.
@@ -73,6 +128,70 @@ class BaseSelectionStrategy(ISelectionStrategy, ABC):
 
         return selected_file
 
+    def select_for_all(self, duplicate_sets: List[DuplicateSet]) -> List[FileInfo]:
+        """
+        Seleciona o arquivo a ser mantido em cada um dos conjuntos de duplicatas.
+
+        Antes da seleção, os dados que exigem leitura de arquivos são obtidos de
+        uma só vez para todos os conjuntos (ver _prefetch).
+
+        Args:
+            duplicate_sets: Conjuntos de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: O arquivo selecionado de cada conjunto, na mesma ordem.
+
+        Raises:
+            ValueError: Se algum dos conjuntos estiver vazio.
+        """
+        try:
+            self._prefetch(duplicate_sets)
+            return [self.select_file_to_keep(duplicate_set) for duplicate_set in duplicate_sets]
+        finally:
+            self._unreadable_images.clear()
+
+    def _reads_image_resolution(self) -> bool:
+        """
+        Indica se a estratégia lê do disco a resolução das imagens.
+
+        Returns:
+            bool: True se a seleção depender da resolução das imagens locais.
+        """
+        return False
+
+    def _prefetch(self, duplicate_sets: List[DuplicateSet]) -> None:
+        """
+        Lê em paralelo a resolução das imagens locais que ainda não a possuem.
+
+        Chamado uma única vez por select_for_all, com todos os conjuntos do lote,
+        de modo que um só pool de threads atende todas as leituras. Só tem efeito
+        em estratégias que usam a resolução (ver _reads_image_resolution). Os
+        resultados ficam registrados em FileInfo.resolution; as imagens cuja
+        leitura falhou são registradas para não serem lidas novamente.
+
+        Args:
+            duplicate_sets: Conjuntos de arquivos duplicados que serão processados.
+        """
+        if not self._reads_image_resolution():
+            return
+
+        pending = [
+            file_info
+            for duplicate_set in duplicate_sets if len(duplicate_set.files) > 1
+            for file_info in duplicate_set.files
+            if file_info.resolution is None and not file_info.in_zip and is_image_file(file_info.path)
+        ]
+        # Uma única leitura não se beneficia do pool de threads
+        if len(pending) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(SELECTION_MAX_WORKERS, len(pending))) as executor:
+            resolutions = executor.map(get_image_resolution, [f.path for f in pending])
+            for file_info, resolution in zip(pending, resolutions):
+                if resolution is None:
+                    self._unreadable_images.add(file_info.path)
+                file_info.resolution = resolution
+
     @abstractmethod
     def _select_file(self, duplicate_set: DuplicateSet) -> FileInfo:
         """
@@ -86,6 +205,22 @@ class BaseSelectionStrategy(ISelectionStrategy, ABC):
         """
         pass
 
+    def _rank(self, duplicate_set: DuplicateSet) -> List[FileInfo]:
+        """
+        Retorna todos os arquivos empatados no melhor valor do critério da estratégia.
+
+        Usado pela CompositeStrategy para que as estratégias seguintes desempatem
+        apenas entre os candidatos restantes. A implementação padrão considera
+        vencedor apenas o arquivo retornado por _select_file.
+
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: Arquivos empatados no melhor valor, na ordem original.
+        """
+        return [self._select_file(duplicate_set)]
+
     @property
     def name(self) -> str:
         """
@@ -115,19 +250,38 @@ class CreationDateStrategy(BaseSelectionStrategy):
         Returns:
             FileInfo: O arquivo mais antigo do conjunto.
         """
-        # Filtrar arquivos que têm data de criação definida
-        files_with_creation_time = [f for f in duplicate_set.files if f.creation_time is not None]
-
-        if not files_with_creation_time:
+        # Encontrar o mais antigo em uma única passada, ignorando arquivos sem
+        # data de criação definida (em empate, prevalece o primeiro encontrado)
+        oldest_file = None
+        oldest_time = math.inf
+        for file_info in duplicate_set.files:
+            creation_time = file_info.creation_time
+            if creation_time is not None and creation_time < oldest_time:
+                oldest_time = creation_time
+                oldest_file = file_info
+
+        if oldest_file is None:
             logger.warning("Nenhum arquivo com data de criação definida, usando o primeiro arquivo")
             return duplicate_set.files[0]
 
-        # Ordenar por data de criação (mais antigo primeiro)
-        oldest_file = min(files_with_creation_time, key=lambda f: f.creation_time)
-        logger.debug(f"Arquivo mais antigo: {oldest_file.path} ({oldest_file.creation_datetime})")
+        # A conversão para datetime só é feita se a mensagem for de fato registrada
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Arquivo mais antigo: {oldest_file.path} ({oldest_file.creation_datetime})")
 
         return oldest_file
 
+    def _rank(self, duplicate_set: DuplicateSet) -> List[FileInfo]:
+        """
+        Retorna todos os arquivos empatados com a data de criação mais antiga.
+
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: Arquivos mais antigos, ou todos se nenhum tiver data de criação.
+        """
+        return _tied_best_files(duplicate_set.files, _CREATION_TIME_KEY, maximize=False)
+
 
 class ModificationDateStrategy(BaseSelectionStrategy):
     """
@@ -146,19 +300,37 @@ class ModificationDateStrategy(BaseSelectionStrategy):
         Returns:
             FileInfo: O arquivo mais recente do conjunto.
         """
-        # Filtrar arquivos que têm data de modificação definida
-        files_with_modification_time = [f for f in duplicate_set.files if f.modification_time is not None]
-
-        if not files_with_modification_time:
+        # Encontrar o mais recente em uma única passada, ignorando arquivos sem
+        # data de modificação definida (em empate, prevalece o primeiro encontrado)
+        newest_file = None
+        newest_time = -math.inf
+        for file_info in duplicate_set.files:
+            modification_time = file_info.modification_time
+            if modification_time is not None and modification_time > newest_time:
+                newest_time = modification_time
+                newest_file = file_info
+
+        if newest_file is None:
             logger.warning("Nenhum arquivo com data de modificação definida, usando o primeiro arquivo")
             return duplicate_set.files[0]
 
-        # Ordenar por data de modificação (mais recente primeiro)
-        newest_file = max(files_with_modification_time, key=lambda f: f.modification_time)
-        logger.debug(f"Arquivo mais recente: {newest_file.path} ({newest_file.modification_datetime})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Arquivo mais recente: {newest_file.path} ({newest_file.modification_datetime})")
 
         return newest_file
 
+    def _rank(self, duplicate_set: DuplicateSet) -> List[FileInfo]:
+        """
+        Retorna todos os arquivos empatados com a data de modificação mais recente.
+
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: Arquivos mais recentes, ou todos se nenhum tiver data de modificação.
+        """
+        return _tied_best_files(duplicate_set.files, _MODIFICATION_TIME_KEY, maximize=True)
+
 
 class HighestResolutionStrategy(BaseSelectionStrategy):
     """
@@ -204,22 +376,7 @@ class HighestResolutionStrategy(BaseSelectionStrategy):
             return duplicate_set.files[0]
 
         # Calcular a resolução para cada imagem
-        image_qualities = []
-
-        for file_info in image_files:
-            resolution = None
-
-            if file_info.in_zip and file_info.content_provider:
-                # Imagem dentro de um ZIP
-                resolution = get_image_resolution_from_bytes(file_info.content_provider)
-            elif self.file_system_service and not file_info.in_zip:
-                # Imagem normal no sistema de arquivos
-                resolution = get_image_resolution(file_info.path)
-
-            if resolution:
-                quality = calculate_image_quality(resolution)
-                image_qualities.append((file_info, quality))
-                logger.debug(f"Qualidade da imagem {file_info.path}: {quality} ({resolution})")
+        image_qualities = self._get_image_qualities(image_files)
 
         if not image_qualities:
             logger.warning("Não foi possível determinar a resolução de nenhuma imagem")
@@ -229,11 +386,73 @@ class HighestResolutionStrategy(BaseSelectionStrategy):
             return image_files[0]
 
         # Selecionar a imagem com a maior qualidade
-        best_image = max(image_qualities, key=lambda x: x[1])[0]
+        best_image = max(image_qualities, key=_QUALITY_KEY)[0]
         logger.debug(f"Imagem com maior resolução: {best_image.path}")
 
         return best_image
 
+    def _rank(self, duplicate_set: DuplicateSet) -> List[FileInfo]:
+        """
+        Retorna todas as imagens empatadas com a maior resolução.
+
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: Imagens com a maior resolução, ou todos os arquivos se
+            nenhuma resolução puder ser determinada.
+        """
+        image_files = [f for f in duplicate_set.files if is_image_file(f.path)]
+        image_qualities = self._get_image_qualities(image_files)
+
+        if not image_qualities:
+            return list(duplicate_set.files)
+
+        best_quality = max(quality for _, quality in image_qualities)
+        return [file_info for file_info, quality in image_qualities if quality == best_quality]
+
+    def _reads_image_resolution(self) -> bool:
+        """
+        Indica se a estratégia lê do disco a resolução das imagens.
+
+        Returns:
+            bool: True se houver um serviço de sistema de arquivos configurado.
+        """
+        return self.file_system_service is not None
+
+    def _get_image_qualities(self, image_files: List[FileInfo]) -> List[Tuple[FileInfo, int]]:
+        """
+        Calcula a qualidade (largura * altura) de cada imagem cuja resolução é conhecida.
+
+        Args:
+            image_files: Arquivos de imagem.
+
+        Returns:
+            List[Tuple[FileInfo, int]]: Pares (arquivo, qualidade), na ordem original,
+            omitindo as imagens cuja resolução não pôde ser determinada.
+        """
+        image_qualities = []
+
+        for file_info in image_files:
+            # Resolução já extraída do cabeçalho durante o cálculo do hash
+            resolution = file_info.resolution
+
+            if resolution is None:
+                if file_info.in_zip and file_info.content_provider:
+                    # Imagem dentro de um ZIP
+                    resolution = get_image_resolution_from_bytes(file_info.content_provider)
+                elif (self.file_system_service and not file_info.in_zip
+                      and file_info.path not in self._unreadable_images):
+                    # Imagem normal no sistema de arquivos, ainda não lida sem sucesso
+                    resolution = get_image_resolution(file_info.path)
+
+            if resolution:
+                quality = calculate_image_quality(resolution)
+                image_qualities.append((file_info, quality))
+                logger.debug(f"Qualidade da imagem {file_info.path}: {quality} ({resolution})")
+
+        return image_qualities
+
 
 class ShortestNameStrategy(BaseSelectionStrategy):
     """
@@ -254,20 +473,31 @@ class ShortestNameStrategy(BaseSelectionStrategy):
             FileInfo: O arquivo com o nome mais curto.
         """
         # Ordenar por comprimento do nome do arquivo (mais curto primeiro)
-        shortest_name_file = min(duplicate_set.files, key=lambda f: len(f.filename))
+        shortest_name_file = min(duplicate_set.files, key=_filename_length)
         logger.debug(f"Arquivo com nome mais curto: {shortest_name_file.path}")
 
         return shortest_name_file
 
+    def _rank(self, duplicate_set: DuplicateSet) -> List[FileInfo]:
+        """
+        Retorna todos os arquivos empatados com o nome mais curto.
+
+        Args:
+            duplicate_set: Conjunto de arquivos duplicados.
+
+        Returns:
+            List[FileInfo]: Arquivos com o nome mais curto.
+        """
+        return _tied_best_files(duplicate_set.files, _filename_length, maximize=False)
+
 
 class CompositeStrategy(BaseSelectionStrategy):
     """
     Estratégia que combina várias estratégias em ordem de prioridade.
 
     Esta estratégia tenta aplicar cada estratégia na ordem especificada,
-    até que uma delas retorne um resultado único. Se várias estratégias
-    retornarem o mesmo resultado, a próxima estratégia é aplicada aos
-    arquivos restantes.
+    até que reste um único arquivo. Se uma estratégia deixar vários arquivos
+    empatados em seu critério, a próxima estratégia é aplicada apenas a eles.
     """
 
     def __init__(self, strategies: List[BaseSelectionStrategy]):
@@ -284,6 +514,10 @@ class CompositeStrategy(BaseSelectionStrategy):
         if not strategies:
             raise ValueError("A lista de estratégias não pode estar vazia")
         self.strategies = strategies
+        # A leitura antecipada é feita pela estratégia composta; as falhas
+        # registradas por ela devem ser vistas pelas estratégias internas
+        for strategy in strategies:
+            strategy._unreadable_images = self._unreadable_images
 
     def _select_file(self, duplicate_set: DuplicateSet) -> FileInfo:
         """
@@ -295,7 +529,7 @@ class CompositeStrategy(BaseSelectionStrategy):
         Returns:
             FileInfo: O arquivo selecionado após aplicar todas as estratégias.
         """
-        remaining_files = duplicate_set.files.copy()
+        remaining_files = duplicate_set.files
 
         for strategy in self.strategies:
             if len(remaining_files) == 1:
@@ -304,17 +538,66 @@ class CompositeStrategy(BaseSelectionStrategy):
             # Criar um conjunto temporário com os arquivos restantes
             temp_set = DuplicateSet(files=remaining_files, hash=duplicate_set.hash)
 
-            # Aplicar a estratégia atual
-            selected = strategy._select_file(temp_set)
-            logger.debug(f"Estratégia {strategy.name} selecionou: {selected.path}")
-
-            # Se ainda houver mais de um arquivo, continuar com a próxima estratégia
-            if len(remaining_files) > 1:
-                remaining_files = [selected]
+            # Manter apenas os arquivos empatados no critério da estratégia atual;
+            # a próxima estratégia desempata entre eles
+            remaining_files = strategy._rank(temp_set)
+            logger.debug(f"Estratégia {strategy.name} manteve {len(remaining_files)} arquivo(s)")
 
-        # Retornar o único arquivo restante após aplicar todas as estratégias
+        # Se ainda houver empate após todas as estratégias, manter o primeiro
         return remaining_files[0]
 
+    def _reads_image_resolution(self) -> bool:
+        """
+        Indica se alguma das estratégias combinadas lê a resolução das imagens.
+
+        Returns:
+            bool: True se alguma estratégia depender da resolução das imagens locais.
+        """
+        return any(strategy._reads_image_resolution() for strategy in self.strategies)
+
+
+def _create_highest_resolution_strategy(
+        file_system_service: Optional[IFileSystemService]) -> ISelectionStrategy:
+    """
+    Cria a estratégia de maior resolução com fallback para arquivos que não são imagens.
+
+    Args:
+        file_system_service: Serviço para acessar o sistema de arquivos.
+
+    Returns:
+        ISelectionStrategy: Estratégia por resolução, usando a data de modificação como fallback.
+    """
+    fallback = ModificationDateStrategy(file_system_service)
+    return HighestResolutionStrategy(file_system_service, fallback)
+
+
+def _create_composite_strategy(
+        file_system_service: Optional[IFileSystemService]) -> ISelectionStrategy:
+    """
+    Cria a estratégia composta padrão: resolução > data de modificação > nome mais curto.
+
+    Args:
+        file_system_service: Serviço para acessar o sistema de arquivos.
+
+    Returns:
+        ISelectionStrategy: Estratégia composta padrão.
+    """
+    return CompositeStrategy([
+        HighestResolutionStrategy(file_system_service),
+        ModificationDateStrategy(file_system_service),
+        ShortestNameStrategy(file_system_service)
+    ])
+
+
+# Fábricas de estratégias indexadas pelo tipo aceito em create_strategy
+_STRATEGY_FACTORIES: Dict[str, Callable[[Optional[IFileSystemService]], ISelectionStrategy]] = {
+    'creation_date': CreationDateStrategy,
+    'modification_date': ModificationDateStrategy,
+    'highest_resolution': _create_highest_resolution_strategy,
+    'shortest_name': ShortestNameStrategy,
+    'composite': _create_composite_strategy,
+}
+
 
 def create_strategy(strategy_type: str, file_system_service: Optional[IFileSystemService] = None) -> ISelectionStrategy:
     """
@@ -333,23 +616,7 @@ def create_strategy(strategy_type: str, file_system_service: Optional[IFileSyste
     Raises:
         ValueError: Se o tipo de estratégia for desconhecido.
     """
-    if strategy_type == 'creation_date':
-        return CreationDateStrategy(file_system_service)
-    elif strategy_type == 'modification_date':
-        return ModificationDateStrategy(file_system_service)
-    elif strategy_type == 'highest_resolution':
-        # Usar ModificationDateStrategy como fallback para arquivos que não são imagens
-        fallback = ModificationDateStrategy(file_system_service)
-        return HighestResolutionStrategy(file_system_service, fallback)
-    elif strategy_type == 'shortest_name':
-        return ShortestNameStrategy(file_system_service)
-    elif strategy_type == 'composite':
-        # Estratégia composta padrão: resolução > data de modificação > nome mais curto
-        strategies = [
-            HighestResolutionStrategy(file_system_service),
-            ModificationDateStrategy(file_system_service),
-            ShortestNameStrategy(file_system_service)
-        ]
-        return CompositeStrategy(strategies)
-    else:
+    factory = _STRATEGY_FACTORIES.get(strategy_type)
+    if factory is None:
         raise ValueError(f"Tipo de estratégia desconhecido: {strategy_type}")
+    return factory(file_system_service)
@@ -6,20 +6,220 @@ para criar, listar, restaurar e excluir backups de arquivos.
 """
 
 import json
+import logging
 import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple, Any
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Any, TypeVar
 
-from fotix.config import get_backup_dir
+try:
+    import orjson
+except ImportError:  # orjson é opcional; usa-se o json da biblioteca padrão
+    orjson = None
+
+from fotix.config import get_backup_dir, get_config
 from fotix.core.models import FileInfo
+from fotix.infrastructure.file_system import _is_same_file, fast_copy
 from fotix.infrastructure.logging_config import get_logger
 
 # Obter logger para este módulo
 logger = get_logger(__name__)
 
+# Tipo genérico para resultados das tarefas de cópia
+T = TypeVar('T')
+
+# Número padrão de cópias simultâneas durante a criação de um backup (mesmo
+# limite do perfil "disk_io" do ConcurrencyService)
+DEFAULT_MAX_PARALLEL_COPIES = min(8, (os.cpu_count() or 4) * 2)
+
+# Tamanho do buffer de escrita do arquivo de metadados
+METADATA_WRITE_BUFFER_SIZE = 1 << 20
+
+# Subdiretório de files_dir com o repositório de conteúdo compartilhado entre
+# backups (arquivos endereçados pelo hash, ligados por hardlink aos backups)
+POOL_DIR_NAME = "_pool"
+
+# Sufixo dos arquivos de resumo (id, data, contagem e tamanho) de cada backup
+SUMMARY_SUFFIX = ".summary.json"
+
+
+def _dumps_metadata(metadata: Any, pretty: bool = False) -> bytes:
+    """
+    Serializa metadados de backup em JSON, usando orjson quando disponível.
+
+    Args:
+        metadata: Valor a ser serializado (dicionário de metadados ou parte dele).
+        pretty: Se True, gera JSON indentado (para leitura humana); caso
+                contrário, JSON compacto, sem espaços.
+
+    Returns:
+        bytes: Conteúdo JSON codificado em UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(metadata, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads_metadata(data: bytes) -> Dict[str, Any]:
+    """
+    Desserializa os metadados de um backup, usando orjson quando disponível.
+
+    Args:
+        data: Conteúdo do arquivo de metadados.
+
+    Returns:
+        Dict[str, Any]: Dicionário com os metadados do backup.
+
+    Raises:
+        ValueError: Se o conteúdo não for um JSON válido.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_metadata_stream(f: BinaryIO, header: Dict[str, Any],
+                           entries: Iterable[Dict[str, Any]],
+                           pretty: bool = False) -> Tuple[int, int]:
+    """
+    Grava os metadados de um backup de forma incremental.
+    
+    Cada entrada de arquivo é serializada e escrita separadamente, sem montar a
+    lista completa nem o documento inteiro em memória. O resultado é um objeto
+    JSON com os campos de header, "files", "file_count" e "total_size".
+    
+    Args:
+        f: Arquivo binário aberto para escrita.
+        header: Campos gravados antes da lista de arquivos (id, date).
+        entries: Entradas de arquivo, na ordem em que devem ser gravadas.
+        pretty: Se True, indenta o documento, com uma entrada de arquivo por
+                linha; caso contrário, grava JSON compacto.
+        
+    Returns:
+        Tuple[int, int]: Número de arquivos e tamanho total gravados.
+    """
+    newline, indent, entry_indent, colon = (
+        (b'\n', b'  ', b'    ', b': ') if pretty else (b'', b'', b'', b':'))
+    
+    f.write(b'{' + newline)
+    for key, value in header.items():
+        f.write(indent + _dumps_metadata(key) + colon + _dumps_metadata(value) + b',' + newline)
+    f.write(indent + b'"files"' + colon + b'[')
+    
+    file_count = 0
+    total_size = 0
+    for entry in entries:
+        f.write((b',' if file_count else b'') + newline + entry_indent)
+        f.write(_dumps_metadata(entry))
+        file_count += 1
+        total_size += entry["size"]
+    
+    f.write((newline + indent if file_count else b'') + b'],' + newline)
+    f.write(indent + b'"file_count"' + colon + str(file_count).encode('ascii') + b',' + newline)
+    f.write(indent + b'"total_size"' + colon + str(total_size).encode('ascii') + newline + b'}')
+    return file_count, total_size
+
+
+def _try_link(source: Path, destination: Path) -> bool:
+    """
+    Tenta criar um hardlink de source em destination.
+
+    Args:
+        source: Arquivo existente.
+        destination: Caminho do novo link.
+
+    Returns:
+        bool: True se o link foi criado; False se source não existir ou se o
+              sistema de arquivos não permitir o link (p.ex. EXDEV).
+    """
+    try:
+        os.link(source, destination)
+        return True
+    except OSError:
+        return False
+
+
+def _is_unshared(path: Path) -> bool:
+    """
+    Verifica se um arquivo do backup não é compartilhado por hardlinks.
+
+    Args:
+        path: Arquivo do backup.
+
+    Returns:
+        bool: True se o arquivo tiver um único link.
+    """
+    try:
+        return os.stat(path).st_nlink == 1
+    except OSError:
+        return False
+
+
+def _stored_size(path: Path) -> Optional[int]:
+    """
+    Retorna o tamanho de um arquivo já gravado no backup.
+
+    Args:
+        path: Caminho do arquivo no backup.
+
+    Returns:
+        Optional[int]: Tamanho em bytes, ou None se não puder ser obtido.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _matches_scan(path: Path, file_info: FileInfo) -> bool:
+    """
+    Verifica se um arquivo copiado corresponde ao arquivo visto na varredura.
+
+    Só um arquivo com o mesmo tamanho e a mesma data de modificação da
+    varredura tem o conteúdo descrito pelo hash do FileInfo e pode ser
+    registrado no repositório sob esse hash.
+
+    Args:
+        path: Arquivo já copiado para o backup (com a data de modificação da origem).
+        file_info: Informações da varredura.
+
+    Returns:
+        bool: True se tamanho e data de modificação coincidirem.
+    """
+    if file_info.modification_time is None:
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_size == file_info.size and st.st_mtime == file_info.modification_time
+
+
+def _summarize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extrai dos metadados de um backup apenas os campos usados na listagem.
+    
+    Args:
+        metadata: Metadados completos do backup.
+        
+    Returns:
+        Dict[str, Any]: Dicionário com id, date, file_count e total_size.
+    """
+    return {
+        "id": metadata.get("id"),
+        "date": metadata.get("date"),
+        "file_count": metadata.get("file_count", 0),
+        "total_size": metadata.get("total_size", 0)
+    }
+
+
+
 
 class BackupService:
     """
@@ -30,18 +230,47 @@ class BackupService:
     sistema de armazenamento baseado em arquivos, com metadados em JSON.
     """
     
-    def __init__(self, file_system_service=None):
+    def __init__(self, file_system_service=None, concurrency_service=None,
+                 max_parallel_copies: Optional[int] = None,
+                 restore_with_hardlinks: Optional[bool] = None):
         """
         Inicializa o serviço de backup.
         
         Args:
             file_system_service: Instância de IFileSystemService para operações de arquivo.
                                 Se None, as operações serão realizadas diretamente.
+            concurrency_service: Instância opcional de IConcurrencyService (baseada em
+                                threads) usada para executar as cópias em paralelo.
+                                Se None, um pool de threads próprio é criado a cada backup.
+            max_parallel_copies: Número máximo de cópias simultâneas quando não há
+                                concurrency_service. Se None, usa o valor
+                                "backup.max_parallel_copies" da configuração.
+            restore_with_hardlinks: Se True, restaurações para um target_directory no
+                                mesmo sistema de arquivos do backup criam hardlinks em vez
+                                de copiar. Os arquivos restaurados compartilham o inode com
+                                o backup: alterá-los no próprio arquivo (sem regravá-lo)
+                                altera também o backup. Se None, usa o valor
+                                "backup.restore_with_hardlinks" da configuração (padrão False).
         """
         self.file_system_service = file_system_service
+        self.concurrency_service = concurrency_service
+        if max_parallel_copies is None:
+            max_parallel_copies = get_config().get("backup", {}).get(
+                "max_parallel_copies", DEFAULT_MAX_PARALLEL_COPIES)
+        self.max_parallel_copies = max(1, int(max_parallel_copies))
+        self._copy_executor: Optional[ThreadPoolExecutor] = None
+        # Metadados indentados apenas para inspeção manual (padrão: JSON compacto)
+        self.pretty_metadata = bool(get_config().get("backup", {}).get("pretty_metadata", False))
+        if restore_with_hardlinks is None:
+            restore_with_hardlinks = get_config().get("backup", {}).get(
+                "restore_with_hardlinks", False)
+        self.restore_with_hardlinks = bool(restore_with_hardlinks)
         self.backup_dir = get_backup_dir()
         self.metadata_dir = self.backup_dir / "metadata"
         self.files_dir = self.backup_dir / "files"
+        self.pool_dir = self.files_dir / POOL_DIR_NAME
+        # Cache de resumos de metadados: nome do arquivo -> (st_mtime_ns, resumo)
+        self._meta_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         
         # Garantir que os diretórios existam
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
@@ -73,85 +302,323 @@ class BackupService:
         backup_files_dir = self.files_dir / backup_id
         backup_files_dir.mkdir(parents=True, exist_ok=True)
         
-        # Metadados do backup
+        # Metadados do backup (as entradas de arquivo são gravadas em fluxo)
         metadata = {
             "id": backup_id,
-            "date": backup_date,
-            "files": []
+            "date": backup_date
         }
         
-        file_count = 0
-        total_size = 0
-        
         logger.info(f"Iniciando backup {backup_id}")
         
-        # Copiar cada arquivo para o diretório de backup
-        for file_path, file_info in files_to_backup:
+        # Agrupar os arquivos pelo nome que terão no backup (usando o hash se
+        # disponível): duplicatas com o mesmo hash são copiadas uma única vez e
+        # nunca por duas threads ao mesmo tempo
+        groups: Dict[str, List[Tuple[int, Path, FileInfo]]] = {}
+        entry_count = 0
+        for index, (file_path, file_info) in enumerate(files_to_backup):
+            if file_info.hash:
+                backup_filename = f"{file_info.hash}{file_path.suffix}"
+            else:
+                # Se não tiver hash, usar um UUID
+                backup_filename = f"{uuid.uuid4()}{file_path.suffix}"
+            groups.setdefault(backup_filename, []).append((index, file_path, file_info))
+            entry_count = index + 1
+        
+        # Copiar os arquivos para o diretório de backup, em paralelo
+        tasks = [
+            partial(self._backup_group, group, backup_files_dir, backup_filename)
+            for backup_filename, group in groups.items()
+        ]
+        file_entries: List[Optional[Dict[str, Any]]] = [None] * entry_count
+        try:
+            group_results = self._run_copy_tasks(tasks)
+        except Exception:
+            self._discard_backup_files(backup_files_dir)
+            raise
+        for group_entries in group_results:
+            for index, file_metadata in group_entries:
+                file_entries[index] = file_metadata
+        
+        # Salvar metadados, gravando as entradas de arquivo uma a uma na ordem
+        # em que os arquivos foram fornecidos
+        metadata_path = self.metadata_dir / f"{backup_id}.json"
+        try:
+            with open(metadata_path, 'wb', buffering=METADATA_WRITE_BUFFER_SIZE) as f:
+                file_count, total_size = _write_metadata_stream(
+                    f, metadata, (entry for entry in file_entries if entry is not None),
+                    pretty=self.pretty_metadata)
+            
+        except Exception as e:
+            logger.error(f"Erro ao salvar metadados do backup {backup_id}: {str(e)}")
+            # Tentar limpar o arquivo parcial e o diretório de backup em caso de erro
             try:
-                # Verificar se o arquivo existe
-                if not file_path.exists():
-                    logger.warning(f"Arquivo não encontrado, pulando: {file_path}")
-                    continue
-                
-                # Criar nome de arquivo único no backup (usando hash se disponível)
-                if file_info.hash:
-                    backup_filename = f"{file_info.hash}{file_path.suffix}"
-                else:
-                    # Se não tiver hash, usar um UUID
-                    backup_filename = f"{uuid.uuid4()}{file_path.suffix}"
-                
-                backup_file_path = backup_files_dir / backup_filename
-                
-                # Copiar o arquivo
-                if self.file_system_service:
-                    self.file_system_service.copy_file(file_path, backup_file_path)
-                else:
-                    shutil.copy2(file_path, backup_file_path)
+                metadata_path.unlink()
+            except Exception:
+                pass
+            self._discard_backup_files(backup_files_dir)
+            raise IOError(f"Erro ao salvar metadados do backup: {str(e)}")
+        
+        # Salvar o resumo usado por list_backups (se falhar, será regenerado na listagem)
+        self._write_summary(backup_id, {
+            "id": backup_id,
+            "date": backup_date,
+            "file_count": file_count,
+            "total_size": total_size
+        })
+        
+        logger.info(f"Backup {backup_id} concluído com sucesso. {file_count} arquivos, {total_size} bytes.")
+        return backup_id
+    
+    def _discard_backup_files(self, backup_files_dir: Path) -> None:
+        """
+        Remove os arquivos de um backup que falhou e os conteúdos que ele
+        acabou de registrar no repositório.
+        
+        Falhas são ignoradas, pois o erro original é o que deve ser propagado.
+        
+        Args:
+            backup_files_dir: Diretório de arquivos do backup.
+        """
+        try:
+            backup_filenames = os.listdir(backup_files_dir)
+            shutil.rmtree(backup_files_dir)
+        except Exception:
+            return
+        self._prune_pool(backup_filenames)
+    
+    def _write_summary(self, backup_id: str, summary: Dict[str, Any]) -> None:
+        """
+        Grava o arquivo de resumo de um backup.
+        
+        Falhas são apenas registradas, pois o resumo pode ser regenerado a
+        partir dos metadados completos.
+        
+        Args:
+            backup_id: ID do backup.
+            summary: Resumo retornado por _summarize_metadata.
+        """
+        summary_path = self.metadata_dir / f"{backup_id}{SUMMARY_SUFFIX}"
+        try:
+            summary_path.write_bytes(_dumps_metadata(summary, pretty=self.pretty_metadata))
+        except Exception as e:
+            logger.warning(f"Erro ao salvar resumo do backup {backup_id}: {str(e)}")
+    
+    def _backup_group(self, group: List[Tuple[int, Path, FileInfo]], backup_files_dir: Path,
+                      backup_filename: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Copia para o backup um grupo de arquivos que compartilham o mesmo nome no backup.
+
+        Como o nome deriva do hash, os arquivos do grupo têm o mesmo conteúdo: apenas
+        o primeiro arquivo existente é copiado e todos são registrados nos metadados,
+        com o tamanho efetivamente gravado no backup (e não o tamanho da varredura,
+        que pode estar desatualizado).
+
+        Args:
+            group: Tuplas (posição na entrada, caminho do arquivo, FileInfo).
+            backup_files_dir: Diretório de arquivos deste backup.
+            backup_filename: Nome do arquivo no backup.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: Pares (posição na entrada, metadados do
+            arquivo) para os arquivos incluídos no backup. Arquivos inexistentes
+            são ignorados.
+
+        Raises:
+            PermissionError: Se não houver permissão para ler os arquivos ou escrever no destino.
+            IOError: Para outros erros relacionados a IO.
+        """
+        backup_file_path = backup_files_dir / backup_filename
+        copied = False
+        stored_size = None
+        entries = []
+        
+        for index, file_path, file_info in group:
+            try:
+                # Copiar o arquivo (apenas uma vez por conteúdo), reaproveitando
+                # o conteúdo já guardado por backups anteriores quando possível.
+                # Uma origem inexistente é detectada pela própria cópia.
+                if not copied:
+                    pool_path = self._pool_path(backup_filename) if file_info.hash else None
+                    if pool_path is None or not (self._pool_matches(pool_path, file_path)
+                                                 and _try_link(pool_path, backup_file_path)):
+                        if self.file_system_service:
+                            self.file_system_service.copy_file(file_path, backup_file_path)
+                        else:
+                            fast_copy(file_path, backup_file_path)
+                        if pool_path is not None and _matches_scan(backup_file_path, file_info):
+                            self._add_to_pool(backup_file_path, pool_path)
+                    copied = True
+                    stored_size = _stored_size(backup_file_path)
+                elif not file_path.exists():
+                    # Demais arquivos do grupo não são copiados: verificar se existem
+                    raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
                 
                 # Adicionar metadados do arquivo
                 file_metadata = {
                     "original_path": str(file_path),
                     "backup_filename": backup_filename,
-                    "size": file_info.size,
+                    "size": file_info.size if stored_size is None else stored_size,
                     "hash": file_info.hash,
                     "creation_time": file_info.creation_time,
                     "modification_time": file_info.modification_time
                 }
+                entries.append((index, file_metadata))
                 
-                metadata["files"].append(file_metadata)
-                file_count += 1
-                total_size += file_info.size
-                
-                logger.debug(f"Arquivo copiado para backup: {file_path} -> {backup_file_path}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Arquivo copiado para backup: {file_path} -> {backup_file_path}")
                 
-            except (FileNotFoundError, PermissionError) as e:
+            except FileNotFoundError:
+                logger.warning(f"Arquivo não encontrado, pulando: {file_path}")
+            except PermissionError as e:
                 logger.error(f"Erro ao fazer backup do arquivo {file_path}: {str(e)}")
                 raise
             except Exception as e:
                 logger.error(f"Erro inesperado ao fazer backup do arquivo {file_path}: {str(e)}")
                 raise IOError(f"Erro ao fazer backup: {str(e)}")
         
-        # Adicionar estatísticas ao metadata
-        metadata["file_count"] = file_count
-        metadata["total_size"] = total_size
+        return entries
+    
+    def _pool_path(self, backup_filename: str) -> Path:
+        """
+        Retorna o caminho de um conteúdo no repositório compartilhado.
         
-        # Salvar metadados
-        metadata_path = self.metadata_dir / f"{backup_id}.json"
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+        Args:
+            backup_filename: Nome do arquivo no backup (hash + extensão).
             
-            logger.info(f"Backup {backup_id} concluído com sucesso. {file_count} arquivos, {total_size} bytes.")
-            return backup_id
+        Returns:
+            Path: Caminho do arquivo no repositório, agrupado pelos dois
+                  primeiros caracteres do nome.
+        """
+        return self.pool_dir / backup_filename[:2] / backup_filename
+    
+    def _pool_matches(self, pool_path: Path, file_path: Path) -> bool:
+        """
+        Verifica se o conteúdo do repositório ainda corresponde ao arquivo de origem.
+        
+        O repositório é indexado pelo hash calculado na varredura; se o arquivo
+        mudou desde então, o conteúdo guardado estaria desatualizado. Como as
+        cópias preservam a data de modificação, tamanho e st_mtime_ns iguais
+        indicam que a origem não foi alterada.
+        
+        Args:
+            pool_path: Caminho do conteúdo no repositório.
+            file_path: Arquivo de origem.
             
-        except Exception as e:
-            logger.error(f"Erro ao salvar metadados do backup {backup_id}: {str(e)}")
-            # Tentar limpar o diretório de backup em caso de erro
+        Returns:
+            bool: True se o conteúdo do repositório pode ser reaproveitado.
+            
+        Raises:
+            FileNotFoundError: Se o arquivo de origem não existir (e houver
+                conteúdo no repositório).
+        """
+        try:
+            pool_stat = os.stat(pool_path)
+        except OSError:
+            return False
+        source_stat = os.stat(file_path)
+        return (pool_stat.st_size == source_stat.st_size
+                and pool_stat.st_mtime_ns == source_stat.st_mtime_ns)
+    
+    def _add_to_pool(self, backup_file_path: Path, pool_path: Path) -> None:
+        """
+        Registra no repositório compartilhado um arquivo recém-copiado para o backup.
+        
+        O registro é um hardlink e não ocupa espaço adicional. Falhas (sistema de
+        arquivos sem suporte a hardlinks, entrada criada por outro backup etc.)
+        são ignoradas, pois o repositório é apenas uma otimização.
+        
+        Args:
+            backup_file_path: Arquivo já copiado para o backup.
+            pool_path: Caminho do conteúdo no repositório.
+        """
+        try:
+            pool_path.parent.mkdir(parents=True, exist_ok=True)
+            os.link(backup_file_path, pool_path)
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Conteúdo não registrado no repositório {pool_path}: {str(e)}")
+    
+    def _prune_pool(self, backup_filenames: Iterable[str]) -> None:
+        """
+        Remove do repositório os conteúdos que não são mais usados por nenhum backup.
+        
+        Args:
+            backup_filenames: Nomes dos arquivos do backup removido.
+        """
+        for backup_filename in backup_filenames:
+            pool_path = self._pool_path(backup_filename)
             try:
-                shutil.rmtree(backup_files_dir)
-            except Exception:
+                if pool_path.stat().st_nlink <= 1:
+                    pool_path.unlink()
+            except OSError:
                 pass
-            raise IOError(f"Erro ao salvar metadados do backup: {str(e)}")
+    
+    def _run_copy_tasks(self, tasks: List[Callable[[], T]]) -> List[T]:
+        """
+        Executa as tarefas de cópia em paralelo, retornando os resultados na ordem das tarefas.
+
+        A primeira exceção (na ordem das tarefas) é propagada, e as tarefas que
+        ainda não começaram são canceladas.
+
+        Args:
+            tasks: Funções sem argumentos que realizam as cópias.
+
+        Returns:
+            List[T]: Resultados das tarefas, na mesma ordem.
+        """
+        # Uma única tarefa é executada diretamente, sem passar por um executor
+        if len(tasks) <= 1:
+            return [task() for task in tasks]
+        if self.concurrency_service is not None:
+            submit = self.concurrency_service.submit_background_task
+        elif self.max_parallel_copies > 1:
+            submit = self._get_copy_executor().submit
+        else:
+            return [task() for task in tasks]
+        
+        futures = [submit(task) for task in tasks]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            # Aguardar as cópias em andamento, para que a limpeza feita pelo
+            # chamador não concorra com elas
+            wait(futures)
+            raise
+    
+    def _get_copy_executor(self) -> ThreadPoolExecutor:
+        """
+        Obtém ou cria o pool de threads próprio usado nas cópias.
+        
+        O pool é mantido entre as operações, evitando recriar as threads a
+        cada backup, e só é encerrado por shutdown().
+        
+        Returns:
+            ThreadPoolExecutor: O pool de threads de cópia.
+        """
+        if self._copy_executor is None:
+            logger.debug(f"Criando pool de cópias com {self.max_parallel_copies} threads")
+            self._copy_executor = ThreadPoolExecutor(max_workers=self.max_parallel_copies)
+        return self._copy_executor
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Encerra o pool de threads próprio de cópias, se existir.
+        
+        Args:
+            wait: Se True, aguarda a conclusão das cópias pendentes.
+        """
+        if self._copy_executor is not None:
+            self._copy_executor.shutdown(wait=wait)
+            self._copy_executor = None
+    
+    def __del__(self):
+        """
+        Destrutor que garante o encerramento do pool de cópias quando o objeto é coletado.
+        """
+        if getattr(self, '_copy_executor', None) is not None:
+            self.shutdown(wait=False)
     
     def list_backups(self) -> List[Dict[str, Any]]:
         """
@@ -164,24 +631,45 @@ class BackupService:
         backups = []
         
         try:
-            # Listar todos os arquivos de metadados
-            for metadata_file in self.metadata_dir.glob("*.json"):
+            # Listar os arquivos de metadados com os.scandir, que já informa o
+            # tipo de cada entrada sem criar Paths nem fazer stat adicional
+            with os.scandir(self.metadata_dir) as it:
+                json_entries = {
+                    entry.name: entry for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                }
+            
+            # A listagem lê apenas os resumos, recorrendo aos metadados completos
+            # se o resumo faltar
+            for name, entry in json_entries.items():
+                if name.endswith(SUMMARY_SUFFIX):
+                    continue
                 try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
+                    backup_id = name[:-len(".json")]
+                    summary_name = f"{backup_id}{SUMMARY_SUFFIX}"
+                    source_entry = json_entries.get(summary_name, entry)
                     
-                    # Extrair informações relevantes
-                    backup_info = {
-                        "id": metadata.get("id"),
-                        "date": metadata.get("date"),
-                        "file_count": metadata.get("file_count", 0),
-                        "total_size": metadata.get("total_size", 0)
-                    }
+                    mtime_ns = source_entry.stat().st_mtime_ns
+                    cached = self._meta_cache.get(source_entry.name)
+                    if cached is not None and cached[0] == mtime_ns:
+                        # Arquivo inalterado desde a última leitura: reutilizar o resumo
+                        backup_info = cached[1]
+                    else:
+                        backup_info = _summarize_metadata(
+                            _loads_metadata(Path(source_entry.path).read_bytes()))
+                        self._meta_cache[source_entry.name] = (mtime_ns, backup_info)
+                        if source_entry is entry:
+                            # Backup sem resumo (p.ex. criado por versão anterior)
+                            self._write_summary(backup_id, backup_info)
                     
-                    backups.append(backup_info)
+                    backups.append(dict(backup_info))
                     
                 except Exception as e:
-                    logger.warning(f"Erro ao ler metadados do backup {metadata_file}: {str(e)}")
+                    logger.warning(f"Erro ao ler metadados do backup {entry.path}: {str(e)}")
+            
+            # Descartar entradas de arquivos que não existem mais
+            for stale_name in self._meta_cache.keys() - json_entries.keys():
+                del self._meta_cache[stale_name]
             
             # Ordenar por data (mais recente primeiro)
             backups.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -216,8 +704,7 @@ class BackupService:
         
         # Carregar metadados
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = _loads_metadata(metadata_path.read_bytes())
         except Exception as e:
             logger.error(f"Erro ao ler metadados do backup {backup_id}: {str(e)}")
             raise IOError(f"Erro ao ler metadados do backup: {str(e)}")
@@ -229,7 +716,17 @@ class BackupService:
         
         logger.info(f"Iniciando restauração do backup {backup_id}")
         
-        # Restaurar cada arquivo
+        # Hardlinks só são possíveis no mesmo sistema de arquivos do backup
+        link_files = False
+        if self.restore_with_hardlinks and target_directory:
+            try:
+                link_files = os.stat(target_directory).st_dev == os.stat(backup_files_dir).st_dev
+            except OSError:
+                link_files = False
+        
+        # Agrupar os arquivos pelo destino: restaurações para o mesmo destino
+        # (possíveis com target_directory) são feitas em ordem, na mesma tarefa
+        groups: Dict[Path, List[Path]] = {}
         for file_metadata in metadata.get("files", []):
             try:
                 original_path = Path(file_metadata.get("original_path", ""))
@@ -239,8 +736,6 @@ class BackupService:
                     logger.warning("Metadados de arquivo incompletos, pulando")
                     continue
                 
-                backup_file_path = backup_files_dir / backup_filename
-                
                 # Determinar o destino da restauração
                 if target_directory:
                     # Restaurar apenas com o nome do arquivo (sem estrutura de diretórios)
@@ -249,16 +744,74 @@ class BackupService:
                     # Restaurar no local original
                     dest_path = original_path
                 
-                # Garantir que o diretório de destino exista
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                groups.setdefault(dest_path, []).append(backup_files_dir / backup_filename)
                 
-                # Copiar o arquivo
-                if self.file_system_service:
-                    self.file_system_service.copy_file(backup_file_path, dest_path)
-                else:
-                    shutil.copy2(backup_file_path, dest_path)
+            except Exception as e:
+                logger.error(f"Erro inesperado ao restaurar arquivo: {str(e)}")
+                raise IOError(f"Erro ao restaurar backup: {str(e)}")
+        
+        # Criar cada diretório de destino uma única vez, dos mais rasos aos mais profundos
+        for parent_dir in sorted({dest_path.parent for dest_path in groups},
+                                 key=lambda path: len(path.parts)):
+            try:
+                parent_dir.mkdir(parents=True, exist_ok=True)
+            except PermissionError as e:
+                logger.error(f"Erro ao restaurar arquivo: {str(e)}")
+                raise
+            except Exception as e:
+                logger.error(f"Erro inesperado ao restaurar arquivo: {str(e)}")
+                raise IOError(f"Erro ao restaurar backup: {str(e)}")
+        
+        # Restaurar os arquivos em paralelo
+        tasks = [
+            partial(self._restore_group, dest_path, backup_file_paths, link_files)
+            for dest_path, backup_file_paths in groups.items()
+        ]
+        self._run_copy_tasks(tasks)
+        
+        logger.info(f"Restauração do backup {backup_id} concluída com sucesso.")
+    
+    def _restore_group(self, dest_path: Path, backup_file_paths: List[Path],
+                       link_files: bool) -> None:
+        """
+        Restaura, em ordem, os arquivos do backup que têm o mesmo destino.
+        
+        O diretório de destino já deve existir.
+        
+        Args:
+            dest_path: Caminho de destino da restauração.
+            backup_file_paths: Arquivos do backup a restaurar nesse destino.
+            link_files: Se True, tenta criar hardlinks antes de copiar.
+            
+        Raises:
+            FileExistsError: Se o destino já existir e não puder ser sobrescrito.
+            FileNotFoundError: Se um arquivo do backup não existir.
+            PermissionError: Se não houver permissão para escrever no destino.
+            IOError: Para outros erros relacionados a IO.
+        """
+        for backup_file_path in backup_file_paths:
+            try:
+                # Destino já é um hardlink deste arquivo do backup (restauração
+                # repetida): o conteúdo já está lá, e copiar sobre o mesmo inode
+                # truncaria o próprio backup
+                if _is_same_file(backup_file_path, dest_path):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Arquivo já restaurado: {dest_path}")
+                    continue
                 
-                logger.debug(f"Arquivo restaurado: {backup_file_path} -> {dest_path}")
+                # Criar um hardlink ou, se não for possível, copiar o arquivo.
+                # Conteúdos compartilhados (repositório ou outros backups) nunca
+                # são ligados: editar o arquivo restaurado alteraria todos eles.
+                # A cópia ainda usa reflink quando o sistema de arquivos permite
+                if not (link_files and _is_unshared(backup_file_path)
+                        and _try_link(backup_file_path, dest_path)):
+                    if self.file_system_service:
+                        self.file_system_service.copy_file(backup_file_path, dest_path)
+                    else:
+                        fast_copy(backup_file_path, dest_path)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Arquivo restaurado: {backup_file_path} -> {dest_path}")
                 
             except FileExistsError as e:
                 logger.error(f"Arquivo já existe: {dest_path}")
@@ -269,8 +822,6 @@ class BackupService:
             except Exception as e:
                 logger.error(f"Erro inesperado ao restaurar arquivo: {str(e)}")
                 raise IOError(f"Erro ao restaurar backup: {str(e)}")
-        
-        logger.info(f"Restauração do backup {backup_id} concluída com sucesso.")
     
     def delete_backup(self, backup_id: str) -> None:
         """
@@ -297,14 +848,21 @@ class BackupService:
         # Remover diretório de arquivos
         try:
             if backup_files_dir.exists():
+                backup_filenames = os.listdir(backup_files_dir)
                 shutil.rmtree(backup_files_dir)
+                self._prune_pool(backup_filenames)
                 logger.debug(f"Diretório de arquivos removido: {backup_files_dir}")
         except Exception as e:
             logger.error(f"Erro ao remover diretório de arquivos do backup {backup_id}: {str(e)}")
             raise IOError(f"Erro ao remover arquivos do backup: {str(e)}")
         
-        # Remover arquivo de metadados
+        # Remover arquivos de resumo e de metadados
+        summary_path = self.metadata_dir / f"{backup_id}{SUMMARY_SUFFIX}"
+        self._meta_cache.pop(metadata_path.name, None)
+        self._meta_cache.pop(summary_path.name, None)
         try:
+            if summary_path.exists():
+                summary_path.unlink()
             metadata_path.unlink()
             logger.debug(f"Arquivo de metadados removido: {metadata_path}")
         except Exception as e:
@@ -21,6 +21,12 @@ R = TypeVar('R')
 # Logger para este módulo
 logger = get_logger(__name__)
 
+# Perfis de carga aceitos para o dimensionamento automático do pool
+WORKLOAD_CPU = "cpu"
+WORKLOAD_DISK_IO = "disk_io"
+WORKLOAD_NETWORK_IO = "network_io"
+WORKLOAD_TYPES = (WORKLOAD_CPU, WORKLOAD_DISK_IO, WORKLOAD_NETWORK_IO)
+
 
 class ConcurrencyService:
     """
@@ -31,7 +37,8 @@ class ConcurrencyService:
     com base nas configurações e recursos do sistema.
     """
 
-    def __init__(self, max_workers: Optional[int] = None, use_processes: bool = False):
+    def __init__(self, max_workers: Optional[int] = None, use_processes: bool = False,
+                 workload_type: str = WORKLOAD_NETWORK_IO):
         """
         Inicializa o serviço de concorrência.
 
@@ -40,7 +47,18 @@ class ConcurrencyService:
                         Se None, será determinado automaticamente com base no sistema.
             use_processes: Se True, usa ProcessPoolExecutor em vez de ThreadPoolExecutor.
                           Recomendado para tarefas CPU-bound. Default é False.
+            workload_type: Perfil das tarefas, usado quando max_workers é determinado
+                          automaticamente com threads: "cpu" (uma thread por CPU),
+                          "disk_io" (cópias de arquivos, até 8 threads) ou
+                          "network_io" (esperas longas, até 32 threads). Default é
+                          "network_io".
+
+        Raises:
+            ValueError: Se workload_type não for um dos perfis aceitos.
         """
+        if workload_type not in WORKLOAD_TYPES:
+            raise ValueError(f"Tipo de carga desconhecido: {workload_type}")
+
         self._use_processes = use_processes
 
         # Se max_workers não for especificado, determina automaticamente
@@ -53,20 +71,24 @@ class ConcurrencyService:
                 max_workers = config_max_workers
             else:
                 # Se não estiver na configuração, usa um valor baseado no sistema
-                if use_processes:
-                    # Para processos, usa o número de CPUs
-                    max_workers = os.cpu_count() or 4
+                cpu_count = os.cpu_count() or 4
+                if use_processes or workload_type == WORKLOAD_CPU:
+                    # Para processos ou tarefas CPU-bound, usa o número de CPUs
+                    max_workers = cpu_count
+                elif workload_type == WORKLOAD_DISK_IO:
+                    # Cópias saturam a fila do disco com poucas threads; mais
+                    # threads só aumentam a contenção
+                    max_workers = min(8, cpu_count * 2)
                 else:
                     # Para threads, usa um múltiplo do número de CPUs
                     # (threads são boas para tarefas IO-bound)
-                    cpu_count = os.cpu_count() or 4
                     max_workers = min(32, cpu_count * 4)  # Limita a 32 threads
 
         self._max_workers = max_workers
         self._executor = None
 
         logger.debug(f"ConcurrencyService inicializado com max_workers={max_workers}, "
-                    f"use_processes={use_processes}")
+                    f"use_processes={use_processes}, workload_type={workload_type}")
 
     def _get_executor(self):
         """
@@ -99,20 +121,36 @@ class ConcurrencyService:
         Note:
             Esta implementação gerencia internamente o pool de workers e o número
             máximo de threads/processos concorrentes, com base nas configurações
-            e recursos do sistema.
+            e recursos do sistema. Com use_processes=True, as tasks são enviadas
+            aos processos por pickle e devem ser funções de nível de módulo (ou
+            functools.partial delas), não lambdas nem funções aninhadas.
         """
-        executor = self._get_executor()
         task_list = list(tasks)  # Converte para lista para garantir a ordem
 
+        # Sem ganho em paralelizar: executar diretamente, sem passar pelo executor
+        if not task_list:
+            return []
+        if len(task_list) == 1:
+            try:
+                return [task_list[0]()]
+            except Exception as e:
+                logger.error(f"Erro durante execução paralela: {str(e)}")
+                raise
+
+        executor = self._get_executor()
         logger.debug(f"Executando {len(task_list)} tarefas em paralelo")
 
+        # Submete cada tarefa diretamente e coleta os resultados na ordem
+        futures = [executor.submit(task) for task in task_list]
         try:
-            # Submete todas as tarefas e coleta os resultados na ordem
-            results = list(executor.map(lambda f: f(), task_list))
+            results = [future.result() for future in futures]
             logger.debug(f"Execução paralela concluída com {len(results)} resultados")
             return results
         except Exception as e:
             logger.error(f"Erro durante execução paralela: {str(e)}")
+            # Não iniciar as tarefas que ainda estão na fila
+            for future in futures:
+                future.cancel()
             raise
 
     def submit_background_task(self, task: Callable[..., R], *args, **kwargs) -> Future[R]:
@@ -155,4 +193,6 @@ class ConcurrencyService:
         """
         Destrutor que garante o encerramento do executor quando o objeto é coletado.
         """
-        self.shutdown(wait=False)
+        # O objeto pode não ter sido inicializado por completo (ex.: ValueError no __init__)
+        if getattr(self, '_executor', None) is not None:
+            self.shutdown(wait=False)
@@ -6,19 +6,454 @@ para operações no sistema de arquivos como leitura, escrita, movimentação
 para lixeira e listagem de diretórios.
 """
 
+import errno
+import logging
 import os
+import queue
 import shutil
-from datetime import datetime
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional, List, Union
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple, Union
 
 import send2trash
 
+try:
+    import fcntl
+except ImportError:  # fcntl não existe no Windows
+    fcntl = None
+
 from fotix.infrastructure.logging_config import get_logger
 
 # Obter logger para este módulo
 logger = get_logger(__name__)
 
+# Tamanho padrão dos blocos lidos por stream_file_content (múltiplo do tamanho de página)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# A partir deste tamanho de bloco, a leitura dispensa o buffer do Python: cada
+# read() já vai direto ao kernel e o buffer só acrescentaria uma cópia
+UNBUFFERED_MIN_CHUNK_SIZE = 64 * 1024
+
+# Número máximo de diretórios já lidos aguardando consumo na pré-leitura
+# da listagem recursiva
+PREFETCH_QUEUE_SIZE = 4
+
+# Marca de fim da pré-leitura de diretórios
+_PREFETCH_DONE = object()
+
+# Número máximo de threads de move_many_to_trash fora do Windows
+MAX_PARALLEL_TRASH_WORKERS = 4
+
+# Dicas de acesso ao kernel (disponíveis apenas em sistemas POSIX)
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Abertura sem atualizar o atime do inode (apenas Linux)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# os.copy_file_range só existe no Linux (kernel 4.5+, Python 3.8+)
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+
+# Erros de copy_file_range que indicam apenas falta de suporte (sistema de
+# arquivos, kernel ou par de dispositivos) e justificam a cópia convencional
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP), errno.EBADF, errno.ETXTBSY,
+})
+
+# ioctl FICLONE do Linux (clonagem por reflink em btrfs, XFS etc.); exposto
+# pelo módulo fcntl apenas a partir do Python 3.12
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# Erros de FICLONE que indicam apenas falta de suporte à clonagem
+_REFLINK_UNSUPPORTED = _COPY_FILE_RANGE_UNSUPPORTED | {errno.ENOTTY}
+
+
+def _fadvise(file, advice_name: str) -> None:
+    """
+    Envia uma dica de padrão de acesso ao kernel para o arquivo aberto.
+
+    Falhas são ignoradas, pois a dica é apenas uma otimização.
+
+    Args:
+        file: Objeto de arquivo aberto.
+        advice_name: Nome da constante em os (ex.: 'POSIX_FADV_SEQUENTIAL').
+    """
+    if not _HAS_FADVISE:
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, getattr(os, advice_name))
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+def _open_for_reading(path: Path, buffering: int):
+    """
+    Abre um arquivo para leitura binária sem atualizar seu horário de acesso.
+
+    No Linux, usa O_NOATIME para evitar a escrita de metadados (atime) no inode
+    a cada arquivo lido. O kernel só aceita a flag para o dono do arquivo; em
+    caso de PermissionError, ou em outros sistemas, o arquivo é aberto
+    normalmente.
+
+    Args:
+        path: Caminho do arquivo.
+        buffering: Valor de buffering repassado a open().
+
+    Returns:
+        Arquivo aberto em modo 'rb'.
+    """
+    if _O_NOATIME:
+        try:
+            fd = os.open(path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            pass
+        else:
+            try:
+                return open(fd, 'rb', buffering=buffering)
+            except BaseException:
+                os.close(fd)
+                raise
+    return open(path, 'rb', buffering=buffering)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """
+    Tenta clonar um arquivo com o ioctl FICLONE (reflink).
+
+    Em sistemas de arquivos com copy-on-write (btrfs, XFS) o destino passa a
+    compartilhar os blocos da origem, sem copiar dados.
+
+    Args:
+        src_fd: Descritor do arquivo de origem, aberto para leitura.
+        dst_fd: Descritor do arquivo de destino, aberto para escrita.
+
+    Returns:
+        bool: True se o arquivo foi clonado, False se a clonagem não é suportada.
+
+    Raises:
+        OSError: Para erros de IO que não indicam falta de suporte.
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _REFLINK_UNSUPPORTED:
+            return False
+        raise
+
+
+def _copy_file_range(source: Path, destination: Path) -> bool:
+    """
+    Copia o conteúdo de um arquivo com os.copy_file_range.
+
+    Tenta primeiro clonar o arquivo por reflink. Caso contrário, a cópia é feita
+    pelo kernel, sem passar os dados pelo espaço do usuário; em sistemas de
+    arquivos com copy-on-write (btrfs, XFS) ou NFS/CIFS ela pode nem mover os
+    dados, apenas referenciá-los.
+
+    Args:
+        source: Caminho do arquivo de origem.
+        destination: Caminho do arquivo de destino.
+
+    Returns:
+        bool: True se o conteúdo foi copiado, False se copy_file_range não é
+        suportado para estes arquivos.
+
+    Raises:
+        OSError: Para erros de IO que não indicam falta de suporte.
+    """
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        if _reflink(src_fd, dst_fd):
+            return True
+        remaining = os.fstat(src_fd).st_size
+        copied = 0
+        try:
+            while remaining > 0:
+                count = os.copy_file_range(src_fd, dst_fd, remaining)
+                if count == 0:
+                    # Nenhum byte copiado no início indica falta de suporte
+                    # (ex.: /proc); depois disso, o arquivo foi truncado
+                    if copied == 0:
+                        return False
+                    break
+                copied += count
+                remaining -= count
+        except OSError as e:
+            if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                return False
+            raise
+    return True
+
+
+def _is_same_file(source: Path, destination: Path) -> bool:
+    """
+    Verifica se dois caminhos apontam para o mesmo arquivo (mesmo inode).
+
+    Cobre tanto o mesmo caminho quanto hardlinks, como a verificação feita por
+    shutil.copyfile.
+
+    Args:
+        source: Caminho do arquivo de origem.
+        destination: Caminho do arquivo de destino.
+
+    Returns:
+        bool: True se os dois caminhos existirem e forem o mesmo arquivo.
+    """
+    try:
+        source_stat = os.stat(source)
+        destination_stat = os.stat(destination)
+    except OSError:
+        return False
+    return (source_stat.st_dev, source_stat.st_ino) == (destination_stat.st_dev, destination_stat.st_ino)
+
+
+def fast_copy(source: Path, destination: Path) -> None:
+    """
+    Copia um arquivo preservando seus metadados, como shutil.copy2.
+
+    Usa reflink (FICLONE) ou os.copy_file_range quando disponíveis. Caso
+    contrário, ou se não forem suportados para os arquivos envolvidos, recorre a
+    shutil.copy2, que já usa os.sendfile no Linux e as APIs nativas de cópia no
+    macOS e no Windows.
+
+    Args:
+        source: Caminho do arquivo de origem.
+        destination: Caminho do arquivo de destino.
+
+    Raises:
+        shutil.SameFileError: Se origem e destino forem o mesmo arquivo
+            (mesmo caminho ou hardlink).
+        FileNotFoundError: Se o arquivo de origem não existir.
+        PermissionError: Se não houver permissão para ler a origem ou escrever no destino.
+        OSError: Para outros erros relacionados a IO.
+    """
+    # Abrir o destino com 'wb' truncaria a própria origem
+    if _is_same_file(source, destination):
+        raise shutil.SameFileError(f"{source} e {destination} são o mesmo arquivo")
+
+    if _HAS_COPY_FILE_RANGE and _copy_file_range(source, destination):
+        shutil.copystat(source, destination)
+        return
+
+    shutil.copy2(source, destination)
+
+
+def _to_extension_suffixes(file_extensions: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Converte uma lista de extensões em uma tupla de sufixos para str.endswith,
+    com as variantes em minúsculas e maiúsculas de cada extensão.
+
+    str.endswith com uma tupla roda inteiramente em C e não cria strings
+    intermediárias; incluir as duas variantes permite que os casos mais comuns
+    ('.jpg' e '.JPG') sejam aceitos sem converter o nome de cada arquivo para
+    minúsculas. A conversão só é necessária quando a consulta direta falha.
+
+    Args:
+        file_extensions: Extensões de arquivo (ex.: ['.jpg', '.PNG']) ou None.
+
+    Returns:
+        Optional[Tuple[str, ...]]: Sufixos aceitos, ou None se nenhuma
+            extensão for informada (sem filtro).
+    """
+    if not file_extensions:
+        return None
+    lowered = [ext.lower() for ext in file_extensions]
+    return tuple(dict.fromkeys(lowered + [ext.upper() for ext in lowered]))
+
+
+def _scan_one_directory(directory: str, recursive: bool,
+                        extension_suffixes: Optional[Tuple[str, ...]]
+                        ) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    Lê um único diretório com os.scandir.
+
+    O tipo de cada entrada vem da própria enumeração do diretório (sem stat
+    adicional na maioria dos sistemas). Como em Path.rglob, links simbólicos
+    para arquivos são listados (com o tipo do destino), mas links simbólicos
+    para diretórios não são percorridos, evitando ciclos.
+
+    Args:
+        directory: Diretório a ser lido.
+        recursive: Se True, também retorna os subdiretórios encontrados.
+        extension_suffixes: Tupla retornada por _to_extension_suffixes, ou None.
+
+    Returns:
+        Tuple[List[os.DirEntry], List[str]]: Entradas dos arquivos que passam no
+            filtro e caminhos dos subdiretórios (vazio se recursive for False).
+
+    Raises:
+        FileNotFoundError: Se o diretório não existir.
+        NotADirectoryError: Se o caminho não apontar para um diretório.
+        PermissionError: Se não houver permissão para acessar o diretório.
+    """
+    files = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError as e:
+                logger.warning(f"Erro ao acessar {entry.path}: {str(e)}")
+                continue
+            if extension_suffixes is not None:
+                name = entry.name
+                if not name.endswith(extension_suffixes) and \
+                        not name.lower().endswith(extension_suffixes):
+                    continue
+            files.append(entry)
+    return files, subdirs
+
+
+def _handle_directory_error(directory: str, error: OSError, is_root: bool) -> None:
+    """
+    Trata um erro ao ler um diretório durante a varredura.
+
+    Erros no diretório raiz são registrados e propagados; em subdiretórios
+    (inacessíveis, removidos ou substituídos durante a varredura) são apenas
+    registrados como aviso.
+
+    Args:
+        directory: Diretório que não pôde ser lido.
+        error: Erro ocorrido (FileNotFoundError, NotADirectoryError ou PermissionError).
+        is_root: Se o diretório é a raiz da varredura.
+
+    Raises:
+        FileNotFoundError, NotADirectoryError, PermissionError: Se is_root for True.
+    """
+    if isinstance(error, PermissionError):
+        message = f"Sem permissão para acessar o diretório: {directory}"
+    elif isinstance(error, NotADirectoryError):
+        message = (f"O caminho não é um diretório: {directory}" if is_root
+                   else f"Diretório substituído durante a varredura: {directory}")
+    else:
+        message = (f"Diretório não encontrado: {directory}" if is_root
+                   else f"Diretório removido durante a varredura: {directory}")
+
+    if not is_root:
+        logger.warning(message)
+        return
+    logger.error(message)
+    if isinstance(error, NotADirectoryError):
+        raise NotADirectoryError(message) from error
+    raise error
+
+
+def _iter_file_entries(path: Path, recursive: bool,
+                       extension_suffixes: Optional[Tuple[str, ...]]) -> Iterator[os.DirEntry]:
+    """
+    Percorre um diretório com os.scandir, produzindo as entradas de arquivos.
+
+    O diretório raiz é lido na thread chamadora, para que seus erros sejam
+    propagados; os subdiretórios são lidos antecipadamente por
+    _iter_prefetched_entries enquanto o chamador processa as entradas já
+    produzidas. Como a pré-leitura usa uma única thread, a ordem das entradas
+    não depende do agendamento das threads, o que mantém estável a ordem dos
+    conjuntos de duplicatas. Subdiretórios inacessíveis ou removidos durante a
+    varredura são ignorados com um aviso.
+
+    Args:
+        path: Diretório raiz.
+        recursive: Se True, percorre também os subdiretórios.
+        extension_suffixes: Tupla retornada por _to_extension_suffixes, ou None.
+
+    Returns:
+        Iterator[os.DirEntry]: Entradas dos arquivos que passam no filtro.
+
+    Raises:
+        FileNotFoundError: Se o diretório raiz não existir.
+        NotADirectoryError: Se o caminho raiz não apontar para um diretório.
+        PermissionError: Se não houver permissão para acessar o diretório raiz.
+    """
+    # A própria abertura do diretório raiz valida o caminho, sem stat prévio
+    root = str(path)
+    try:
+        files, subdirs = _scan_one_directory(root, recursive, extension_suffixes)
+    except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+        _handle_directory_error(root, e, is_root=True)
+    if not subdirs:
+        yield from files
+        return
+    yield from _iter_prefetched_entries(files, subdirs, recursive, extension_suffixes)
+
+
+def _iter_prefetched_entries(root_files: List[os.DirEntry], subdirs: List[str],
+                             recursive: bool, extension_suffixes: Optional[Tuple[str, ...]]
+                             ) -> Iterator[os.DirEntry]:
+    """
+    Produz as entradas dos subdiretórios lidos por uma thread de pré-leitura.
+
+    Uma única thread percorre os subdiretórios (em profundidade, com uma pilha
+    explícita) e entrega a lista de arquivos de cada um por uma fila limitada a
+    PREFETCH_QUEUE_SIZE diretórios. Assim a abertura e leitura do próximo
+    diretório (lenta com cache frio ou em discos de rede) se sobrepõe ao
+    processamento das entradas atuais, sem que a pré-leitura avance demais.
+
+    Args:
+        root_files: Entradas de arquivos do diretório raiz, produzidas primeiro.
+        subdirs: Subdiretórios do diretório raiz.
+        recursive: Se True, percorre também os subdiretórios encontrados.
+        extension_suffixes: Tupla retornada por _to_extension_suffixes, ou None.
+
+    Returns:
+        Iterator[os.DirEntry]: Entradas dos arquivos que passam no filtro.
+    """
+    results = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        # Espera por espaço na fila, desistindo se o consumidor parar
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def prefetch() -> None:
+        pending = list(subdirs)
+        try:
+            while pending and not stop.is_set():
+                current = pending.pop()
+                try:
+                    files, found = _scan_one_directory(current, recursive, extension_suffixes)
+                except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+                    _handle_directory_error(current, e, is_root=False)
+                    continue
+                pending.extend(found)
+                if files:
+                    put(files)
+        except BaseException as e:
+            # Erros inesperados são repassados ao consumidor
+            put(e)
+        finally:
+            put(_PREFETCH_DONE)
+
+    worker = threading.Thread(target=prefetch, name="fotix-scandir-prefetch", daemon=True)
+    worker.start()
+    try:
+        yield from root_files
+        while True:
+            item = results.get()
+            if item is _PREFETCH_DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+    finally:
+        # Consumo interrompido ou concluído: encerrar a pré-leitura
+        stop.set()
+        worker.join()
+
 
 class FileSystemService:
     """
@@ -41,17 +476,20 @@ class FileSystemService:
                  ou não for acessível.
         """
         try:
-            # Verificar se é um arquivo (não um diretório)
-            if not path.is_file():
-                logger.debug(f"Caminho não é um arquivo: {path}")
+            # Um único stat informa o tipo (arquivo regular ou não) e o tamanho
+            st = os.stat(path)
+            if not stat.S_ISREG(st.st_mode):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Caminho não é um arquivo: {path}")
                 return None
 
-            # Obter o tamanho do arquivo
-            size = path.stat().st_size
-            logger.debug(f"Tamanho do arquivo {path}: {size} bytes")
+            size = st.st_size
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tamanho do arquivo {path}: {size} bytes")
             return size
         except FileNotFoundError:
-            logger.debug(f"Arquivo não encontrado: {path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Arquivo não encontrado: {path}")
             return None
         except PermissionError:
             logger.warning(f"Sem permissão para acessar o arquivo: {path}")
@@ -60,13 +498,51 @@ class FileSystemService:
             logger.error(f"Erro ao obter tamanho do arquivo {path}: {str(e)}")
             return None
 
-    def stream_file_content(self, path: Path, chunk_size: int = 65536) -> Iterable[bytes]:
+    def get_metadata(self, path: Path) -> Optional[Tuple[int, float, float]]:
+        """
+        Retorna tamanho e timestamps do arquivo obtidos com uma única chamada stat.
+
+        Substitui a sequência get_file_size, get_creation_time e
+        get_modification_time, que faria três chamadas stat para o mesmo arquivo.
+        O timestamp de criação segue a mesma convenção de get_creation_time
+        (st_ctime).
+
+        Args:
+            path: Caminho para o arquivo.
+
+        Returns:
+            Optional[Tuple[int, float, float]]: Tupla (tamanho em bytes,
+                timestamp de criação, timestamp de modificação), ou None se o
+                arquivo não existir, não for um arquivo regular ou não for acessível.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Arquivo não encontrado: {path}")
+            return None
+        except PermissionError:
+            logger.warning(f"Sem permissão para acessar o arquivo: {path}")
+            return None
+        except Exception as e:
+            logger.error(f"Erro ao obter metadados do arquivo {path}: {str(e)}")
+            return None
+
+        if not stat.S_ISREG(st.st_mode):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Caminho não é um arquivo: {path}")
+            return None
+        return st.st_size, st.st_ctime, st.st_mtime
+
+    def stream_file_content(self, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterable[bytes]:
         """
         Retorna um iterador/gerador para ler o conteúdo do arquivo em blocos.
 
         Args:
             path: Caminho para o arquivo.
-            chunk_size: Tamanho de cada bloco em bytes. Padrão é 64KB.
+            chunk_size: Tamanho de cada bloco em bytes. Padrão é 1MB. A partir de
+                       64KB o arquivo é lido sem o buffer do Python; nesse caso um
+                       bloco pode vir menor que chunk_size antes do fim do arquivo.
 
         Returns:
             Iterable[bytes]: Iterador/gerador que produz blocos do conteúdo do arquivo.
@@ -77,17 +553,27 @@ class FileSystemService:
             IsADirectoryError: Se o caminho apontar para um diretório.
             Exception: Outras exceções relacionadas a IO podem ser levantadas.
         """
-        logger.debug(f"Iniciando streaming do arquivo: {path}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Iniciando streaming do arquivo: {path}")
 
         try:
-            with open(path, 'rb') as file:
+            buffering = 0 if chunk_size >= UNBUFFERED_MIN_CHUNK_SIZE else -1
+            with _open_for_reading(path, buffering) as file:
+                # Leitura sequencial: permitir que o kernel antecipe os próximos blocos
+                _fadvise(file, 'POSIX_FADV_SEQUENTIAL')
                 while True:
                     chunk = file.read(chunk_size)
                     if not chunk:
                         break
                     yield chunk
+                # Conteúdo já consumido: liberar as páginas do cache. Não é feito
+                # quando a leitura é interrompida (ex.: hash do início do arquivo),
+                # pois essas páginas serão lidas de novo no hash completo
+                _fadvise(file, 'POSIX_FADV_DONTNEED')
 
-            logger.debug(f"Streaming do arquivo {path} concluído com sucesso")
+            if debug:
+                logger.debug(f"Streaming do arquivo {path} concluído com sucesso")
         except FileNotFoundError:
             logger.error(f"Arquivo não encontrado: {path}")
             raise
@@ -125,41 +611,70 @@ class FileSystemService:
         logger.debug(f"Listando conteúdo do diretório: {path} (recursivo={recursive})")
 
         try:
-            # Verificar se é um diretório
-            if not path.is_dir():
-                logger.error(f"O caminho não é um diretório: {path}")
-                raise NotADirectoryError(f"O caminho não é um diretório: {path}")
-
-            # Função para verificar se um arquivo deve ser incluído com base na extensão
-            def should_include_file(file_path: Path) -> bool:
-                if not file_extensions:
-                    return True
-                return file_path.suffix.lower() in file_extensions
-
-            # Listar conteúdo do diretório
+            # Conjunto imutável de extensões, montado uma única vez por listagem
+            extension_suffixes = _to_extension_suffixes(file_extensions)
+
+            # Listar conteúdo do diretório com os.scandir; um Path só é criado
+            # para os arquivos incluídos
             files_found = 0
-            if recursive:
-                for item in path.rglob('*'):
-                    if item.is_file() and should_include_file(item):
-                        files_found += 1
-                        yield item
-            else:
-                for item in path.iterdir():
-                    if item.is_file() and should_include_file(item):
-                        files_found += 1
-                        yield item
+            for entry in _iter_file_entries(path, recursive, extension_suffixes):
+                files_found += 1
+                yield Path(entry.path)
 
             logger.debug(f"Listagem do diretório {path} concluída com sucesso. Encontrados {files_found} arquivos.")
-        except FileNotFoundError:
-            logger.error(f"Diretório não encontrado: {path}")
-            raise
-        except PermissionError:
-            logger.error(f"Sem permissão para acessar o diretório: {path}")
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            # Já registrado por _iter_file_entries
             raise
         except Exception as e:
             logger.error(f"Erro ao listar o diretório {path}: {str(e)}")
             raise
 
+    def scan_directory_with_stat(self, path: Path, recursive: bool = True,
+                                 file_extensions: Optional[List[str]] = None
+                                 ) -> Iterable[Tuple[str, os.stat_result]]:
+        """
+        Percorre um diretório com os.scandir retornando cada arquivo e seu stat.
+
+        O stat de cada entrada é obtido uma única vez a partir do DirEntry,
+        que reaproveita as informações da enumeração do diretório sempre que
+        o sistema operacional as fornece. Isso evita as chamadas separadas de
+        get_file_size, get_creation_time e get_modification_time por arquivo.
+
+        A leitura dos subdiretórios se sobrepõe ao processamento das entradas
+        já produzidas (ver _iter_file_entries).
+
+        Args:
+            path: Caminho para o diretório.
+            recursive: Se True, percorre também os subdiretórios.
+            file_extensions: Lista opcional de extensões de arquivo para filtrar.
+                            Se None, todos os arquivos são incluídos.
+
+        Returns:
+            Iterable[Tuple[str, os.stat_result]]: Iterador que produz tuplas
+                (caminho do arquivo como str, resultado do stat). O caminho é
+                mantido como str para evitar criar um Path por arquivo.
+
+        Raises:
+            FileNotFoundError: Se o diretório não existir.
+            NotADirectoryError: Se o caminho não apontar para um diretório.
+            PermissionError: Se não houver permissão para acessar o diretório raiz.
+        """
+        logger.debug(f"Percorrendo diretório com scandir: {path} (recursivo={recursive})")
+
+        extension_suffixes = _to_extension_suffixes(file_extensions)
+        files_found = 0
+        for entry in _iter_file_entries(path, recursive, extension_suffixes):
+            try:
+                # Para links simbólicos, o stat é o do arquivo de destino
+                stat_result = entry.stat()
+            except OSError as e:
+                logger.warning(f"Erro ao acessar {entry.path}: {str(e)}")
+                continue
+            files_found += 1
+            yield entry.path, stat_result
+
+        logger.debug(f"Varredura do diretório {path} concluída. Encontrados {files_found} arquivos.")
+
     def move_to_trash(self, path: Path) -> None:
         """
         Move um arquivo ou diretório para a lixeira do sistema.
@@ -172,12 +687,12 @@ class FileSystemService:
             PermissionError: Se não houver permissão para mover o arquivo/diretório.
             OSError: Para outros erros relacionados ao sistema operacional.
         """
-        logger.info(f"Movendo para a lixeira: {path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Movendo para a lixeira: {path}")
 
         try:
-            # Verificar se o caminho existe
+            # Verificar se o caminho existe (o erro é registrado uma única vez abaixo)
             if not path.exists():
-                logger.error(f"Caminho não encontrado: {path}")
                 raise FileNotFoundError(f"Caminho não encontrado: {path}")
 
             # Mover para a lixeira usando send2trash
@@ -194,6 +709,91 @@ class FileSystemService:
             logger.error(f"Erro ao mover para a lixeira {path}: {str(e)}")
             raise
 
+    def move_many_to_trash(self, paths: Iterable[Path]) -> Dict[Path, Exception]:
+        """
+        Move vários arquivos ou diretórios para a lixeira do sistema.
+
+        No Windows, todos os caminhos são enviados em uma única chamada ao
+        send2trash, que os move com uma só operação do shell em vez de uma por
+        arquivo. Nos demais sistemas, a lixeira é feita de operações comuns de
+        sistema de arquivos, então os caminhos são movidos em paralelo por um
+        pequeno pool de threads.
+
+        Args:
+            paths: Caminhos a serem movidos para a lixeira.
+
+        Returns:
+            Dict[Path, Exception]: Erro de cada caminho que não pôde ser movido
+                                  (vazio se todos foram movidos).
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+        logger.info(f"Movendo {len(paths)} caminhos para a lixeira")
+
+        if os.name == 'nt' and len(paths) > 1:
+            failures = self._move_batch_to_trash(paths)
+        else:
+            failures = {}
+            workers = min(MAX_PARALLEL_TRASH_WORKERS, len(paths))
+
+            def trash(path: Path) -> Optional[Exception]:
+                try:
+                    self.move_to_trash(path)
+                except Exception as e:
+                    return e
+                return None
+
+            if workers <= 1:
+                errors = [trash(path) for path in paths]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    errors = list(executor.map(trash, paths))
+            for path, error in zip(paths, errors):
+                if error is not None:
+                    failures[path] = error
+
+        logger.info(f"Movidos para a lixeira: {len(paths) - len(failures)} de {len(paths)}")
+        return failures
+
+    def _move_batch_to_trash(self, paths: List[Path]) -> Dict[Path, Exception]:
+        """
+        Move vários caminhos para a lixeira com uma única chamada ao send2trash.
+
+        Caminhos inexistentes são separados antes da chamada. Se a operação em
+        lote falhar, os caminhos que ainda existirem são movidos um a um, para
+        que o erro de cada um seja identificado.
+
+        Args:
+            paths: Caminhos a serem movidos para a lixeira.
+
+        Returns:
+            Dict[Path, Exception]: Erro de cada caminho que não pôde ser movido.
+        """
+        failures: Dict[Path, Exception] = {}
+        existing = []
+        for path in paths:
+            if path.exists():
+                existing.append(path)
+            else:
+                logger.error(f"Caminho não encontrado: {path}")
+                failures[path] = FileNotFoundError(f"Caminho não encontrado: {path}")
+        if not existing:
+            return failures
+
+        try:
+            send2trash.send2trash([str(path) for path in existing])
+        except Exception as e:
+            logger.warning(f"Falha ao mover em lote para a lixeira, movendo individualmente: {str(e)}")
+            for path in existing:
+                if not path.exists():
+                    continue
+                try:
+                    self.move_to_trash(path)
+                except Exception as item_error:
+                    failures[path] = item_error
+        return failures
+
     def copy_file(self, source: Path, destination: Path) -> None:
         """
         Copia um arquivo de origem para destino.
@@ -208,23 +808,22 @@ class FileSystemService:
             PermissionError: Se não houver permissão para ler a origem ou escrever no destino.
             OSError: Para outros erros relacionados ao sistema operacional.
         """
-        logger.info(f"Copiando arquivo de {source} para {destination}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Copiando arquivo de {source} para {destination}")
 
         try:
-            # Verificar se a origem é um arquivo
+            # Verificar se a origem é um arquivo (o erro é registrado uma única vez abaixo)
             if not source.is_file():
                 if not source.exists():
-                    logger.error(f"Arquivo de origem não encontrado: {source}")
                     raise FileNotFoundError(f"Arquivo de origem não encontrado: {source}")
-                else:
-                    logger.error(f"A origem não é um arquivo: {source}")
-                    raise IsADirectoryError(f"A origem não é um arquivo: {source}")
+                raise IsADirectoryError(f"A origem não é um arquivo: {source}")
 
             # Criar diretório de destino se não existir
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copiar o arquivo preservando metadados
-            shutil.copy2(source, destination)
+            # Copiar o arquivo preservando metadados (reflink/copy_file_range
+            # quando disponíveis, com shutil.copy2 como alternativa)
+            fast_copy(source, destination)
 
             logger.info(f"Arquivo copiado com sucesso de {source} para {destination}")
         except FileNotFoundError:
@@ -274,9 +873,14 @@ class FileSystemService:
 
         Returns:
             bool: True se o caminho existir, False caso contrário.
+
+        Note:
+            Usa lstat (os.path.lexists), sem resolver links simbólicos: um link
+            quebrado é considerado existente.
         """
-        exists = path.exists()
-        logger.debug(f"Verificando existência do caminho {path}: {exists}")
+        exists = os.path.lexists(path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Verificando existência do caminho {path}: {exists}")
         return exists
 
     def get_creation_time(self, path: Path) -> Optional[float]:
@@ -291,17 +895,18 @@ class FileSystemService:
                   o arquivo não existir ou a informação não estiver disponível.
         """
         try:
-            if not path.exists():
-                logger.debug(f"Caminho não encontrado: {path}")
-                return None
-
-            # Obter o timestamp de criação
+            # Um único stat: a inexistência é detectada pela própria chamada
             # Em sistemas Windows, st_ctime é o timestamp de criação
             # Em sistemas Unix, st_ctime é o timestamp de alteração de metadados
             # Usamos st_ctime como melhor aproximação disponível
-            creation_time = path.stat().st_ctime
-            logger.debug(f"Timestamp de criação para {path}: {creation_time}")
+            creation_time = os.stat(path).st_ctime
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Timestamp de criação para {path}: {creation_time}")
             return creation_time
+        except (FileNotFoundError, NotADirectoryError):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Caminho não encontrado: {path}")
+            return None
         except Exception as e:
             logger.error(f"Erro ao obter timestamp de criação para {path}: {str(e)}")
             return None
@@ -318,14 +923,15 @@ class FileSystemService:
                   o arquivo não existir ou a informação não estiver disponível.
         """
         try:
-            if not path.exists():
-                logger.debug(f"Caminho não encontrado: {path}")
-                return None
-
-            # Obter o timestamp de modificação
-            modification_time = path.stat().st_mtime
-            logger.debug(f"Timestamp de modificação para {path}: {modification_time}")
+            # Um único stat: a inexistência é detectada pela própria chamada
+            modification_time = os.stat(path).st_mtime
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Timestamp de modificação para {path}: {modification_time}")
             return modification_time
+        except (FileNotFoundError, NotADirectoryError):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Caminho não encontrado: {path}")
+            return None
         except Exception as e:
             logger.error(f"Erro ao obter timestamp de modificação para {path}: {str(e)}")
             return None
@@ -7,6 +7,7 @@ Estas interfaces permitem que as camadas superiores (core e aplicação) dependa
 de abstrações em vez de implementações concretas, facilitando testes e manutenção.
 """
 
+import os
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional, Protocol, TypeVar, Tuple, List
 from concurrent.futures import Future
@@ -98,13 +99,27 @@ class IFileSystemService(Protocol):
         """
         ...
 
-    def stream_file_content(self, path: Path, chunk_size: int = 65536) -> Iterable[bytes]:
+    def get_metadata(self, path: Path) -> Optional[Tuple[int, float, float]]:
+        """
+        Retorna tamanho e timestamps do arquivo obtidos com uma única chamada stat.
+
+        Args:
+            path: Caminho para o arquivo.
+
+        Returns:
+            Optional[Tuple[int, float, float]]: Tupla (tamanho em bytes,
+                timestamp de criação, timestamp de modificação), ou None se o
+                arquivo não existir, não for um arquivo regular ou não for acessível.
+        """
+        ...
+
+    def stream_file_content(self, path: Path, chunk_size: int = 1024 * 1024) -> Iterable[bytes]:
         """
         Retorna um iterador/gerador para ler o conteúdo do arquivo em blocos.
 
         Args:
             path: Caminho para o arquivo.
-            chunk_size: Tamanho de cada bloco em bytes. Padrão é 64KB.
+            chunk_size: Tamanho de cada bloco em bytes. Padrão é 1MB.
 
         Returns:
             Iterable[bytes]: Iterador/gerador que produz blocos do conteúdo do arquivo.
@@ -148,6 +163,34 @@ class IFileSystemService(Protocol):
         """
         ...
 
+    def scan_directory_with_stat(self, path: Path, recursive: bool = True,
+                                 file_extensions: Optional[list[str]] = None
+                                 ) -> Iterable[Tuple[str, os.stat_result]]:
+        """
+        Percorre um diretório retornando cada arquivo junto com seus metadados.
+
+        Diferente de list_directory_contents, os metadados (tamanho, datas) são
+        obtidos durante a própria enumeração do diretório, evitando chamadas
+        adicionais de stat por arquivo.
+
+        Args:
+            path: Caminho para o diretório.
+            recursive: Se True, percorre também os subdiretórios.
+            file_extensions: Lista opcional de extensões de arquivo para filtrar.
+                            Se None, todos os arquivos são incluídos.
+
+        Returns:
+            Iterable[Tuple[str, os.stat_result]]: Iterador que produz tuplas
+                (caminho do arquivo como str, resultado do stat). O caminho é
+                mantido como str para evitar criar um Path por arquivo.
+
+        Raises:
+            FileNotFoundError: Se o diretório não existir.
+            NotADirectoryError: Se o caminho não apontar para um diretório.
+            PermissionError: Se não houver permissão para acessar o diretório.
+        """
+        ...
+
     def move_to_trash(self, path: Path) -> None:
         """
         Move um arquivo ou diretório para a lixeira do sistema.
@@ -166,6 +209,19 @@ class IFileSystemService(Protocol):
         """
         ...
 
+    def move_many_to_trash(self, paths: Iterable[Path]) -> Dict[Path, Exception]:
+        """
+        Move vários arquivos ou diretórios para a lixeira do sistema.
+
+        Args:
+            paths: Caminhos a serem movidos para a lixeira.
+
+        Returns:
+            Dict[Path, Exception]: Erro de cada caminho que não pôde ser movido
+                                  (vazio se todos foram movidos).
+        """
+        ...
+
     def copy_file(self, source: Path, destination: Path) -> None:
         """
         Copia um arquivo de origem para destino.
@@ -215,10 +271,9 @@ class IFileSystemService(Protocol):
             bool: True se o caminho existir, False caso contrário.
 
         Note:
-            Esta operação segue links simbólicos. Para verificar se o caminho
-            apontado por um link simbólico existe, use este método diretamente.
-            Para verificar se o próprio link simbólico existe (independentemente
-            de para onde ele aponta), use este método no caminho do link.
+            Esta operação não segue links simbólicos: um link simbólico existe
+            mesmo que o caminho para onde ele aponta não exista. Quem precisar
+            validar o destino deve verificar o tipo do caminho (ex.: is_dir).
         """
         ...
 
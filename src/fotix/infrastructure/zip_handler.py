@@ -73,7 +73,9 @@ class ZipHandlerService(IZipHandlerService):
         # Normalizar extensões para comparação (converter para minúsculas)
         normalized_extensions = None
         if file_extensions:
-            normalized_extensions = [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in file_extensions]
+            normalized_extensions = frozenset(
+                ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in file_extensions
+            )
 
         # Função para verificar se um arquivo deve ser incluído com base na extensão
         def should_include_file(file_name: str) -> bool:
@@ -65,8 +65,12 @@ class MainWindow(QMainWindow):
         # Serviços de infraestrutura
         self._file_system_service = FileSystemService()
         self._zip_handler_service = ZipHandlerService()
-        self._concurrency_service = ConcurrencyService()
-        self._backup_service = BackupService(self._file_system_service)
+        # Um pool por perfil de carga: a varredura calcula hashes (CPU) e o
+        # backup copia arquivos (disco)
+        self._concurrency_service = ConcurrencyService(workload_type="cpu")
+        self._backup_concurrency_service = ConcurrencyService(workload_type="disk_io")
+        self._backup_service = BackupService(self._file_system_service,
+                                             concurrency_service=self._backup_concurrency_service)
 
         # Serviços de domínio
         self._duplicate_finder_service = DuplicateFinderService(
@@ -299,6 +303,7 @@ class MainWindow(QMainWindow):
         # Atualizar serviços com as novas configurações
         max_workers = settings.get("max_workers", 4)
         self._concurrency_service.set_max_workers(max_workers)
+        self._backup_concurrency_service.set_max_workers(max_workers)
 
         # Atualizar barra de status
         self._status_bar.showMessage("Configurações atualizadas.")
@@ -217,9 +217,10 @@ class SettingsDialog(QDialog):
         # Salvar configurações
         updated_config = self._save_settings()
         
-        # Atualizar configurações globais
+        # Atualizar configurações globais e gravar o arquivo uma única vez
         for key, value in updated_config.items():
-            update_config(key, value)
+            update_config(key, value, save=False)
+        save_config(get_config())
         
         # Emitir sinal de configurações alteradas
         self.settings_changed.emit(updated_config)
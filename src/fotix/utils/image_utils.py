@@ -6,6 +6,7 @@ como resolução, e verificar tipos de arquivo de imagem.
 """
 
 import io
+import struct
 from pathlib import Path
 from typing import Optional, Tuple, Callable, Iterable
 
@@ -17,9 +18,24 @@ from fotix.infrastructure.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Lista de extensões de arquivo de imagem comuns
-IMAGE_EXTENSIONS = {
+IMAGE_EXTENSIONS = frozenset({
     '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'
-}
+})
+
+# Extensões de imagem em minúsculas e maiúsculas, para consulta sem conversão
+_IMAGE_EXTENSIONS_ANY_CASE = IMAGE_EXTENSIONS | frozenset(ext.upper() for ext in IMAGE_EXTENSIONS)
+
+# Quantidade máxima de bytes iniciais examinada em busca das dimensões da imagem
+# (64KB cobrem o cabeçalho PNG/GIF/BMP e o marcador SOF da maioria dos JPEGs)
+IMAGE_HEADER_MAX_BYTES = 64 * 1024
+
+# Assinaturas usadas na leitura direta do cabeçalho das imagens
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_GIF_SIGNATURES = (b'GIF87a', b'GIF89a')
+
+# Marcadores JPEG "Start Of Frame", que contêm as dimensões da imagem
+# (0xC4, 0xC8 e 0xCC usam a mesma faixa mas não são quadros)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
 
 
 def is_image_file(file_path: Path) -> bool:
@@ -32,7 +48,8 @@ def is_image_file(file_path: Path) -> bool:
     Returns:
         bool: True se o arquivo tiver uma extensão de imagem conhecida, False caso contrário.
     """
-    return file_path.suffix.lower() in IMAGE_EXTENSIONS
+    suffix = file_path.suffix
+    return suffix in _IMAGE_EXTENSIONS_ANY_CASE or suffix.lower() in IMAGE_EXTENSIONS
 
 
 def get_image_resolution(file_path: Path) -> Optional[Tuple[int, int]]:
@@ -66,7 +83,10 @@ def get_image_resolution_from_bytes(content_provider: Callable[[], Iterable[byte
     """
     Obtém a resolução de uma imagem a partir de um provedor de conteúdo em bytes.
     
-    Útil para arquivos dentro de ZIPs ou outros contêineres.
+    Útil para arquivos dentro de ZIPs ou outros contêineres. O conteúdo é lido
+    em blocos e as dimensões são extraídas do cabeçalho assim que disponíveis
+    (até IMAGE_HEADER_MAX_BYTES), sem consumir o restante do arquivo. Apenas
+    formatos não reconhecidos no cabeçalho são carregados por inteiro no Pillow.
     
     Args:
         content_provider: Função que retorna um iterador/gerador para o conteúdo do arquivo em blocos.
@@ -75,8 +95,24 @@ def get_image_resolution_from_bytes(content_provider: Callable[[], Iterable[byte
         Optional[Tuple[int, int]]: Tupla (largura, altura) ou None se não for possível obter a resolução.
     """
     try:
-        # Consumir o conteúdo do provedor
-        content_chunks = list(content_provider())
+        content_chunks = []
+        header_size = 0
+        chunks = content_provider()
+        try:
+            for chunk in chunks:
+                content_chunks.append(chunk)
+                if header_size < IMAGE_HEADER_MAX_BYTES:
+                    header_size += len(chunk)
+                    resolution = get_image_resolution_from_header(b''.join(content_chunks))
+                    if resolution is not None:
+                        logger.debug(f"Resolução da imagem (do cabeçalho): {resolution}")
+                        return resolution
+        finally:
+            # Encerrar o gerador se a leitura foi interrompida antes do fim
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
         content = b''.join(content_chunks)
         
         # Abrir a imagem a partir dos bytes
@@ -92,6 +128,81 @@ def get_image_resolution_from_bytes(content_provider: Callable[[], Iterable[byte
         return None
 
 
+def get_image_resolution_from_header(header: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Obtém a resolução de uma imagem a partir dos bytes iniciais do arquivo.
+
+    Interpreta diretamente os cabeçalhos PNG, GIF, BMP e JPEG, sem abrir a
+    imagem com o Pillow. Permite extrair as dimensões dos bytes já lidos
+    durante o cálculo do hash, evitando uma nova leitura do arquivo.
+
+    Args:
+        header: Bytes do início do arquivo.
+
+    Returns:
+        Optional[Tuple[int, int]]: Tupla (largura, altura) ou None se o formato não for
+        reconhecido ou se as dimensões não estiverem contidas nos bytes fornecidos.
+    """
+    try:
+        if header.startswith(_PNG_SIGNATURE):
+            if header[12:16] == b'IHDR':
+                return struct.unpack('>II', header[16:24])
+            return None
+
+        if header[:6] in _GIF_SIGNATURES:
+            return struct.unpack('<HH', header[6:10])
+
+        if header.startswith(b'BM'):
+            (dib_header_size,) = struct.unpack('<I', header[14:18])
+            if dib_header_size == 12:
+                return struct.unpack('<HH', header[18:22])
+            width, height = struct.unpack('<ii', header[18:26])
+            return width, abs(height)
+
+        if header.startswith(b'\xff\xd8'):
+            return _get_jpeg_resolution(header)
+    except struct.error:
+        # Cabeçalho truncado: as dimensões não estão nos bytes disponíveis
+        return None
+
+    return None
+
+
+def _get_jpeg_resolution(header: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Percorre os segmentos de um JPEG até o marcador SOF com as dimensões.
+
+    Args:
+        header: Bytes do início de um arquivo JPEG.
+
+    Returns:
+        Optional[Tuple[int, int]]: Tupla (largura, altura) ou None se o marcador SOF
+        não estiver contido nos bytes fornecidos.
+
+    Raises:
+        struct.error: Se o cabeçalho estiver truncado.
+    """
+    offset = 2
+    while offset + 4 <= len(header):
+        if header[offset] != 0xFF:
+            return None
+        marker = header[offset + 1]
+        if marker == 0xFF:
+            # Byte de preenchimento entre segmentos
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Marcadores sem segmento de dados
+            offset += 2
+            continue
+        (segment_length,) = struct.unpack('>H', header[offset + 2:offset + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', header[offset + 5:offset + 9])
+            return width, height
+        offset += 2 + segment_length
+    return None
+
+
 def calculate_image_quality(resolution: Tuple[int, int]) -> int:
     """
     Calcula um valor de qualidade para uma imagem com base na resolução.
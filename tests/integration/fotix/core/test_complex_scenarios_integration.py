@@ -139,9 +139,10 @@ class TestComplexScenariosIntegration:
 
                 # Verificar se a estratégia selecionou os arquivos corretos
                 # Para imagens, deve selecionar a de maior resolução (photo1.jpg)
-                # Para documentos, deve usar a estratégia de fallback (nome mais curto: doc1.pdf)
+                # Para documentos, sem resolução, o desempate cabe à próxima estratégia
+                # (data de modificação mais recente: doc2.pdf)
                 assert "photo1" in str(selected_files[0].path)
-                assert "doc1" in str(selected_files[1].path)
+                assert "doc2" in str(selected_files[1].path)
 
     def test_error_handling_during_integration(self, mock_file_system_service):
         """
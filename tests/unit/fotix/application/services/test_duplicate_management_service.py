@@ -27,6 +27,7 @@ class TestDuplicateManagementService:
     def mock_file_system_service(self):
         """Fixture para criar um mock do serviço de sistema de arquivos."""
         service = MagicMock()
+        service.move_many_to_trash.return_value = {}
         return service
 
     @pytest.fixture
@@ -42,7 +43,8 @@ class TestDuplicateManagementService:
         return DuplicateManagementService(
             selection_strategy=mock_selection_strategy,
             file_system_service=mock_file_system_service,
-            backup_service=mock_backup_service
+            backup_service=mock_backup_service,
+            zip_handler_service=MagicMock()
         )
 
     @pytest.fixture
@@ -91,7 +93,8 @@ class TestDuplicateManagementService:
         # Verificar se os métodos corretos foram chamados
         mock_selection_strategy.select_file_to_keep.assert_called_once_with(sample_duplicate_set)
         assert mock_backup_service.create_backup.call_count == 1
-        assert mock_file_system_service.move_to_trash.call_count == 2
+        mock_file_system_service.move_many_to_trash.assert_called_once()
+        assert len(mock_file_system_service.move_many_to_trash.call_args[0][0]) == 2
 
     def test_process_duplicate_set_with_custom_selection(self, service, sample_duplicate_set,
                                                       mock_selection_strategy, mock_file_system_service,
@@ -117,7 +120,8 @@ class TestDuplicateManagementService:
         # Verificar se os métodos corretos foram chamados
         mock_selection_strategy.select_file_to_keep.assert_not_called()
         assert mock_backup_service.create_backup.call_count == 1
-        assert mock_file_system_service.move_to_trash.call_count == 2
+        mock_file_system_service.move_many_to_trash.assert_called_once()
+        assert len(mock_file_system_service.move_many_to_trash.call_args[0][0]) == 2
 
     def test_process_duplicate_set_without_backup(self, service, sample_duplicate_set,
                                                mock_selection_strategy, mock_file_system_service,
@@ -142,7 +146,8 @@ class TestDuplicateManagementService:
         # Verificar se os métodos corretos foram chamados
         mock_selection_strategy.select_file_to_keep.assert_called_once_with(sample_duplicate_set)
         mock_backup_service.create_backup.assert_not_called()
-        assert mock_file_system_service.move_to_trash.call_count == 2
+        mock_file_system_service.move_many_to_trash.assert_called_once()
+        assert len(mock_file_system_service.move_many_to_trash.call_args[0][0]) == 2
 
     def test_process_empty_duplicate_set(self, service):
         """Testa se o processamento de um conjunto vazio levanta ValueError."""
@@ -171,6 +176,43 @@ class TestDuplicateManagementService:
         assert result['error'] is not None
         assert "não está no conjunto de duplicatas" in result['error']
 
+    def test_process_duplicate_sets(self, service, sample_duplicate_set,
+                                    mock_selection_strategy, mock_file_system_service):
+        """Testa o processamento em lote, com uma única seleção para todos os conjuntos."""
+        # Arrange
+        other_set = DuplicateSet(
+            files=[
+                FileInfo(path=Path("/path/to/other1.jpg"), size=2048, hash="def456"),
+                FileInfo(path=Path("/path/to/other2.jpg"), size=2048, hash="def456")
+            ],
+            hash="def456"
+        )
+        selections = [sample_duplicate_set.files[1], other_set.files[0]]
+        mock_selection_strategy.select_for_all.return_value = selections
+
+        # Act
+        results = service.process_duplicate_sets([sample_duplicate_set, other_set])
+
+        # Assert
+        assert [r['kept_file'] for r in results] == selections
+        assert all(r['error'] is None for r in results)
+        assert len(results[1]['removed_files']) == 1
+        mock_selection_strategy.select_for_all.assert_called_once_with(
+            [sample_duplicate_set, other_set])
+        mock_selection_strategy.select_file_to_keep.assert_not_called()
+        assert mock_file_system_service.move_many_to_trash.call_count == 2
+
+    def test_process_duplicate_sets_with_empty_set(self, service, sample_duplicate_set,
+                                                   mock_selection_strategy):
+        """Testa se o lote é rejeitado antes da seleção quando há um conjunto vazio."""
+        # Arrange
+        empty_set = DuplicateSet(files=[], hash="empty")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="O conjunto de duplicatas está vazio"):
+            service.process_duplicate_sets([sample_duplicate_set, empty_set])
+        mock_selection_strategy.select_for_all.assert_not_called()
+
     def test_backup_files(self, service, mock_backup_service):
         """Testa a criação de backup de arquivos."""
         # Arrange
@@ -245,18 +287,26 @@ class TestDuplicateManagementService:
         assert backup_id == "no_backup_needed"
         mock_backup_service.create_backup.assert_not_called()
 
-    def test_remove_file(self, service, mock_file_system_service):
-        """Testa a remoção de um arquivo."""
+    def test_remove_files(self, service, mock_file_system_service):
+        """Testa a remoção de arquivos em uma única operação em lote."""
         # Arrange
-        file_info = FileInfo(path=Path("/path/to/file.jpg"), size=1024, hash="abc123")
+        files = [
+            FileInfo(path=Path("/path/to/file1.jpg"), size=1024, hash="abc123"),
+            FileInfo(path=Path("/path/to/file2.jpg"), size=1024, hash="abc123")
+        ]
+        error = OSError("Arquivo em uso")
+        mock_file_system_service.move_many_to_trash.return_value = {Path("/path/to/file2.jpg"): error}
 
         # Act
-        service._remove_file(file_info)
+        failures = service._remove_files(files)
 
         # Assert
-        mock_file_system_service.move_to_trash.assert_called_once_with(Path("/path/to/file.jpg"))
+        mock_file_system_service.move_many_to_trash.assert_called_once_with(
+            [Path("/path/to/file1.jpg"), Path("/path/to/file2.jpg")])
+        mock_file_system_service.move_to_trash.assert_not_called()
+        assert failures == {Path("/path/to/file2.jpg"): error}
 
-    def test_remove_file_in_zip(self, service, mock_file_system_service):
+    def test_remove_files_in_zip(self, service, mock_file_system_service):
         """Testa a tentativa de remoção de um arquivo dentro de ZIP."""
         # Arrange
         file_info = FileInfo(
@@ -268,10 +318,28 @@ class TestDuplicateManagementService:
         )
 
         # Act
-        service._remove_file(file_info)
+        failures = service._remove_files([file_info])
 
         # Assert
-        mock_file_system_service.move_to_trash.assert_not_called()
+        assert failures == {}
+        mock_file_system_service.move_many_to_trash.assert_not_called()
+
+    def test_process_duplicate_set_with_partial_remove_error(self, service, sample_duplicate_set,
+                                                          mock_selection_strategy, mock_file_system_service):
+        """Testa que um arquivo que não pôde ser removido não é reportado como removido."""
+        # Arrange
+        file_to_keep = sample_duplicate_set.files[0]
+        failed_file = sample_duplicate_set.files[2]
+        mock_selection_strategy.select_file_to_keep.return_value = file_to_keep
+        mock_file_system_service.move_many_to_trash.return_value = {failed_file.path: OSError("Arquivo em uso")}
+
+        # Act
+        result = service.process_duplicate_set(sample_duplicate_set)
+
+        # Assert
+        assert result['kept_file'] == file_to_keep
+        assert result['removed_files'] == [sample_duplicate_set.files[1]]
+        assert str(failed_file.path) in result['error']
 
     def test_process_duplicate_set_with_backup_error(self, service, sample_duplicate_set,
                                                   mock_selection_strategy, mock_backup_service):
@@ -297,7 +365,7 @@ class TestDuplicateManagementService:
         # Arrange
         file_to_keep = sample_duplicate_set.files[0]
         mock_selection_strategy.select_file_to_keep.return_value = file_to_keep
-        mock_file_system_service.move_to_trash.side_effect = Exception("Erro ao mover para lixeira")
+        mock_file_system_service.move_many_to_trash.side_effect = Exception("Erro ao mover para lixeira")
 
         # Act
         result = service.process_duplicate_set(sample_duplicate_set)
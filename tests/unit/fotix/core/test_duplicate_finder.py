@@ -11,13 +11,24 @@ from typing import Dict, List, Callable, Iterable, Optional, Tuple
 from unittest import mock
 from unittest.mock import MagicMock, patch, call
 
+import blake3
 import pytest
 
-from fotix.core.duplicate_finder import DuplicateFinderService, MIN_FILE_SIZE
+from fotix.core.duplicate_finder import (
+    DuplicateFinderService, CHUNK_SIZE, MIN_FILE_SIZE, MMAP_HASH_THRESHOLD, HEAD_HASH_SIZE
+)
 from fotix.core.models import DuplicateSet, FileInfo
 from fotix.infrastructure.interfaces import IFileSystemService, IZipHandlerService
 
 
+def make_stat_entries(sizes: Dict[Path, int], timestamp: float = 1600000000.0) -> List[Tuple[str, os.stat_result]]:
+    """Cria tuplas (caminho, stat) simulando o retorno de scan_directory_with_stat."""
+    return [
+        (str(path), os.stat_result((0o100644, 0, 0, 1, 0, 0, size, timestamp, timestamp, timestamp)))
+        for path, size in sizes.items()
+    ]
+
+
 class TestDuplicateFinderService:
     """Testes para o serviço de detecção de duplicatas."""
 
@@ -79,12 +90,8 @@ class TestDuplicateFinderService:
 
         mock_file_system_service.stream_file_content.side_effect = mock_stream_content
 
-        # Configurar tamanho do arquivo
-        mock_file_system_service.get_file_size.return_value = 1024
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        # Configurar tamanho e timestamps do arquivo
+        mock_file_system_service.get_metadata.return_value = (1024, 1600000000.0, 1600000000.0)
 
         # Patch os métodos is_dir e is_file da classe Path
         with patch.object(Path, 'is_dir', return_value=False), \
@@ -96,6 +103,9 @@ class TestDuplicateFinderService:
             # Assert
             assert isinstance(result, list)
             assert len(result) == 0  # Um único arquivo não pode ser duplicata
+            mock_file_system_service.get_metadata.assert_called_once_with(file_path)
+            mock_file_system_service.get_creation_time.assert_not_called()
+            mock_file_system_service.get_modification_time.assert_not_called()
 
     def test_find_duplicates_with_zip_file(self, duplicate_finder_service, mock_file_system_service, mock_zip_handler_service):
         """Testa a busca de duplicatas em um arquivo ZIP."""
@@ -148,19 +158,12 @@ class TestDuplicateFinderService:
         scan_paths = [Path("/test")]
 
         # Configurar o mock para retornar uma lista de arquivos
-        file_paths = [Path("/test/file1.txt"), Path("/test/file2.txt"), Path("/test/file3.txt")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos de arquivo (file1 e file2 têm o mesmo tamanho)
-        mock_file_system_service.get_file_size.side_effect = lambda path: {
+        # (file1 e file2 têm o mesmo tamanho)
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries({
             Path("/test/file1.txt"): 1024,
             Path("/test/file2.txt"): 1024,
             Path("/test/file3.txt"): 2048
-        }.get(path)
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        })
 
         # Configurar conteúdo dos arquivos para cálculo de hash
         def mock_stream_content(path, chunk_size=None):
@@ -188,15 +191,11 @@ class TestDuplicateFinderService:
         scan_paths = [Path("/test")]
 
         # Configurar o mock para retornar uma lista de arquivos
+        # (todos com o mesmo tamanho para forçar cálculo de hash)
         file_paths = [Path("/test/file1.txt"), Path("/test/file2.txt"), Path("/test/error.txt")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos de arquivo (todos com o mesmo tamanho para forçar cálculo de hash)
-        mock_file_system_service.get_file_size.return_value = 1024
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries(
+            {path: 1024 for path in file_paths}
+        )
 
         # Configurar conteúdo dos arquivos para cálculo de hash
         def mock_stream_content(path, chunk_size=None):
@@ -219,24 +218,79 @@ class TestDuplicateFinderService:
         assert {file.path for file in result[0].files} == {Path("/test/file1.txt"), Path("/test/file2.txt")}
         # O arquivo com erro deve ser ignorado
 
+    def test_find_duplicates_parallel_hashing(self, mock_file_system_service):
+        """Testa o cálculo paralelo de hashes, incluindo arquivos com erro de leitura."""
+        # Arrange
+        service = DuplicateFinderService(file_system_service=mock_file_system_service, max_workers=4)
+        file_paths = [Path(f"/test/file{i}.txt") for i in range(8)] + [Path("/test/error.txt")]
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries(
+            {path: 1024 for path in file_paths}
+        )
+
+        def mock_stream_content(path, chunk_size=None):
+            if path == Path("/test/error.txt"):
+                raise OSError("Erro simulado ao ler arquivo")
+            # Arquivos pares e ímpares formam dois conjuntos de duplicatas
+            yield b"par" if int(path.stem[-1]) % 2 == 0 else b"impar"
+
+        mock_file_system_service.stream_file_content.side_effect = mock_stream_content
+
+        # Act
+        with patch.object(Path, 'is_dir', return_value=True):
+            result = service.find_duplicates([Path("/test")], include_zips=False)
+
+        # Assert
+        assert service.max_workers == 4
+        assert sorted(len(ds.files) for ds in result) == [4, 4]
+        assert all(f.path != Path("/test/error.txt") for ds in result for f in ds.files)
+        # Hashes são expostos em hexadecimal, tanto no conjunto quanto nos arquivos
+        expected_hashes = {blake3.blake3(b"par").hexdigest(), blake3.blake3(b"impar").hexdigest()}
+        assert {ds.hash for ds in result} == expected_hashes
+        assert all(f.hash == ds.hash for ds in result for f in ds.files)
+
+    def test_find_duplicates_skips_full_hash_when_head_differs(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que arquivos grandes com início diferente não têm o hash completo calculado."""
+        # Arrange
+        file_paths = [Path("/test/a.bin"), Path("/test/b.bin"), Path("/test/c.bin")]
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries(
+            {path: HEAD_HASH_SIZE * 4 for path in file_paths}
+        )
+
+        contents = {
+            Path("/test/a.bin"): b"A" * HEAD_HASH_SIZE * 4,
+            Path("/test/b.bin"): b"A" * HEAD_HASH_SIZE * 4,
+            Path("/test/c.bin"): b"C" * HEAD_HASH_SIZE * 4,
+        }
+        full_reads = []
+
+        def mock_stream_content(path, chunk_size=None):
+            if chunk_size != HEAD_HASH_SIZE:
+                full_reads.append(path)
+            data = contents[path]
+            for i in range(0, len(data), chunk_size):
+                yield data[i:i + chunk_size]
+
+        mock_file_system_service.stream_file_content.side_effect = mock_stream_content
+
+        # Act
+        with patch.object(Path, 'is_dir', return_value=True):
+            result = duplicate_finder_service.find_duplicates([Path("/test")], include_zips=False)
+
+        # Assert
+        assert len(result) == 1
+        assert {f.path for f in result[0].files} == {Path("/test/a.bin"), Path("/test/b.bin")}
+        assert sorted(full_reads) == [Path("/test/a.bin"), Path("/test/b.bin")]
+
     def test_find_duplicates_with_zip(self, duplicate_finder_service, mock_file_system_service, mock_zip_handler_service):
         """Testa a busca de duplicatas incluindo arquivos em ZIPs."""
         # Arrange
         scan_paths = [Path("/test")]
 
         # Configurar o mock para retornar uma lista de arquivos incluindo um ZIP
-        file_paths = [Path("/test/file1.txt"), Path("/test/archive.zip")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos de arquivo
-        mock_file_system_service.get_file_size.side_effect = lambda path: {
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries({
             Path("/test/file1.txt"): 1024,
             Path("/test/archive.zip"): 5000
-        }.get(path)
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        })
 
         # Configurar conteúdo do arquivo normal para cálculo de hash
         def mock_stream_content(path, chunk_size=None):
@@ -273,7 +327,7 @@ class TestDuplicateFinderService:
         mock_callback = MagicMock()
 
         # Configurar o mock para retornar uma lista vazia de arquivos
-        mock_file_system_service.list_directory_contents.return_value = []
+        mock_file_system_service.scan_directory_with_stat.return_value = []
 
         # Act
         duplicate_finder_service.find_duplicates(scan_paths, include_zips=False, progress_callback=mock_callback)
@@ -288,15 +342,11 @@ class TestDuplicateFinderService:
         mock_callback = MagicMock()
 
         # Configurar arquivos com mesmo tamanho e hash
+        # (com tamanhos iguais)
         file_paths = [Path("/test/file1.txt"), Path("/test/file2.txt")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos iguais
-        mock_file_system_service.get_file_size.return_value = 1024
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries(
+            {path: 1024 for path in file_paths}
+        )
 
         # Configurar conteúdo para hash
         mock_file_system_service.stream_file_content.return_value = [b"conteudo igual"]
@@ -304,7 +354,7 @@ class TestDuplicateFinderService:
         # Act
         with patch('blake3.blake3') as mock_blake3:
             mock_hasher = MagicMock()
-            mock_hasher.hexdigest.return_value = "abc123"
+            mock_hasher.digest.return_value = b"abc123"
             mock_blake3.return_value = mock_hasher
 
             result = duplicate_finder_service.find_duplicates(
@@ -319,6 +369,32 @@ class TestDuplicateFinderService:
             progress = call_args[0][0]
             assert 0 <= progress <= 1
 
+    def test_find_duplicates_files_share_set_hash(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que os arquivos de um conjunto compartilham o objeto de hash do conjunto."""
+        # Arrange
+        scan_paths = [Path("/test")]
+        file_paths = [Path("/test/file1.txt"), Path("/test/file2.txt"), Path("/test/file3.txt")]
+        mock_file_system_service.scan_directory_with_stat.return_value = make_stat_entries(
+            {path: 1024 for path in file_paths}
+        )
+        mock_file_system_service.stream_file_content.return_value = [b"conteudo igual"]
+
+        # Act
+        with patch('blake3.blake3') as mock_blake3, \
+             patch.object(Path, 'is_dir', return_value=True):
+            mock_hasher = MagicMock()
+            mock_hasher.digest.return_value = b"abc123"
+            mock_blake3.return_value = mock_hasher
+
+            result = duplicate_finder_service.find_duplicates(scan_paths, include_zips=False)
+
+        # Assert
+        assert len(result) == 1
+        duplicate_set = result[0]
+        assert duplicate_set.hash == b"abc123".hex()
+        assert [f.path for f in duplicate_set.files] == file_paths
+        assert all(f.hash is duplicate_set.hash for f in duplicate_set.files)
+
     def test_group_files_by_size(self, duplicate_finder_service):
         """Testa o agrupamento de arquivos por tamanho."""
         # Arrange
@@ -366,16 +442,84 @@ class TestDuplicateFinderService:
         # Act
         with patch('blake3.blake3') as mock_blake3:
             mock_hasher = MagicMock()
-            mock_hasher.hexdigest.return_value = "abc123"
+            mock_hasher.digest.return_value = b"abc123"
             mock_blake3.return_value = mock_hasher
 
             result = duplicate_finder_service._calculate_file_hash(file_info)
 
         # Assert
-        assert result == "abc123"
-        mock_file_system_service.stream_file_content.assert_called_once_with(file_info.path, 65536)
+        assert result == b"abc123"
+        mock_file_system_service.stream_file_content.assert_called_once_with(file_info.path, CHUNK_SIZE)
         mock_hasher.update.assert_called_once_with(b"conteudo do arquivo")
 
+    def test_calculate_file_hash_stores_image_resolution(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que a resolução de uma imagem é extraída do primeiro bloco lido para o hash."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/image.png"), size=2048, hash=None, in_zip=False)
+        png_header = b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\x0dIHDR" + (640).to_bytes(4, "big") + (480).to_bytes(4, "big")
+        mock_file_system_service.stream_file_content.return_value = [png_header, b"restante"]
+
+        # Act
+        result = duplicate_finder_service._calculate_file_hash(file_info)
+
+        # Assert
+        assert result == blake3.blake3(png_header + b"restante").digest()
+        assert file_info.resolution == (640, 480)
+
+    def test_calculate_file_hash_skips_debug_messages_when_disabled(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que as mensagens de debug por arquivo não são emitidas com o nível DEBUG desativado."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/file.txt"), size=1024, hash=None, in_zip=False)
+        mock_file_system_service.stream_file_content.return_value = [b"conteudo"]
+
+        # Act
+        with patch('fotix.core.duplicate_finder.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = duplicate_finder_service._calculate_file_hash(file_info)
+
+        # Assert
+        assert result == blake3.blake3(b"conteudo").digest()
+        mock_logger.debug.assert_not_called()
+
+    def test_calculate_file_hash_large_file_uses_mmap(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que arquivos grandes são lidos via mmap pelo próprio BLAKE3."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/video.mp4"), size=MMAP_HASH_THRESHOLD, hash=None, in_zip=False)
+
+        # Act
+        with patch('blake3.blake3') as mock_blake3:
+            mock_hasher = MagicMock()
+            mock_hasher.digest.return_value = b"abc123"
+            mock_blake3.return_value = mock_hasher
+
+            result = duplicate_finder_service._calculate_file_hash(file_info)
+
+        # Assert
+        assert result == b"abc123"
+        mock_hasher.update_mmap.assert_called_once_with(str(file_info.path))
+        mock_file_system_service.stream_file_content.assert_not_called()
+
+    def test_calculate_file_hash_mmap_failure_falls_back_to_stream(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que, se o mmap falhar, o arquivo é lido em blocos com um hasher novo."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/video.mp4"), size=MMAP_HASH_THRESHOLD, hash=None, in_zip=False)
+        mock_file_system_service.stream_file_content.return_value = [b"conteudo"]
+
+        # Act
+        with patch('blake3.blake3') as mock_blake3:
+            failing_hasher = MagicMock()
+            failing_hasher.update_mmap.side_effect = OSError("mmap não suportado")
+            fallback_hasher = MagicMock()
+            fallback_hasher.digest.return_value = b"def456"
+            mock_blake3.side_effect = [failing_hasher, fallback_hasher]
+
+            result = duplicate_finder_service._calculate_file_hash(file_info)
+
+        # Assert
+        assert result == b"def456"
+        fallback_hasher.update.assert_called_once_with(b"conteudo")
+        mock_file_system_service.stream_file_content.assert_called_once_with(file_info.path, CHUNK_SIZE)
+
     def test_calculate_file_hash_zip_file(self, duplicate_finder_service):
         """Testa o cálculo de hash para um arquivo dentro de um ZIP."""
         # Arrange
@@ -395,13 +539,13 @@ class TestDuplicateFinderService:
         # Act
         with patch('blake3.blake3') as mock_blake3:
             mock_hasher = MagicMock()
-            mock_hasher.hexdigest.return_value = "def456"
+            mock_hasher.digest.return_value = b"def456"
             mock_blake3.return_value = mock_hasher
 
             result = duplicate_finder_service._calculate_file_hash(file_info)
 
         # Assert
-        assert result == "def456"
+        assert result == b"def456"
         mock_hasher.update.assert_called_once_with(b"conteudo do arquivo no zip")
 
     def test_calculate_file_hash_zip_file_without_provider(self, duplicate_finder_service):
@@ -433,75 +577,57 @@ class TestDuplicateFinderService:
         with pytest.raises(Exception):
             duplicate_finder_service._calculate_file_hash(file_info)
 
-    def test_process_directory(self, duplicate_finder_service, mock_file_system_service):
-        """Testa o processamento de um diretório."""
+    def test_hash_pair_if_equal_identical_files(self, duplicate_finder_service):
+        """Testa que um par idêntico recebe o mesmo hash, mesmo com blocos de tamanhos diferentes."""
         # Arrange
-        directory = Path("/test")
-
-        # Configurar o mock para retornar uma lista de arquivos
-        file_paths = [Path("/test/file1.txt"), Path("/test/file2.txt")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos de arquivo
-        mock_file_system_service.get_file_size.side_effect = lambda path: 1024
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        first = FileInfo(path=Path("/test/a.txt"), size=4, hash=None, in_zip=True,
+                         content_provider=lambda: iter([b"ab", b"cd"]))
+        second = FileInfo(path=Path("/test/b.txt"), size=4, hash=None, in_zip=True,
+                          content_provider=lambda: iter([b"a", b"bcd"]))
 
         # Act
-        result = duplicate_finder_service._process_directory(directory, include_zips=False)
+        result = duplicate_finder_service._hash_pair_if_equal([first, second])
 
         # Assert
-        assert len(result) == 2
-        assert all(isinstance(file, FileInfo) for file in result)
-        assert {file.path for file in result} == set(file_paths)
+        assert result == (blake3.blake3(b"abcd").digest(),) * 2
 
-    def test_process_directory_with_exception(self, duplicate_finder_service, mock_file_system_service):
-        """Testa o processamento de um diretório quando ocorre uma exceção."""
+    def test_hash_pair_if_equal_different_files(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que um par com conteúdo diferente não recebe hash."""
         # Arrange
-        directory = Path("/test")
-
-        # Configurar o mock para lançar uma exceção
-        mock_file_system_service.list_directory_contents.side_effect = Exception("Erro simulado")
+        files = [
+            FileInfo(path=Path("/test/a.txt"), size=2048, hash=None),
+            FileInfo(path=Path("/test/b.txt"), size=2048, hash=None)
+        ]
+        mock_file_system_service.stream_file_content.side_effect = lambda path, chunk_size=None: iter(
+            [b"x" * 1024, b"a" * 1024] if path.name == "a.txt" else [b"x" * 1024, b"b" * 1024]
+        )
 
         # Act
-        result = duplicate_finder_service._process_directory(directory, include_zips=False)
+        result = duplicate_finder_service._hash_pair_if_equal(files)
 
         # Assert
-        assert len(result) == 0  # Nenhum arquivo deve ser retornado quando ocorre um erro
+        assert result == (None, None)
 
-    def test_process_directory_with_zip(self, duplicate_finder_service, mock_file_system_service, mock_zip_handler_service):
-        """Testa o processamento de um diretório contendo um arquivo ZIP."""
+    def test_hash_pair_if_equal_read_error_falls_back(self, duplicate_finder_service, mock_file_system_service):
+        """Testa que um erro de leitura no par recorre ao hash individual de cada arquivo."""
         # Arrange
-        directory = Path("/test")
-
-        # Configurar o mock para retornar uma lista de arquivos incluindo um ZIP
-        file_paths = [Path("/test/file1.txt"), Path("/test/archive.zip")]
-        mock_file_system_service.list_directory_contents.return_value = file_paths
-
-        # Configurar tamanhos de arquivo
-        mock_file_system_service.get_file_size.side_effect = lambda path: 1024
-
-        # Configurar timestamps
-        mock_file_system_service.get_creation_time.return_value = 1600000000.0
-        mock_file_system_service.get_modification_time.return_value = 1600000000.0
+        files = [
+            FileInfo(path=Path("/test/a.txt"), size=2048, hash=None),
+            FileInfo(path=Path("/test/error.txt"), size=2048, hash=None)
+        ]
 
-        # Configurar conteúdo do arquivo ZIP
-        def mock_content_provider():
-            yield b"conteudo do arquivo no zip"
+        def mock_stream_content(path, chunk_size=None):
+            if path.name == "error.txt":
+                raise OSError("Erro simulado ao ler arquivo")
+            yield b"a" * 2048
 
-        # Configurar o mock para retornar arquivos dentro do ZIP
-        mock_zip_handler_service.stream_zip_entries.return_value = [
-            ("file_in_zip.txt", 1024, mock_content_provider)
-        ]
+        mock_file_system_service.stream_file_content.side_effect = mock_stream_content
 
         # Act
-        result = duplicate_finder_service._process_directory(directory, include_zips=True)
+        result = duplicate_finder_service._hash_pair_if_equal(files)
 
         # Assert
-        assert len(result) == 3  # 1 arquivo normal + 1 arquivo ZIP + 1 arquivo dentro do ZIP
-        assert sum(1 for file in result if file.in_zip) == 1  # 1 arquivo dentro do ZIP
+        assert result == (blake3.blake3(b"a" * 2048).digest(), None)
 
     def test_process_zip(self, duplicate_finder_service, mock_file_system_service, mock_zip_handler_service):
         """Testa o processamento de um arquivo ZIP."""
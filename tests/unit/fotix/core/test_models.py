@@ -5,6 +5,7 @@ Este módulo contém testes para as classes FileInfo e DuplicateSet,
 verificando a criação, validação e propriedades dessas classes.
 """
 
+import sys
 from datetime import datetime
 from pathlib import Path
 import pytest
@@ -111,6 +112,21 @@ class TestFileInfo:
         # Act & Assert
         assert file_info.extension == ".txt"
 
+    def test_filename_and_extension_cached(self):
+        """Testa que nome e extensão são calculados uma vez e não afetam a igualdade."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/file.txt"), size=1024)
+        other = FileInfo(path=Path("/test/file.txt"), size=1024)
+
+        # Act
+        first_name = file_info.filename
+        first_extension = file_info.extension
+
+        # Assert
+        assert file_info.filename is first_name
+        assert file_info.extension is first_extension
+        assert file_info == other
+
     def test_creation_datetime_property(self):
         """Testa a propriedade creation_datetime."""
         # Arrange
@@ -169,6 +185,17 @@ class TestFileInfo:
         # Act & Assert
         assert file_info.modification_datetime is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots requer Python 3.10+")
+    def test_uses_slots(self):
+        """Testa que FileInfo e DuplicateSet não possuem __dict__ por instância."""
+        # Arrange
+        file_info = FileInfo(path=Path("/test/file.txt"), size=1024)
+        duplicate_set = DuplicateSet(files=[file_info])
+
+        # Act & Assert
+        assert not hasattr(file_info, "__dict__")
+        assert not hasattr(duplicate_set, "__dict__")
+
 
 class TestDuplicateSet:
     """Testes para a classe DuplicateSet."""
@@ -260,6 +287,21 @@ class TestDuplicateSet:
         assert len(duplicate_set.files) == 2
         assert duplicate_set.files[1] == file_info2
 
+    def test_add_file_shares_hash_object(self):
+        """Testa se os arquivos adicionados passam a compartilhar o objeto de hash do conjunto."""
+        # Arrange
+        duplicate_set = DuplicateSet()
+        file_info1 = FileInfo(path=Path("/test/file1.txt"), size=1024, hash="".join(["abc", "123"]))
+        file_info2 = FileInfo(path=Path("/test/file2.txt"), size=1024, hash="".join(["abc", "123"]))
+
+        # Act
+        duplicate_set.add_file(file_info1)
+        duplicate_set.add_file(file_info2)
+
+        # Assert
+        assert file_info1.hash is duplicate_set.hash
+        assert file_info2.hash is duplicate_set.hash
+
     def test_add_file_different_hash(self):
         """Testa a adição de um arquivo com hash diferente (deve lançar ValueError)."""
         # Arrange
@@ -279,3 +321,30 @@ class TestDuplicateSet:
         # Act & Assert
         with pytest.raises(ValueError):
             duplicate_set.add_file(file_info2)
+
+    def test_add_files(self):
+        """Testa a adição de vários arquivos de uma só vez."""
+        # Arrange
+        duplicate_set = DuplicateSet()
+        files = [FileInfo(path=Path(f"/test/file{i}.txt"), size=1024, hash="abc123") for i in range(3)]
+
+        # Act
+        duplicate_set.add_files(files)
+
+        # Assert
+        assert duplicate_set.files == files
+        assert duplicate_set.hash == "abc123"
+        assert all(f.hash is duplicate_set.hash for f in files)
+
+    def test_add_files_different_hash(self):
+        """Testa se add_files lança ValueError para um arquivo com hash diferente."""
+        # Arrange
+        duplicate_set = DuplicateSet()
+        files = [
+            FileInfo(path=Path("/test/file1.txt"), size=1024, hash="abc123"),
+            FileInfo(path=Path("/test/file2.txt"), size=1024, hash="def456"),
+        ]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Arquivo com hash diferente"):
+            duplicate_set.add_files(files)
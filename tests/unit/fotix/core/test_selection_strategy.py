@@ -5,6 +5,7 @@ Este módulo contém testes para verificar o funcionamento correto das
 estratégias de seleção de arquivos duplicados definidas em fotix.core.selection_strategy.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -77,6 +78,45 @@ class TestBaseSelectionStrategy:
         strategy._select_file.assert_called_once_with(duplicate_set)
         assert result == file1
 
+    def test_select_file_to_keep_is_not_timed(self):
+        """Testa se a seleção de um conjunto não imprime o tempo de execução."""
+        # Arrange
+        strategy = MockSelectionStrategy()
+        duplicate_set = DuplicateSet(files=[FileInfo(path=Path("file1.txt"), size=100),
+                                            FileInfo(path=Path("file2.txt"), size=100)],
+                                     hash="abc123")
+
+        # Act
+        with patch('builtins.print') as mock_print:
+            strategy.select_file_to_keep(duplicate_set)
+
+        # Assert
+        mock_print.assert_not_called()
+
+    def test_select_for_all(self):
+        """Testa se select_for_all seleciona um arquivo de cada conjunto, na ordem."""
+        # Arrange
+        strategy = MockSelectionStrategy()
+        set1 = DuplicateSet(files=[FileInfo(path=Path("a1.txt"), size=100),
+                                   FileInfo(path=Path("a2.txt"), size=100)], hash="aaa")
+        set2 = DuplicateSet(files=[FileInfo(path=Path("b1.txt"), size=200)], hash="bbb")
+
+        # Act
+        result = strategy.select_for_all([set1, set2])
+
+        # Assert
+        assert result == [set1.files[0], set2.files[0]]
+
+    def test_select_for_all_empty_set(self):
+        """Testa se select_for_all levanta ValueError quando algum conjunto está vazio."""
+        # Arrange
+        strategy = MockSelectionStrategy()
+        duplicate_set = DuplicateSet(files=[], hash="abc123")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="O conjunto de duplicatas está vazio"):
+            strategy.select_for_all([duplicate_set])
+
     def test_abstract_select_file_method(self):
         """Testa se o método _select_file é abstrato e deve ser implementado pelas subclasses."""
         # Arrange
@@ -156,6 +196,23 @@ class TestCreationDateStrategy:
         # Assert
         assert result == file1  # Deve retornar o primeiro arquivo
 
+    def test_select_tie_keeps_first_file(self):
+        """Testa se, em caso de empate na data de criação, o primeiro arquivo é mantido."""
+        # Arrange
+        strategy = CreationDateStrategy()
+
+        file1 = FileInfo(path=Path("file1.txt"), size=100, creation_time=1600002000)
+        file2 = FileInfo(path=Path("file2.txt"), size=100, creation_time=1600000000)
+        file3 = FileInfo(path=Path("file3.txt"), size=100, creation_time=1600000000)
+
+        duplicate_set = DuplicateSet(files=[file1, file2, file3], hash="abc123")
+
+        # Act
+        result = strategy.select_file_to_keep(duplicate_set)
+
+        # Assert
+        assert result is file2
+
 
 class TestModificationDateStrategy:
     """Testes para a estratégia ModificationDateStrategy."""
@@ -213,6 +270,80 @@ class TestModificationDateStrategy:
         # Assert
         assert result == file1  # Deve retornar o primeiro arquivo
 
+    def test_select_tie_keeps_first_file(self):
+        """Testa se, em caso de empate na data de modificação, o primeiro arquivo é mantido."""
+        # Arrange
+        strategy = ModificationDateStrategy()
+
+        file1 = FileInfo(path=Path("file1.txt"), size=100, modification_time=None)
+        file2 = FileInfo(path=Path("file2.txt"), size=100, modification_time=1600002000)
+        file3 = FileInfo(path=Path("file3.txt"), size=100, modification_time=1600002000)
+
+        duplicate_set = DuplicateSet(files=[file1, file2, file3], hash="abc123")
+
+        # Act
+        result = strategy.select_file_to_keep(duplicate_set)
+
+        # Assert
+        assert result is file2
+
+
+class TestDateStrategiesDebugLogging:
+    """Testes para o registro de debug das estratégias baseadas em data."""
+
+    @pytest.mark.parametrize("strategy_class", [CreationDateStrategy, ModificationDateStrategy])
+    def test_datetime_not_built_when_debug_disabled(self, strategy_class):
+        """Testa que a data não é convertida para datetime com o nível DEBUG desativado."""
+        # Arrange
+        strategy = strategy_class()
+        file1 = FileInfo(path=Path("file1.txt"), size=100, creation_time=1600000000, modification_time=1600000000)
+        file2 = FileInfo(path=Path("file2.txt"), size=100, creation_time=1600001000, modification_time=1600001000)
+        duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
+
+        # Act
+        with patch('fotix.core.selection_strategy.logger') as mock_logger, \
+                patch('fotix.core.models.datetime') as mock_datetime:
+            mock_logger.isEnabledFor.return_value = False
+            strategy._select_file(duplicate_set)
+
+        # Assert
+        mock_logger.debug.assert_not_called()
+        mock_datetime.fromtimestamp.assert_not_called()
+
+
+class TestRankDateStrategies:
+    """Testes para o método _rank das estratégias baseadas em data."""
+
+    def test_creation_date_rank_returns_all_tied(self):
+        """Testa se _rank retorna todos os arquivos empatados na data de criação mais antiga."""
+        # Arrange
+        strategy = CreationDateStrategy()
+        file1 = FileInfo(path=Path("file1.txt"), size=100, creation_time=1600000000)
+        file2 = FileInfo(path=Path("file2.txt"), size=100, creation_time=1600001000)
+        file3 = FileInfo(path=Path("file3.txt"), size=100, creation_time=1600000000)
+        file4 = FileInfo(path=Path("file4.txt"), size=100, creation_time=None)
+        duplicate_set = DuplicateSet(files=[file1, file2, file3, file4], hash="abc123")
+
+        # Act
+        result = strategy._rank(duplicate_set)
+
+        # Assert
+        assert result == [file1, file3]
+
+    def test_modification_date_rank_without_dates(self):
+        """Testa se _rank mantém todos os arquivos quando nenhum tem data de modificação."""
+        # Arrange
+        strategy = ModificationDateStrategy()
+        file1 = FileInfo(path=Path("file1.txt"), size=100)
+        file2 = FileInfo(path=Path("file2.txt"), size=100)
+        duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
+
+        # Act
+        result = strategy._rank(duplicate_set)
+
+        # Assert
+        assert result == [file1, file2]
+
 
 class TestHighestResolutionStrategy:
     """Testes para a estratégia HighestResolutionStrategy."""
@@ -247,6 +378,116 @@ class TestHighestResolutionStrategy:
         # Assert
         assert result == file2
 
+    def test_select_uses_cached_resolution(self):
+        """Testa se a estratégia usa a resolução já registrada no FileInfo sem reabrir a imagem."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        file1 = FileInfo(path=Path("image1.jpg"), size=100, resolution=(800, 600))
+        file2 = FileInfo(path=Path("image2.jpg"), size=100, resolution=(1920, 1080))
+
+        duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
+
+        # Act
+        with patch('fotix.core.selection_strategy.get_image_resolution') as mock_get_resolution:
+            result = strategy.select_file_to_keep(duplicate_set)
+
+        # Assert
+        assert result is file2
+        mock_get_resolution.assert_not_called()
+
+    def test_select_for_all_prefetches_resolutions(self):
+        """Testa se select_for_all lê as resoluções de todos os conjuntos, uma vez por imagem."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        small = FileInfo(path=Path("small.jpg"), size=100)
+        large = FileInfo(path=Path("large.jpg"), size=100)
+        cached = FileInfo(path=Path("cached.jpg"), size=100, resolution=(640, 480))
+        other1 = FileInfo(path=Path("other1.jpg"), size=200)
+        other2 = FileInfo(path=Path("other2.jpg"), size=200)
+        set1 = DuplicateSet(files=[small, large, cached], hash="abc123")
+        set2 = DuplicateSet(files=[other1, other2], hash="def456")
+        resolutions = {small.path: (800, 600), large.path: (1920, 1080),
+                       other1.path: (640, 480), other2.path: (1280, 720)}
+
+        # Act
+        with patch('fotix.core.selection_strategy.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as mock_executor, \
+                patch('fotix.core.selection_strategy.get_image_resolution',
+                      side_effect=lambda path: resolutions[path]) as mock_get_resolution:
+            result = strategy.select_for_all([set1, set2])
+
+        # Assert
+        assert result == [large, other2]
+        assert mock_get_resolution.call_count == 4
+        assert mock_executor.call_count == 1
+        assert small.resolution == (800, 600)
+
+    def test_select_for_all_does_not_reread_failed_resolution(self):
+        """Testa se uma imagem cuja resolução não pôde ser lida não é lida novamente."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        broken = FileInfo(path=Path("broken.jpg"), size=100)
+        good = FileInfo(path=Path("good.jpg"), size=100)
+        duplicate_set = DuplicateSet(files=[broken, good], hash="abc123")
+
+        # Act
+        with patch('fotix.core.selection_strategy.get_image_resolution',
+                   side_effect=lambda path: None if path == broken.path else (800, 600)
+                   ) as mock_get_resolution:
+            result = strategy.select_for_all([duplicate_set])
+
+        # Assert
+        assert result == [good]
+        assert mock_get_resolution.call_count == 2
+        assert strategy._unreadable_images == set()
+
+    def test_select_file_to_keep_reads_serially(self):
+        """Testa se a seleção de um único conjunto lê as resoluções sem criar um pool de threads."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        file1 = FileInfo(path=Path("image1.jpg"), size=100)
+        file2 = FileInfo(path=Path("image2.jpg"), size=100)
+        duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
+
+        # Act
+        with patch('fotix.core.selection_strategy.ThreadPoolExecutor') as mock_executor, \
+                patch('fotix.core.selection_strategy.get_image_resolution',
+                      side_effect=lambda path: (1920, 1080) if path == file2.path else (800, 600)):
+            result = strategy.select_file_to_keep(duplicate_set)
+
+        # Assert
+        assert result is file2
+        mock_executor.assert_not_called()
+
+    def test_rank_returns_all_tied(self):
+        """Testa se _rank retorna todas as imagens empatadas na maior resolução."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        file1 = FileInfo(path=Path("image1.jpg"), size=100, resolution=(1920, 1080))
+        file2 = FileInfo(path=Path("image2.jpg"), size=100, resolution=(800, 600))
+        file3 = FileInfo(path=Path("image3.jpg"), size=100, resolution=(1920, 1080))
+        duplicate_set = DuplicateSet(files=[file1, file2, file3], hash="abc123")
+
+        # Act
+        result = strategy._rank(duplicate_set)
+
+        # Assert
+        assert result == [file1, file3]
+
+    def test_rank_without_images_keeps_all(self):
+        """Testa se _rank mantém todos os arquivos quando não há imagens."""
+        # Arrange
+        strategy = HighestResolutionStrategy(file_system_service=MagicMock())
+        file1 = FileInfo(path=Path("doc1.txt"), size=100)
+        file2 = FileInfo(path=Path("doc2.txt"), size=100)
+        duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
+
+        # Act
+        result = strategy._rank(duplicate_set)
+
+        # Assert
+        assert result == [file1, file2]
+
     def test_select_with_non_image_files(self):
         """Testa o comportamento quando não há arquivos de imagem."""
         # Arrange
@@ -400,6 +641,21 @@ class TestShortestNameStrategy:
         # Assert
         assert result == file2
 
+    def test_rank_returns_all_tied(self):
+        """Testa se _rank retorna todos os arquivos empatados com o nome mais curto."""
+        # Arrange
+        strategy = ShortestNameStrategy()
+        file1 = FileInfo(path=Path("ab.txt"), size=100)
+        file2 = FileInfo(path=Path("abcd.txt"), size=100)
+        file3 = FileInfo(path=Path("cd.txt"), size=100)
+        duplicate_set = DuplicateSet(files=[file1, file2, file3], hash="abc123")
+
+        # Act
+        result = strategy._rank(duplicate_set)
+
+        # Assert
+        assert result == [file1, file3]
+
 
 class TestCompositeStrategy:
     """Testes para a estratégia CompositeStrategy."""
@@ -413,10 +669,13 @@ class TestCompositeStrategy:
     def test_apply_multiple_strategies_single_result(self):
         """Testa se a estratégia composta aplica várias estratégias em sequência e para quando uma estratégia retorna um único resultado."""
         # Arrange
+        file1 = FileInfo(path=Path("file1.txt"), size=100)
+        file2 = FileInfo(path=Path("file2.txt"), size=100)
+
         # Criar estratégias mock
         strategy1 = MagicMock()
         strategy1.name = "Strategy1"
-        strategy1._select_file.return_value = FileInfo(path=Path("file1.txt"), size=100)
+        strategy1._rank.return_value = [file1]
 
         strategy2 = MagicMock()
         strategy2.name = "Strategy2"
@@ -424,70 +683,109 @@ class TestCompositeStrategy:
         composite = CompositeStrategy([strategy1, strategy2])
 
         # Criar conjunto de duplicatas
-        file1 = FileInfo(path=Path("file1.txt"), size=100)
-        file2 = FileInfo(path=Path("file2.txt"), size=100)
         duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
 
         # Act
         result = composite._select_file(duplicate_set)
 
         # Assert
-        strategy1._select_file.assert_called_once()
-        strategy2._select_file.assert_not_called()  # Não deve ser chamada porque strategy1 já reduziu para um arquivo
+        strategy1._rank.assert_called_once()
+        strategy2._rank.assert_not_called()  # Não deve ser chamada porque strategy1 já reduziu para um arquivo
         assert result == file1
 
     def test_apply_multiple_strategies_continue(self):
-        """Testa se a estratégia composta continua aplicando estratégias quando a primeira não reduz o conjunto."""
+        """Testa se a estratégia composta continua aplicando estratégias quando a primeira deixa arquivos empatados."""
         # Arrange
-        # Criar estratégias mock que retornam arquivos diferentes
         file1 = FileInfo(path=Path("file1.txt"), size=100)
         file2 = FileInfo(path=Path("file2.txt"), size=100)
+        file3 = FileInfo(path=Path("file3.txt"), size=100)
 
         strategy1 = MagicMock()
         strategy1.name = "Strategy1"
-        strategy1._select_file.return_value = file1
+        strategy1._rank.return_value = [file2, file3]  # Empate entre dois arquivos
 
         strategy2 = MagicMock()
         strategy2.name = "Strategy2"
-        strategy2._select_file.return_value = file2
-
-        # Configurar o comportamento para que a primeira estratégia não reduza o conjunto
-        # (simulando que ela retorna um arquivo, mas ainda há mais arquivos a considerar)
+        strategy2._rank.return_value = [file3]
 
         composite = CompositeStrategy([strategy1, strategy2])
+        duplicate_set = DuplicateSet(files=[file1, file2, file3], hash="abc123")
+
+        # Act
+        result = composite._select_file(duplicate_set)
+
+        # Assert
+        strategy1._rank.assert_called_once()
+        strategy2._rank.assert_called_once()
+        # A segunda estratégia só considera os arquivos empatados na primeira
+        assert strategy2._rank.call_args[0][0].files == [file2, file3]
+        assert result == file3
 
-        # Criar conjunto de duplicatas com vários arquivos
+    def test_tie_remaining_after_all_strategies(self):
+        """Testa se o primeiro arquivo restante é mantido quando o empate persiste."""
+        # Arrange
+        strategy = ModificationDateStrategy()
+        composite = CompositeStrategy([strategy])
+        file1 = FileInfo(path=Path("file1.txt"), size=100, modification_time=1600000000)
+        file2 = FileInfo(path=Path("file2.txt"), size=100, modification_time=1600000000)
         duplicate_set = DuplicateSet(files=[file1, file2], hash="abc123")
 
-        # Modificar o comportamento interno para simular que a primeira estratégia não reduziu o conjunto
-        # Isso é feito substituindo o método interno que verifica o tamanho da lista
-        original_len = len
-        try:
-            # Mock da função len para retornar 2 na primeira chamada (após strategy1) e 1 na segunda (após strategy2)
-            call_count = [0]
-            def mock_len(obj):
-                if isinstance(obj, list) and obj == [file1]:
-                    call_count[0] += 1
-                    if call_count[0] == 1:
-                        return 2  # Simula que ainda há mais de um arquivo
-                return original_len(obj)
-
-            # Substituir temporariamente a função len
-            import builtins
-            original_len_func = builtins.len
-            builtins.len = mock_len
+        # Act
+        result = composite._select_file(duplicate_set)
 
-            # Act
-            result = composite._select_file(duplicate_set)
+        # Assert
+        assert result is file1
+
+    def test_real_strategies_break_ties(self):
+        """Testa se estratégias reais desempatam: mesma data de modificação, nome mais curto vence."""
+        # Arrange
+        composite = CompositeStrategy([ModificationDateStrategy(), ShortestNameStrategy()])
+        older = FileInfo(path=Path("a.txt"), size=100, modification_time=1500000000)
+        long_name = FileInfo(path=Path("copia_de_foto.txt"), size=100, modification_time=1600000000)
+        short_name = FileInfo(path=Path("foto.txt"), size=100, modification_time=1600000000)
+        duplicate_set = DuplicateSet(files=[older, long_name, short_name], hash="abc123")
+
+        # Act
+        result = composite.select_file_to_keep(duplicate_set)
+
+        # Assert
+        assert result is short_name
 
-            # Assert
-            strategy1._select_file.assert_called_once()
-            strategy2._select_file.assert_called_once()  # Deve ser chamada porque simulamos que strategy1 não reduziu o conjunto
-            assert result == file1
+    def test_prefetch_only_when_a_strategy_reads_resolution(self):
+        """Testa se a leitura antecipada ocorre apenas quando alguma estratégia usa a resolução."""
+        # Arrange
+        with_resolution = CompositeStrategy([
+            HighestResolutionStrategy(file_system_service=MagicMock()), ShortestNameStrategy()])
+        without_resolution = CompositeStrategy([ModificationDateStrategy(), ShortestNameStrategy()])
+        files = [FileInfo(path=Path("a.jpg"), size=100), FileInfo(path=Path("b.jpg"), size=100)]
+
+        # Act
+        with patch('fotix.core.selection_strategy.get_image_resolution',
+                   return_value=(800, 600)) as mock_get_resolution:
+            without_resolution._prefetch([DuplicateSet(files=files, hash="abc123")])
+            calls_without = mock_get_resolution.call_count
+            with_resolution._prefetch([DuplicateSet(files=files, hash="abc123")])
+
+        # Assert
+        assert calls_without == 0
+        assert mock_get_resolution.call_count == 2
+        assert all(f.resolution == (800, 600) for f in files)
 
-        finally:
-            # Restaurar a função len original
-            builtins.len = original_len_func
+    def test_select_for_all_does_not_reread_failed_resolution(self):
+        """Testa se as falhas de leitura da estratégia composta valem para as estratégias internas."""
+        # Arrange
+        strategy = CompositeStrategy([
+            HighestResolutionStrategy(file_system_service=MagicMock()), ShortestNameStrategy()])
+        files = [FileInfo(path=Path("a.jpg"), size=100), FileInfo(path=Path("bb.jpg"), size=100)]
+
+        # Act
+        with patch('fotix.core.selection_strategy.get_image_resolution',
+                   return_value=None) as mock_get_resolution:
+            result = strategy.select_for_all([DuplicateSet(files=files, hash="abc123")])
+
+        # Assert
+        assert result == [files[0]]
+        assert mock_get_resolution.call_count == 2
 
 
 class TestCreateStrategy:
@@ -5,6 +5,7 @@ Este módulo contém testes para a implementação do serviço de backup,
 verificando a criação, listagem, restauração e exclusão de backups.
 """
 
+import io
 import json
 import os
 import shutil
@@ -16,8 +17,11 @@ from unittest import mock
 
 import pytest
 
+from fotix.application.services.backup_restore_service import BackupRestoreService
 from fotix.core.models import FileInfo
+from fotix.infrastructure import backup as backup_module
 from fotix.infrastructure.backup import BackupService
+from fotix.infrastructure.file_system import FileSystemService
 
 
 @pytest.fixture
@@ -268,6 +272,36 @@ def test_restore_backup_to_original_location(backup_service, existing_backup, te
         assert file_path.exists()
 
 
+def test_restore_backup_to_broken_symlink(backup_service, existing_backup, temp_dir):
+    """
+    Testa se a restauração para um diretório alvo que é um link simbólico
+    quebrado falha sem criar o destino do link.
+
+    FileSystemService.path_exists considera o link quebrado existente (lstat),
+    então o diretório alvo não é criado pelo BackupRestoreService e o erro vem
+    da própria restauração.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+        temp_dir: Diretório temporário.
+    """
+    missing_dir = temp_dir / "missing"
+    restore_dir = temp_dir / "restore"
+    try:
+        restore_dir.symlink_to(missing_dir, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Links simbólicos não suportados")
+
+    restore_service = BackupRestoreService(backup_service, FileSystemService())
+
+    with pytest.raises(IOError):
+        restore_service.restore_backup(existing_backup, restore_dir)
+
+    assert restore_dir.is_symlink()
+    assert not missing_dir.exists()
+
+
 def test_restore_nonexistent_backup(backup_service):
     """
     Testa a restauração de um backup inexistente.
@@ -289,9 +323,11 @@ def test_delete_backup(backup_service, existing_backup):
     """
     # Verificar que o backup existe
     metadata_path = backup_service.metadata_dir / f"{existing_backup}.json"
+    summary_path = backup_service.metadata_dir / f"{existing_backup}.summary.json"
     backup_files_dir = backup_service.files_dir / existing_backup
 
     assert metadata_path.exists()
+    assert summary_path.exists()
     assert backup_files_dir.exists()
 
     # Excluir o backup
@@ -299,6 +335,7 @@ def test_delete_backup(backup_service, existing_backup):
 
     # Verificar que o backup foi removido
     assert not metadata_path.exists()
+    assert not summary_path.exists()
     assert not backup_files_dir.exists()
 
     # Verificar que o backup não aparece mais na listagem
@@ -342,6 +379,80 @@ def test_backup_with_file_system_service(mock_config, test_files):
     assert metadata_path.exists()
 
 
+def test_create_backup_copies_same_hash_once(mock_config, temp_dir):
+    """
+    Testa se arquivos com o mesmo hash são copiados uma única vez, mas todos registrados.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    mock_fs = mock.MagicMock()
+    backup_service = BackupService(file_system_service=mock_fs)
+
+    files = []
+    for i in range(3):
+        file_path = temp_dir / f"duplicata_{i}.jpg"
+        file_path.write_text("mesmo conteudo")
+        files.append((file_path, FileInfo(path=file_path, size=14, hash="hash_igual")))
+
+    backup_id = backup_service.create_backup(files)
+
+    assert mock_fs.copy_file.call_count == 1
+    metadata_path = backup_service.metadata_dir / f"{backup_id}.json"
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    assert [entry["original_path"] for entry in metadata["files"]] == [str(path) for path, _ in files]
+    assert metadata["total_size"] == 3 * 14
+
+
+def test_create_backup_parallel_preserves_order(mock_config, temp_dir):
+    """
+    Testa se a cópia paralela mantém os metadados na ordem dos arquivos fornecidos.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService(max_parallel_copies=4)
+
+    files = []
+    for i in range(20):
+        file_path = temp_dir / f"arquivo_{i}.txt"
+        file_path.write_text(f"conteudo {i}")
+        files.append((file_path, FileInfo(path=file_path, size=file_path.stat().st_size, hash=f"hash_{i}")))
+
+    backup_id = backup_service.create_backup(files)
+
+    metadata_path = backup_service.metadata_dir / f"{backup_id}.json"
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    assert [entry["original_path"] for entry in metadata["files"]] == [str(path) for path, _ in files]
+    for entry in metadata["files"]:
+        assert (backup_service.files_dir / backup_id / entry["backup_filename"]).exists()
+
+
+def test_create_backup_uses_concurrency_service(mock_config, test_files):
+    """
+    Testa se as cópias são submetidas ao serviço de concorrência fornecido.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mock_concurrency = mock.MagicMock()
+        mock_concurrency.submit_background_task.side_effect = executor.submit
+        backup_service = BackupService(concurrency_service=mock_concurrency)
+
+        backup_id = backup_service.create_backup(test_files)
+
+    assert mock_concurrency.submit_background_task.call_count == len(test_files)
+    assert (backup_service.metadata_dir / f"{backup_id}.json").exists()
+
+
 def test_create_backup_error_handling(mock_config, test_files):
     """
     Testa o tratamento de erros durante a criação de backup.
@@ -385,6 +496,116 @@ def test_list_backups_error_handling(mock_config):
     assert isinstance(backups, list)
 
 
+def test_list_backups_reuses_cached_metadata(backup_service, existing_backup, monkeypatch):
+    """
+    Testa que list_backups não reprocessa metadados inalterados.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    first = backup_service.list_backups()
+
+    def fail_loads(data):
+        raise AssertionError("metadados não deveriam ser lidos novamente")
+
+    monkeypatch.setattr(backup_module, "_loads_metadata", fail_loads)
+    second = backup_service.list_backups()
+
+    assert second == first
+    # O resumo retornado é uma cópia; alterá-lo não afeta o cache
+    second[0]["file_count"] = -1
+    assert backup_service.list_backups() == first
+
+
+def test_list_backups_reparses_modified_metadata(backup_service, existing_backup):
+    """
+    Testa que list_backups relê metadados cujo mtime mudou e descarta entradas removidas.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+    """
+    backup_service.list_backups()
+    summary_path = backup_service.metadata_dir / f"{existing_backup}.summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary["file_count"] = 99
+    summary_path.write_text(json.dumps(summary), encoding="utf-8")
+    stat = summary_path.stat()
+    os.utime(summary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    backups = backup_service.list_backups()
+
+    assert next(b for b in backups if b["id"] == existing_backup)["file_count"] == 99
+
+    backup_service.delete_backup(existing_backup)
+    assert summary_path.name not in backup_service._meta_cache
+    assert all(b["id"] != existing_backup for b in backup_service.list_backups())
+
+
+def test_create_backup_writes_summary(backup_service, existing_backup):
+    """
+    Testa que a criação do backup grava um arquivo de resumo sem a lista de arquivos.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+    """
+    summary_path = backup_service.metadata_dir / f"{existing_backup}.summary.json"
+    metadata_path = backup_service.metadata_dir / f"{existing_backup}.json"
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+
+    assert summary == {
+        "id": existing_backup,
+        "date": metadata["date"],
+        "file_count": metadata["file_count"],
+        "total_size": metadata["total_size"],
+    }
+
+
+def test_list_backups_reads_only_summaries(backup_service, existing_backup, monkeypatch):
+    """
+    Testa que list_backups não lê os metadados completos quando há resumo.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    original_read_bytes = Path.read_bytes
+
+    def mock_read_bytes(self):
+        assert self.name.endswith(".summary.json"), f"leitura inesperada: {self}"
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", mock_read_bytes)
+
+    backups = backup_service.list_backups()
+
+    assert [b["id"] for b in backups] == [existing_backup]
+
+
+def test_list_backups_regenerates_missing_summary(backup_service, existing_backup):
+    """
+    Testa que um backup sem resumo é listado e tem o resumo regenerado.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+    """
+    summary_path = backup_service.metadata_dir / f"{existing_backup}.summary.json"
+    expected = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary_path.unlink()
+
+    backups = backup_service.list_backups()
+
+    assert backups == [expected]
+    assert json.loads(summary_path.read_text(encoding="utf-8")) == expected
+
+
 def test_restore_backup_with_file_system_service(backup_service, existing_backup, temp_dir):
     """
     Testa a restauração de backup usando um serviço de sistema de arquivos mockado.
@@ -539,12 +760,12 @@ def test_create_backup_copy_error(mock_config, test_files, monkeypatch):
     # Criar serviço de backup
     backup_service = BackupService()
 
-    # Mock da função shutil.copy2 para lançar exceção
+    # Mock da função de cópia para lançar exceção
     def mock_copy2(*args, **kwargs):
         raise IOError("Erro ao copiar arquivo")
 
     # Aplicar o mock
-    monkeypatch.setattr("shutil.copy2", mock_copy2)
+    monkeypatch.setattr("fotix.infrastructure.backup.fast_copy", mock_copy2)
 
     # Tentar criar backup (deve lançar IOError)
     with pytest.raises(IOError):
@@ -697,7 +918,7 @@ def test_create_backup_cleanup_error(mock_config, test_files, monkeypatch):
         backup_service.create_backup(test_files)
 
 
-def test_list_backups_glob_error(backup_service, monkeypatch):
+def test_list_backups_scandir_error(backup_service, monkeypatch):
     """
     Testa o tratamento de erros ao listar backups quando ocorre uma exceção.
 
@@ -705,14 +926,12 @@ def test_list_backups_glob_error(backup_service, monkeypatch):
         backup_service: Instância do serviço de backup.
         monkeypatch: Fixture do pytest para modificar objetos.
     """
-    # Mock do método glob para lançar exceção
-    original_glob = Path.glob
-
-    def mock_glob(self, pattern):
+    # Mock de os.scandir para lançar exceção
+    def mock_scandir(path):
         raise Exception("Erro ao listar arquivos")
 
     # Aplicar o mock
-    monkeypatch.setattr(Path, "glob", mock_glob)
+    monkeypatch.setattr(backup_module.os, "scandir", mock_scandir)
 
     # Listar backups (deve retornar lista vazia em caso de erro)
     backups = backup_service.list_backups()
@@ -796,12 +1015,12 @@ def test_restore_backup_file_not_found(backup_service, existing_backup, temp_dir
         temp_dir: Diretório temporário.
         monkeypatch: Fixture do pytest para modificar objetos.
     """
-    # Mock da função shutil.copy2 para lançar FileNotFoundError
+    # Mock da função de cópia para lançar FileNotFoundError
     def mock_copy2(src, dst, *args, **kwargs):
         raise FileNotFoundError(f"Arquivo não encontrado: {src}")
 
     # Aplicar o mock
-    monkeypatch.setattr("shutil.copy2", mock_copy2)
+    monkeypatch.setattr("fotix.infrastructure.backup.fast_copy", mock_copy2)
 
     # Tentar restaurar backup (deve lançar FileNotFoundError)
     with pytest.raises(FileNotFoundError):
@@ -818,12 +1037,12 @@ def test_restore_backup_unexpected_error(backup_service, existing_backup, temp_d
         temp_dir: Diretório temporário.
         monkeypatch: Fixture do pytest para modificar objetos.
     """
-    # Mock da função shutil.copy2 para lançar uma exceção inesperada
+    # Mock da função de cópia para lançar uma exceção inesperada
     def mock_copy2(src, dst, *args, **kwargs):
         raise RuntimeError("Erro inesperado durante a cópia")
 
     # Aplicar o mock
-    monkeypatch.setattr("shutil.copy2", mock_copy2)
+    monkeypatch.setattr("fotix.infrastructure.backup.fast_copy", mock_copy2)
 
     # Tentar restaurar backup (deve lançar IOError)
     with pytest.raises(IOError):
@@ -849,3 +1068,502 @@ def test_delete_backup_rmtree_error(backup_service, existing_backup, monkeypatch
     # Tentar excluir backup (deve lançar IOError)
     with pytest.raises(IOError):
         backup_service.delete_backup(existing_backup)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_metadata_roundtrip(use_orjson, monkeypatch):
+    """
+    Testa a serialização dos metadados com e sem orjson.
+
+    Args:
+        use_orjson: Se False, simula a ausência do orjson.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    if not use_orjson:
+        monkeypatch.setattr(backup_module, "orjson", None)
+    metadata = {"id": "abc", "date": "2025-01-01T00:00:00", "files": [{"size": 10, "hash": None}]}
+
+    data = backup_module._dumps_metadata(metadata)
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == metadata
+    assert backup_module._loads_metadata(data) == metadata
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("entries", [
+    [],
+    [{"original_path": "/a/ção.txt", "size": 10, "hash": "abc"},
+     {"original_path": "/b.txt", "size": 5, "hash": None}],
+])
+def test_write_metadata_stream(entries, use_orjson, pretty, monkeypatch):
+    """
+    Testa que a gravação incremental produz o mesmo documento JSON dos metadados completos.
+
+    Args:
+        entries: Entradas de arquivo gravadas.
+        use_orjson: Se False, simula a ausência do orjson.
+        pretty: Se o documento deve ser indentado.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    if not use_orjson:
+        monkeypatch.setattr(backup_module, "orjson", None)
+    buffer = io.BytesIO()
+
+    file_count, total_size = backup_module._write_metadata_stream(
+        buffer, {"id": "abc", "date": "2025-01-01T00:00:00"}, iter(entries), pretty=pretty)
+
+    expected = {
+        "id": "abc",
+        "date": "2025-01-01T00:00:00",
+        "files": entries,
+        "file_count": file_count,
+        "total_size": total_size,
+    }
+    assert (file_count, total_size) == (len(entries), sum(e["size"] for e in entries))
+    assert json.loads(buffer.getvalue()) == expected
+    if not pretty:
+        # Compacto: idêntico à serialização do documento inteiro, sem espaços
+        assert buffer.getvalue() == backup_module._dumps_metadata(expected)
+        assert b"\n" not in buffer.getvalue()
+
+
+def test_create_backup_removes_partial_metadata(mock_config, test_files, monkeypatch):
+    """
+    Testa que um arquivo de metadados parcial é removido se a gravação falhar.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    backup_service = BackupService()
+
+    def failing_stream(f, header, entries, pretty=False):
+        f.write(b'{"id": ')
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(backup_module, "_write_metadata_stream", failing_stream)
+
+    with pytest.raises(IOError):
+        backup_service.create_backup(test_files)
+
+    assert list(backup_service.metadata_dir.iterdir()) == []
+
+
+def test_create_backup_reuses_pool_content(mock_config, temp_dir, monkeypatch):
+    """
+    Testa que um conteúdo já guardado por outro backup é ligado, e não copiado.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_text("conteudo da foto")
+    files = [(file_path, FileInfo(path=file_path, size=16, hash="abcdef",
+                                  modification_time=os.path.getmtime(file_path)))]
+
+    first_id = backup_service.create_backup(files)
+
+    copy_calls = []
+    monkeypatch.setattr(backup_module, "fast_copy", lambda *args: copy_calls.append(args))
+    second_id = backup_service.create_backup(files)
+
+    first_file = backup_service.files_dir / first_id / "abcdef.jpg"
+    second_file = backup_service.files_dir / second_id / "abcdef.jpg"
+    pool_file = backup_service.pool_dir / "ab" / "abcdef.jpg"
+    assert copy_calls == []
+    assert second_file.read_text() == "conteudo da foto"
+    assert os.path.samefile(first_file, second_file)
+    assert os.path.samefile(first_file, pool_file)
+
+
+def test_delete_backup_prunes_unused_pool_content(mock_config, temp_dir):
+    """
+    Testa que o repositório só descarta conteúdos sem nenhum backup que os use.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_text("conteudo da foto")
+    files = [(file_path, FileInfo(path=file_path, size=16, hash="abcdef",
+                                  modification_time=os.path.getmtime(file_path)))]
+    first_id = backup_service.create_backup(files)
+    second_id = backup_service.create_backup(files)
+    pool_file = backup_service.pool_dir / "ab" / "abcdef.jpg"
+
+    backup_service.delete_backup(first_id)
+    assert pool_file.exists()
+
+    backup_service.delete_backup(second_id)
+    assert not pool_file.exists()
+
+
+def test_create_backup_ignores_stale_pool_content(mock_config, temp_dir):
+    """
+    Testa que um arquivo alterado desde a varredura não reaproveita o conteúdo do repositório.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_text("conteudo da foto")
+    files = [(file_path, FileInfo(path=file_path, size=16, hash="abcdef",
+                                  modification_time=os.path.getmtime(file_path)))]
+    first_id = backup_service.create_backup(files)
+
+    # O arquivo muda, mas o FileInfo (e o hash) continua o da varredura
+    file_path.write_text("conteudo editado!")
+    os.utime(file_path, (1_000_000_000, 1_000_000_000))
+    second_id = backup_service.create_backup(files)
+
+    first_file = backup_service.files_dir / first_id / "abcdef.jpg"
+    second_file = backup_service.files_dir / second_id / "abcdef.jpg"
+    pool_file = backup_service.pool_dir / "ab" / "abcdef.jpg"
+    assert second_file.read_text() == "conteudo editado!"
+    assert not os.path.samefile(first_file, second_file)
+    assert pool_file.read_text() == "conteudo da foto"
+
+
+def test_create_backup_failure_prunes_pool(mock_config, temp_dir, monkeypatch):
+    """
+    Testa que um backup que falha não deixa conteúdos órfãos no repositório.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_text("conteudo da foto")
+    files = [(file_path, FileInfo(path=file_path, size=16, hash="abcdef",
+                                  modification_time=os.path.getmtime(file_path))),
+             (temp_dir / "ausente.jpg", FileInfo(path=temp_dir / "ausente.jpg", size=1))]
+
+    def failing_stream(f, header, entries, pretty=False):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(backup_module, "_write_metadata_stream", failing_stream)
+
+    with pytest.raises(IOError):
+        backup_service.create_backup(files)
+
+    assert list(backup_service.files_dir.iterdir()) == [backup_service.pool_dir]
+    assert list(backup_service.pool_dir.rglob("*.jpg")) == []
+
+
+@pytest.mark.parametrize("restore_with_hardlinks", [True, False])
+def test_restore_backup_with_hardlinks(mock_config, test_files, temp_dir, restore_with_hardlinks):
+    """
+    Testa que a restauração só cria hardlinks para o backup quando habilitada.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste originais.
+        temp_dir: Diretório temporário.
+        restore_with_hardlinks: Valor da opção do serviço.
+    """
+    backup_service = BackupService(restore_with_hardlinks=restore_with_hardlinks)
+    # Sem hash, o conteúdo não vai para o repositório e pertence só a este backup
+    files = [(file_path, FileInfo(path=file_path, size=file_info.size))
+             for file_path, file_info in test_files]
+    backup_id = backup_service.create_backup(files)
+    backup_files = {
+        path.read_text(encoding='utf-8'): path
+        for path in (backup_service.files_dir / backup_id).iterdir()
+    }
+    restore_dir = temp_dir / "restore"
+    restore_dir.mkdir()
+
+    backup_service.restore_backup(backup_id, restore_dir)
+
+    for file_path, _ in files:
+        restored_path = restore_dir / file_path.name
+        content = file_path.read_text(encoding='utf-8')
+        assert restored_path.read_text(encoding='utf-8') == content
+        assert os.path.samefile(restored_path, backup_files[content]) == restore_with_hardlinks
+
+
+def test_restore_backup_with_hardlinks_copies_pooled_content(mock_config, test_files, temp_dir):
+    """
+    Testa que conteúdos do repositório são copiados, e não ligados, na restauração.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste originais.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService(restore_with_hardlinks=True)
+    backup_id = backup_service.create_backup(test_files)
+    restore_dir = temp_dir / "restore"
+    restore_dir.mkdir()
+
+    backup_service.restore_backup(backup_id, restore_dir)
+
+    file_path, file_info = test_files[0]
+    restored_path = restore_dir / file_path.name
+    backup_file = backup_service.files_dir / backup_id / f"{file_info.hash}{file_path.suffix}"
+    assert os.path.samefile(backup_file, backup_service._pool_path(backup_file.name))
+    assert not os.path.samefile(restored_path, backup_file)
+
+    # Editar o arquivo restaurado não altera o backup
+    restored_path.write_text("editado", encoding='utf-8')
+    assert backup_file.read_text(encoding='utf-8') == file_path.read_text(encoding='utf-8')
+
+
+def test_restore_backup_with_hardlinks_overwrites_existing(mock_config, test_files, temp_dir):
+    """
+    Testa que, com hardlinks habilitados, um destino existente continua sendo sobrescrito.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste originais.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService(restore_with_hardlinks=True)
+    backup_id = backup_service.create_backup(test_files)
+    restore_dir = temp_dir / "restore"
+    restore_dir.mkdir()
+    file_path = test_files[0][0]
+    (restore_dir / file_path.name).write_text("conteudo antigo", encoding='utf-8')
+
+    backup_service.restore_backup(backup_id, restore_dir)
+
+    assert (restore_dir / file_path.name).read_text(encoding='utf-8') == file_path.read_text(encoding='utf-8')
+
+
+def test_restore_backup_twice_with_hardlinks(mock_config, test_files, temp_dir):
+    """
+    Testa que restaurar o mesmo backup duas vezes com hardlinks não trunca o backup.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste originais.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService(restore_with_hardlinks=True)
+    # Sem hash, os conteúdos não são compartilhados e a restauração cria hardlinks
+    files = [(file_path, FileInfo(path=file_path, size=file_info.size))
+             for file_path, file_info in test_files]
+    backup_id = backup_service.create_backup(files)
+    restore_dir = temp_dir / "restore"
+    restore_dir.mkdir()
+
+    backup_service.restore_backup(backup_id, restore_dir)
+    backup_service.restore_backup(backup_id, restore_dir)
+
+    backup_contents = sorted(
+        path.read_text(encoding='utf-8')
+        for path in (backup_service.files_dir / backup_id).iterdir()
+    )
+    expected = sorted(file_path.read_text(encoding='utf-8') for file_path, _ in files)
+    assert backup_contents == expected
+    for file_path, _ in files:
+        restored_path = restore_dir / file_path.name
+        assert restored_path.read_text(encoding='utf-8') == file_path.read_text(encoding='utf-8')
+
+
+def test_copy_executor_reused_between_backups(mock_config, test_files):
+    """
+    Testa que o pool de cópias próprio é mantido entre backups até o shutdown.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste.
+    """
+    backup_service = BackupService(max_parallel_copies=2)
+
+    backup_service.create_backup(test_files)
+    executor = backup_service._copy_executor
+    backup_service.create_backup(test_files)
+
+    assert executor is not None
+    assert backup_service._copy_executor is executor
+
+    backup_service.shutdown()
+    assert backup_service._copy_executor is None
+
+
+def test_create_backup_records_stored_size(mock_config, temp_dir):
+    """
+    Testa que os metadados registram o tamanho copiado, mesmo com FileInfo desatualizado.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_bytes(b"x" * 25)
+    files = [(file_path, FileInfo(path=file_path, size=10, hash="abcdef"))]
+
+    backup_id = backup_service.create_backup(files)
+
+    metadata = json.loads((backup_service.metadata_dir / f"{backup_id}.json").read_text(encoding='utf-8'))
+    assert metadata["files"][0]["size"] == 25
+    assert metadata["total_size"] == 25
+
+
+def test_create_backup_skips_missing_files_without_precheck(mock_config, temp_dir, monkeypatch):
+    """
+    Testa que arquivos inexistentes são ignorados sem consultar exists() antes de copiar.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    backup_service = BackupService()
+    missing = temp_dir / "sumiu.jpg"
+    present = temp_dir / "presente.jpg"
+    present.write_text("mesmo conteudo")
+    files = [
+        (missing, FileInfo(path=missing, size=14, hash="hash_igual")),
+        (present, FileInfo(path=present, size=14, hash="hash_igual")),
+        (temp_dir / "outro.jpg", FileInfo(path=temp_dir / "outro.jpg", size=1, hash="outro")),
+    ]
+    exists_calls = []
+    original_exists = Path.exists
+
+    def tracking_exists(self, *args, **kwargs):
+        exists_calls.append(self)
+        return original_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", tracking_exists)
+
+    backup_id = backup_service.create_backup(files)
+
+    metadata = json.loads((backup_service.metadata_dir / f"{backup_id}.json").read_text(encoding='utf-8'))
+    assert [entry["original_path"] for entry in metadata["files"]] == [str(present)]
+    assert not any(path in exists_calls for path, _ in files)
+
+
+def test_create_backup_pool_hit_with_missing_source(mock_config, temp_dir):
+    """
+    Testa que um arquivo inexistente é ignorado mesmo quando seu conteúdo está no repositório.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService()
+    file_path = temp_dir / "foto.jpg"
+    file_path.write_text("conteudo da foto")
+    files = [(file_path, FileInfo(path=file_path, size=16, hash="abcdef"))]
+    backup_service.create_backup(files)
+    file_path.unlink()
+
+    backup_id = backup_service.create_backup(files)
+
+    metadata = json.loads((backup_service.metadata_dir / f"{backup_id}.json").read_text(encoding='utf-8'))
+    assert metadata["files"] == []
+    assert not (backup_service.files_dir / backup_id / "abcdef.jpg").exists()
+
+
+@pytest.mark.parametrize("debug_enabled", [True, False])
+def test_per_file_debug_logging_is_guarded(backup_service, test_files, temp_dir, debug_enabled):
+    """
+    Testa que as mensagens de debug por arquivo só são formatadas com DEBUG habilitado.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        test_files: Arquivos de teste.
+        temp_dir: Diretório temporário.
+        debug_enabled: Se o nível DEBUG está habilitado no logger.
+    """
+    restore_dir = temp_dir / "restore"
+    with mock.patch.object(backup_module, "logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = debug_enabled
+        backup_id = backup_service.create_backup(test_files)
+        backup_service.restore_backup(backup_id, restore_dir)
+
+    debug_messages = [c.args[0] for c in mock_logger.debug.call_args_list]
+    per_file = [m for m in debug_messages if m.startswith(("Arquivo copiado", "Arquivo restaurado"))]
+    assert len(per_file) == (2 * len(test_files) if debug_enabled else 0)
+
+
+def test_restore_backup_uses_concurrency_service(mock_config, test_files, temp_dir):
+    """
+    Testa se as restaurações são submetidas ao serviço de concorrência fornecido.
+
+    Args:
+        mock_config: Configuração mockada.
+        test_files: Arquivos de teste.
+        temp_dir: Diretório temporário.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    restore_dir = temp_dir / "restore"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mock_concurrency = mock.MagicMock()
+        mock_concurrency.submit_background_task.side_effect = executor.submit
+        backup_service = BackupService(concurrency_service=mock_concurrency)
+        backup_id = backup_service.create_backup(test_files)
+        mock_concurrency.submit_background_task.reset_mock()
+
+        backup_service.restore_backup(backup_id, restore_dir)
+
+    assert mock_concurrency.submit_background_task.call_count == len(test_files)
+    for file_path, _ in test_files:
+        assert (restore_dir / file_path.name).read_text(encoding='utf-8') == file_path.read_text(encoding='utf-8')
+
+
+def test_restore_backup_same_destination_keeps_order(mock_config, temp_dir):
+    """
+    Testa que arquivos com o mesmo nome são restaurados em ordem, prevalecendo o último.
+
+    Args:
+        mock_config: Configuração mockada.
+        temp_dir: Diretório temporário.
+    """
+    backup_service = BackupService(max_parallel_copies=4)
+    files = []
+    for i in range(4):
+        file_path = temp_dir / f"pasta_{i}" / "foto.jpg"
+        file_path.parent.mkdir()
+        file_path.write_text(f"versao {i}")
+        files.append((file_path, FileInfo(path=file_path, size=8, hash=f"hash_{i}")))
+    backup_id = backup_service.create_backup(files)
+    restore_dir = temp_dir / "restore"
+
+    backup_service.restore_backup(backup_id, restore_dir)
+
+    assert (restore_dir / "foto.jpg").read_text() == "versao 3"
+
+
+def test_restore_backup_creates_each_directory_once(backup_service, existing_backup, test_files, monkeypatch):
+    """
+    Testa que a restauração cria cada diretório de destino uma única vez.
+
+    Args:
+        backup_service: Instância do serviço de backup.
+        existing_backup: ID de um backup existente.
+        test_files: Arquivos de teste originais.
+        monkeypatch: Fixture do pytest para modificar objetos.
+    """
+    for file_path, _ in test_files:
+        file_path.unlink()
+    mkdir_calls = []
+    original_mkdir = Path.mkdir
+
+    def tracking_mkdir(self, *args, **kwargs):
+        mkdir_calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+
+    backup_service.restore_backup(existing_backup)
+
+    assert mkdir_calls == [test_files[0][0].parent]
+    for file_path, _ in test_files:
+        assert file_path.exists()
@@ -5,8 +5,10 @@ Este módulo contém testes para verificar o funcionamento correto do Concurrenc
 incluindo execução paralela de tarefas e submissão de tarefas em background.
 """
 
+import threading
 import time
 import pytest
+from functools import partial
 from concurrent.futures import Future
 from unittest.mock import patch, MagicMock
 
@@ -68,6 +70,33 @@ class TestConcurrencyService:
             assert service._max_workers == 4
             mock_cpu_count.assert_called_once()
 
+    @pytest.mark.parametrize("workload_type, cpu_count, expected", [
+        ("cpu", 6, 6),
+        ("disk_io", 2, 4),
+        ("disk_io", 16, 8),
+        ("network_io", 4, 16),
+        ("network_io", 16, 32),
+    ])
+    def test_init_workload_type(self, workload_type, cpu_count, expected):
+        """Testa o dimensionamento automático do pool de threads para cada perfil de carga."""
+        # Arrange
+        with patch('fotix.infrastructure.concurrency.get_config') as mock_get_config, \
+             patch('fotix.infrastructure.concurrency.os.cpu_count') as mock_cpu_count:
+            mock_get_config.return_value = {}  # Sem configuração
+            mock_cpu_count.return_value = cpu_count
+
+            # Act
+            service = ConcurrencyService(workload_type=workload_type)
+
+            # Assert
+            assert service._max_workers == expected
+
+    def test_init_invalid_workload_type(self):
+        """Testa se um perfil de carga desconhecido é rejeitado."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Tipo de carga desconhecido"):
+            ConcurrencyService(workload_type="gpu")
+
     def test_get_executor_thread(self):
         """Testa se o método _get_executor cria um ThreadPoolExecutor quando use_processes=False."""
         # Arrange
@@ -130,6 +159,18 @@ class TestConcurrencyService:
         # Assert
         assert results == []
 
+    def test_run_parallel_single_task_runs_inline(self):
+        """Testa se uma única tarefa é executada na própria thread, sem criar o executor."""
+        # Arrange
+        service = ConcurrencyService()
+
+        # Act
+        results = service.run_parallel([threading.get_ident])
+
+        # Assert
+        assert results == [threading.get_ident()]
+        assert service._executor is None
+
     def test_run_parallel_with_exception(self):
         """Testa se o método run_parallel propaga exceções corretamente."""
         # Arrange
@@ -142,6 +183,59 @@ class TestConcurrencyService:
         with pytest.raises(ValueError, match="Erro de teste"):
             service.run_parallel([task_with_exception])
 
+    @pytest.mark.parametrize("task_count", [1, 2])
+    def test_run_parallel_logs_exception(self, task_count):
+        """Testa se o erro é registrado tanto na execução direta quanto no executor."""
+        # Arrange
+        service = ConcurrencyService(max_workers=2)
+
+        def task_with_exception():
+            raise ValueError("Erro de teste")
+
+        # Act
+        with patch('fotix.infrastructure.concurrency.logger') as mock_logger:
+            with pytest.raises(ValueError, match="Erro de teste"):
+                service.run_parallel([task_with_exception] * task_count)
+        service.shutdown()
+
+        # Assert
+        mock_logger.error.assert_called_once_with("Erro durante execução paralela: Erro de teste")
+
+    def test_run_parallel_with_processes(self):
+        """Testa se o método run_parallel funciona com processos para tasks de nível de módulo."""
+        # Arrange
+        service = ConcurrencyService(max_workers=2, use_processes=True)
+        tasks = [partial(pow, 2, exponent) for exponent in range(4)]
+
+        # Act
+        try:
+            results = service.run_parallel(tasks)
+        finally:
+            service.shutdown()
+
+        # Assert
+        assert results == [1, 2, 4, 8]
+
+    def test_run_parallel_cancels_pending_tasks_on_exception(self):
+        """Testa se o método run_parallel cancela as tarefas pendentes quando uma falha."""
+        # Arrange
+        service = ConcurrencyService(max_workers=1)
+        executed = []
+
+        def failing_task():
+            time.sleep(0.05)  # Garante que as demais tarefas já estejam na fila
+            raise ValueError("Erro de teste")
+
+        def pending_task():
+            time.sleep(0.01)
+            executed.append(True)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Erro de teste"):
+            service.run_parallel([failing_task] + [pending_task] * 50)
+        service.shutdown(wait=True)
+        assert len(executed) < 50
+
     def test_submit_background_task(self):
         """Testa se o método submit_background_task submete uma tarefa e retorna um Future."""
         # Arrange
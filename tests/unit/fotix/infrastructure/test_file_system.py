@@ -5,16 +5,31 @@ Este módulo contém testes para a classe FileSystemService, que implementa
 a interface IFileSystemService para operações no sistema de arquivos.
 """
 
+import errno
 import os
 import shutil
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
-from fotix.infrastructure.file_system import FileSystemService
+from fotix.infrastructure import file_system as fs_module
+from fotix.infrastructure.file_system import FileSystemService, fast_copy
+
+
+def _failing_stat(target, error):
+    """Cria um substituto de os.stat que falha apenas para o caminho informado."""
+    original_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        if Path(path) == target:
+            raise error
+        return original_stat(path, *args, **kwargs)
+
+    return fake_stat
 
 
 class TestFileSystemService:
@@ -59,24 +74,24 @@ class TestFileSystemService:
     def test_get_file_size_permission_error(self, fs_service, temp_file):
         """Testa get_file_size com erro de permissão."""
         # Arrange
-        with mock.patch('pathlib.Path.is_file', return_value=True):
-            with mock.patch('pathlib.Path.stat', side_effect=PermissionError("Sem permissão")):
-                # Act
-                size = fs_service.get_file_size(temp_file)
+        with mock.patch('fotix.infrastructure.file_system.os.stat',
+                        side_effect=_failing_stat(temp_file, PermissionError("Sem permissão"))):
+            # Act
+            size = fs_service.get_file_size(temp_file)
 
-                # Assert
-                assert size is None
+            # Assert
+            assert size is None
 
     def test_get_file_size_generic_error(self, fs_service, temp_file):
         """Testa get_file_size com um erro genérico."""
         # Arrange
-        with mock.patch('pathlib.Path.is_file', return_value=True):
-            with mock.patch('pathlib.Path.stat', side_effect=Exception("Erro genérico")):
-                # Act
-                size = fs_service.get_file_size(temp_file)
+        with mock.patch('fotix.infrastructure.file_system.os.stat',
+                        side_effect=_failing_stat(temp_file, Exception("Erro genérico"))):
+            # Act
+            size = fs_service.get_file_size(temp_file)
 
-                # Assert
-                assert size is None
+            # Assert
+            assert size is None
 
     def test_get_file_size_nonexistent_file(self, fs_service, temp_dir):
         """Testa get_file_size com um arquivo inexistente."""
@@ -92,13 +107,13 @@ class TestFileSystemService:
     def test_get_file_size_file_not_found_error(self, fs_service, temp_file):
         """Testa get_file_size com FileNotFoundError durante stat()."""
         # Arrange
-        with mock.patch('pathlib.Path.is_file', return_value=True):
-            with mock.patch('pathlib.Path.stat', side_effect=FileNotFoundError("Arquivo não encontrado")):
-                # Act
-                size = fs_service.get_file_size(temp_file)
+        with mock.patch('fotix.infrastructure.file_system.os.stat',
+                        side_effect=_failing_stat(temp_file, FileNotFoundError("Arquivo não encontrado"))):
+            # Act
+            size = fs_service.get_file_size(temp_file)
 
-                # Assert
-                assert size is None
+            # Assert
+            assert size is None
 
     def test_get_file_size_directory(self, fs_service, temp_dir):
         """Testa get_file_size com um diretório."""
@@ -120,6 +135,58 @@ class TestFileSystemService:
         # Assert
         assert content == expected_content
 
+    @pytest.mark.parametrize("chunk_size, expected_buffering", [(None, 0), (4096, -1)])
+    def test_stream_file_content_chunking(self, fs_service, temp_dir, chunk_size, expected_buffering):
+        """Testa os blocos lidos e o uso do buffer do Python conforme o tamanho do bloco."""
+        # Arrange
+        big_file = temp_dir / "grande.bin"
+        content = os.urandom(2 * 1024 * 1024 + 123)
+        big_file.write_bytes(content)
+        kwargs = {} if chunk_size is None else {"chunk_size": chunk_size}
+        expected_chunk = chunk_size or 1024 * 1024
+
+        # Act
+        with mock.patch('builtins.open', wraps=open) as mock_open:
+            chunks = list(fs_service.stream_file_content(big_file, **kwargs))
+
+        # Assert
+        assert b''.join(chunks) == content
+        assert all(len(chunk) == expected_chunk for chunk in chunks[:-1])
+        assert mock_open.call_args.kwargs["buffering"] == expected_buffering
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise indisponível")
+    def test_stream_file_content_advises_sequential_access(self, fs_service, temp_file):
+        """Testa se stream_file_content envia as dicas de acesso sequencial ao kernel."""
+        # Act
+        with mock.patch('fotix.infrastructure.file_system.os.posix_fadvise') as mock_fadvise:
+            list(fs_service.stream_file_content(temp_file))
+
+        # Assert
+        advices = [call_args[0][3] for call_args in mock_fadvise.call_args_list]
+        assert advices == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
+    @pytest.mark.skipif(not hasattr(os, 'O_NOATIME'), reason="O_NOATIME indisponível")
+    def test_stream_file_content_opens_with_noatime(self, fs_service, temp_file):
+        """Testa se stream_file_content abre o arquivo com O_NOATIME."""
+        # Act
+        with mock.patch('fotix.infrastructure.file_system.os.open', wraps=os.open) as mock_os_open:
+            content = b''.join(fs_service.stream_file_content(temp_file))
+
+        # Assert
+        assert content == "Conteúdo de teste".encode('utf-8')
+        assert mock_os_open.call_args[0][1] & os.O_NOATIME
+
+    @pytest.mark.skipif(not hasattr(os, 'O_NOATIME'), reason="O_NOATIME indisponível")
+    def test_stream_file_content_noatime_not_permitted(self, fs_service, temp_file):
+        """Testa se o arquivo é aberto normalmente quando O_NOATIME não é permitido."""
+        # Act
+        with mock.patch('fotix.infrastructure.file_system.os.open',
+                        side_effect=PermissionError("Operação não permitida")):
+            content = b''.join(fs_service.stream_file_content(temp_file))
+
+        # Assert
+        assert content == "Conteúdo de teste".encode('utf-8')
+
     def test_stream_file_content_generic_error(self, fs_service, temp_file):
         """Testa stream_file_content com um erro genérico."""
         # Arrange
@@ -217,6 +284,36 @@ class TestFileSystemService:
         assert file2 in files
         assert file3 in files
 
+    def test_list_directory_contents_with_uppercase_extensions(self, fs_service, temp_dir):
+        """Testa se o filtro de extensões ignora maiúsculas/minúsculas."""
+        # Arrange
+        file1 = temp_dir / "file1.txt"
+        file2 = temp_dir / "file2.JPG"
+
+        file1.touch()
+        file2.touch()
+
+        # Act
+        files = list(fs_service.list_directory_contents(temp_dir, file_extensions=['.JPG']))
+
+        # Assert
+        assert files == [file2]
+
+    def test_list_directory_contents_with_mixed_case_extensions(self, fs_service, temp_dir):
+        """Testa se o filtro de extensões aceita nomes com maiúsculas e minúsculas misturadas."""
+        # Arrange
+        file1 = temp_dir / "file1.JpG"
+        file2 = temp_dir / "file2.jpg.txt"
+
+        file1.touch()
+        file2.touch()
+
+        # Act
+        files = list(fs_service.list_directory_contents(temp_dir, file_extensions=['.jpg']))
+
+        # Assert
+        assert files == [file1]
+
     def test_list_directory_contents_nonexistent_directory(self, fs_service, temp_dir):
         """Testa list_directory_contents com um diretório inexistente."""
         # Arrange
@@ -232,7 +329,7 @@ class TestFileSystemService:
         """Testa list_directory_contents com erro de permissão."""
         # Arrange
         with mock.patch('pathlib.Path.is_dir', return_value=True):
-            with mock.patch('pathlib.Path.rglob', side_effect=PermissionError("Sem permissão")):
+            with mock.patch('fotix.infrastructure.file_system.os.scandir', side_effect=PermissionError("Sem permissão")):
                 # Act & Assert
                 with pytest.raises(PermissionError):
                     list(fs_service.list_directory_contents(temp_dir))
@@ -241,17 +338,157 @@ class TestFileSystemService:
         """Testa list_directory_contents com um erro genérico."""
         # Arrange
         with mock.patch('pathlib.Path.is_dir', return_value=True):
-            with mock.patch('pathlib.Path.rglob', side_effect=Exception("Erro genérico")):
+            with mock.patch('fotix.infrastructure.file_system.os.scandir', side_effect=Exception("Erro genérico")):
                 # Act & Assert
                 with pytest.raises(Exception):
                     list(fs_service.list_directory_contents(temp_dir))
 
+    def test_list_directory_contents_does_not_follow_symlinked_dirs(self, fs_service, temp_dir):
+        """Testa se a listagem recursiva não segue links simbólicos para diretórios."""
+        # Arrange
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        file1 = subdir / "file1.jpg"
+        file1.touch()
+        try:
+            (subdir / "loop").symlink_to(temp_dir, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Links simbólicos não suportados")
+
+        # Act
+        files = list(fs_service.list_directory_contents(temp_dir))
+
+        # Assert
+        assert files == [file1]
+
+    def test_list_directory_contents_follows_symlinked_files(self, fs_service, temp_dir):
+        """Testa se links simbólicos para arquivos são listados, e links quebrados não."""
+        # Arrange
+        target = temp_dir / "target.jpg"
+        target.write_bytes(b"conteudo")
+        link = temp_dir / "link.jpg"
+        try:
+            link.symlink_to(target)
+            (temp_dir / "broken.jpg").symlink_to(temp_dir / "missing.jpg")
+        except (OSError, NotImplementedError):
+            pytest.skip("Links simbólicos não suportados")
+
+        # Act
+        files = sorted(fs_service.list_directory_contents(temp_dir))
+
+        # Assert
+        assert files == [link, target]
+
+    def test_list_directory_contents_missing_directory_without_precheck(self, fs_service, temp_dir):
+        """Testa se um diretório inexistente é detectado pelo scandir, sem stat prévio."""
+        # Arrange
+        nonexistent_dir = temp_dir / "nonexistent"
+
+        # Act & Assert
+        with mock.patch('pathlib.Path.is_dir', side_effect=AssertionError("stat desnecessário")), \
+             mock.patch('pathlib.Path.exists', side_effect=AssertionError("stat desnecessário")):
+            with pytest.raises(FileNotFoundError):
+                list(fs_service.list_directory_contents(nonexistent_dir))
+
     def test_list_directory_contents_file(self, fs_service, temp_file):
         """Testa list_directory_contents com um arquivo em vez de diretório."""
         # Act & Assert
         with pytest.raises(NotADirectoryError):
             list(fs_service.list_directory_contents(temp_file))
 
+    def test_list_directory_contents_prefetch_many_directories(self, fs_service, temp_dir):
+        """Testa a listagem recursiva com mais diretórios do que cabem na fila de pré-leitura."""
+        # Arrange
+        expected = []
+        for i in range(20):
+            subdir = temp_dir / f"dir{i}" / "nested"
+            subdir.mkdir(parents=True)
+            file_path = subdir / f"file{i}.jpg"
+            file_path.touch()
+            expected.append(file_path)
+
+        # Act
+        files = list(fs_service.list_directory_contents(temp_dir))
+
+        # Assert
+        assert sorted(files) == sorted(expected)
+
+    def test_list_directory_contents_prefetch_stops_when_abandoned(self, fs_service, temp_dir):
+        """Testa se a thread de pré-leitura termina quando o consumo é interrompido."""
+        # Arrange
+        for i in range(20):
+            subdir = temp_dir / f"dir{i}"
+            subdir.mkdir()
+            (subdir / "file.jpg").touch()
+
+        # Act
+        listing = fs_service.list_directory_contents(temp_dir)
+        next(listing)
+        listing.close()
+
+        # Assert
+        assert not [t for t in threading.enumerate() if t.name == "fotix-scandir-prefetch"]
+
+    def test_scan_directory_with_stat_recursive(self, fs_service, temp_dir):
+        """Testa scan_directory_with_stat retornando o stat de cada arquivo."""
+        # Arrange
+        file1 = temp_dir / "file1.txt"
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        file2 = subdir / "file2.jpg"
+
+        file1.write_bytes(b"a" * 10)
+        file2.write_bytes(b"b" * 20)
+
+        # Act
+        entries = dict(fs_service.scan_directory_with_stat(temp_dir))
+
+        # Assert
+        assert set(entries) == {str(file1), str(file2)}
+        assert entries[str(file1)].st_size == 10
+        assert entries[str(file2)].st_size == 20
+        assert entries[str(file2)].st_mtime == file2.stat().st_mtime
+
+    def test_scan_directory_with_stat_non_recursive_with_extensions(self, fs_service, temp_dir):
+        """Testa scan_directory_with_stat sem recursão e com filtro de extensões."""
+        # Arrange
+        (temp_dir / "file1.txt").touch()
+        (temp_dir / "file2.JPG").touch()
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        (subdir / "file3.jpg").touch()
+
+        # Act
+        paths = [path for path, _ in fs_service.scan_directory_with_stat(
+            temp_dir, recursive=False, file_extensions=['.jpg'])]
+
+        # Assert
+        assert paths == [str(temp_dir / "file2.JPG")]
+
+    def test_scan_directory_with_stat_symlinked_file(self, fs_service, temp_dir):
+        """Testa se o stat de um link simbólico para arquivo é o do arquivo de destino."""
+        # Arrange
+        target = temp_dir / "target.jpg"
+        target.write_bytes(b"x" * 100)
+        link = temp_dir / "link.jpg"
+        try:
+            link.symlink_to(target)
+        except (OSError, NotImplementedError):
+            pytest.skip("Links simbólicos não suportados")
+
+        # Act
+        results = dict(fs_service.scan_directory_with_stat(temp_dir))
+
+        # Assert
+        assert results[str(link)].st_size == 100
+        assert results[str(target)].st_size == 100
+
+    def test_scan_directory_with_stat_file(self, fs_service, temp_file):
+        """Testa scan_directory_with_stat com um arquivo em vez de diretório."""
+        # Act & Assert
+        with pytest.raises(NotADirectoryError):
+            list(fs_service.scan_directory_with_stat(temp_file))
+
     def test_move_to_trash(self, fs_service, temp_file):
         """Testa move_to_trash com um arquivo existente."""
         # Arrange
@@ -271,6 +508,67 @@ class TestFileSystemService:
                 with pytest.raises(Exception):
                     fs_service.move_to_trash(temp_file)
 
+    def test_move_many_to_trash(self, fs_service, temp_dir):
+        """Testa move_many_to_trash movendo vários arquivos e reportando falhas."""
+        # Arrange
+        files = [temp_dir / f"file{i}.txt" for i in range(5)]
+        for file_path in files:
+            file_path.touch()
+        missing = temp_dir / "missing.txt"
+
+        # Act
+        with mock.patch('fotix.infrastructure.file_system.os.name', 'posix'), \
+             mock.patch('send2trash.send2trash') as mock_send2trash:
+            failures = fs_service.move_many_to_trash(files + [missing])
+
+        # Assert
+        assert mock_send2trash.call_count == 5
+        assert list(failures) == [missing]
+        assert isinstance(failures[missing], FileNotFoundError)
+
+    def test_move_many_to_trash_empty(self, fs_service):
+        """Testa move_many_to_trash sem caminhos."""
+        # Act & Assert
+        with mock.patch('send2trash.send2trash') as mock_send2trash:
+            assert fs_service.move_many_to_trash([]) == {}
+        mock_send2trash.assert_not_called()
+
+    def test_move_batch_to_trash_single_call(self, fs_service, temp_dir):
+        """Testa se o lote (usado no Windows) envia todos os caminhos em uma única chamada."""
+        # Arrange
+        files = [temp_dir / f"file{i}.txt" for i in range(3)]
+        for file_path in files:
+            file_path.touch()
+        missing = temp_dir / "missing.txt"
+
+        # Act
+        with mock.patch('send2trash.send2trash') as mock_send2trash:
+            failures = fs_service._move_batch_to_trash(files + [missing])
+
+        # Assert
+        mock_send2trash.assert_called_once_with([str(f) for f in files])
+        assert list(failures) == [missing]
+
+    def test_move_batch_to_trash_falls_back_on_error(self, fs_service, temp_dir):
+        """Testa se uma falha no lote faz cada caminho ser movido individualmente."""
+        # Arrange
+        good = temp_dir / "good.txt"
+        bad = temp_dir / "bad.txt"
+        good.touch()
+        bad.touch()
+
+        def fake_send2trash(target):
+            if isinstance(target, list) or target == str(bad):
+                raise OSError("Falha na lixeira")
+
+        # Act
+        with mock.patch('send2trash.send2trash', side_effect=fake_send2trash) as mock_send2trash:
+            failures = fs_service._move_batch_to_trash([good, bad])
+
+        # Assert
+        assert mock_send2trash.call_count == 3
+        assert list(failures) == [bad]
+
     def test_move_to_trash_nonexistent_file(self, fs_service, temp_dir):
         """Testa move_to_trash com um arquivo inexistente."""
         # Arrange
@@ -308,7 +606,7 @@ class TestFileSystemService:
         # Arrange
         destination = temp_dir / "copy.txt"
         with mock.patch('pathlib.Path.is_file', return_value=True):
-            with mock.patch('shutil.copy2', side_effect=Exception("Erro genérico")):
+            with mock.patch('fotix.infrastructure.file_system.fast_copy', side_effect=Exception("Erro genérico")):
                 # Act & Assert
                 with pytest.raises(Exception):
                     fs_service.copy_file(temp_file, destination)
@@ -328,11 +626,18 @@ class TestFileSystemService:
         # Arrange
         destination = temp_dir / "copy.txt"
         with mock.patch('pathlib.Path.is_file', return_value=True):
-            with mock.patch('shutil.copy2', side_effect=PermissionError("Sem permissão")):
+            with mock.patch('fotix.infrastructure.file_system.fast_copy', side_effect=PermissionError("Sem permissão")):
                 # Act & Assert
                 with pytest.raises(PermissionError):
                     fs_service.copy_file(temp_file, destination)
 
+    def test_copy_file_same_file(self, fs_service, temp_file):
+        """Testa se copy_file sobre o próprio arquivo falha sem apagar seu conteúdo."""
+        # Act & Assert
+        with pytest.raises(shutil.SameFileError):
+            fs_service.copy_file(temp_file, temp_file)
+        assert temp_file.read_bytes() == "Conteúdo de teste".encode('utf-8')
+
     def test_copy_file_directory_source(self, fs_service, temp_dir):
         """Testa copy_file com um diretório como origem."""
         # Arrange
@@ -387,6 +692,25 @@ class TestFileSystemService:
             with pytest.raises(Exception):
                 fs_service.create_directory(new_dir)
 
+    def test_get_metadata(self, fs_service, temp_file):
+        """Testa get_metadata retornando tamanho e timestamps com um único stat."""
+        # Arrange
+        expected = os.stat(temp_file)
+
+        # Act
+        with mock.patch('fotix.infrastructure.file_system.os.stat', wraps=os.stat) as mock_stat:
+            metadata = fs_service.get_metadata(temp_file)
+
+        # Assert
+        assert metadata == (expected.st_size, expected.st_ctime, expected.st_mtime)
+        assert mock_stat.call_count == 1
+
+    def test_get_metadata_not_a_file(self, fs_service, temp_dir):
+        """Testa get_metadata com um diretório e com um caminho inexistente."""
+        # Act & Assert
+        assert fs_service.get_metadata(temp_dir) is None
+        assert fs_service.get_metadata(temp_dir / "nonexistent.txt") is None
+
     def test_path_exists(self, fs_service, temp_file, temp_dir):
         """Testa path_exists com caminhos existentes e inexistentes."""
         # Arrange
@@ -397,6 +721,18 @@ class TestFileSystemService:
         assert fs_service.path_exists(temp_dir) is True
         assert fs_service.path_exists(nonexistent_file) is False
 
+    def test_path_exists_does_not_follow_symlinks(self, fs_service, temp_dir):
+        """Testa se path_exists considera existente um link simbólico quebrado."""
+        # Arrange
+        link = temp_dir / "link"
+        try:
+            link.symlink_to(temp_dir / "missing")
+        except (OSError, NotImplementedError):
+            pytest.skip("Links simbólicos não suportados")
+
+        # Act & Assert
+        assert fs_service.path_exists(link) is True
+
     def test_get_creation_time(self, fs_service, temp_file):
         """Testa get_creation_time com um arquivo existente."""
         # Act
@@ -444,21 +780,164 @@ class TestFileSystemService:
     def test_get_modification_time_error(self, fs_service, temp_file):
         """Testa get_modification_time com um erro genérico."""
         # Arrange
-        with mock.patch('pathlib.Path.exists', return_value=True):
-            with mock.patch('pathlib.Path.stat', side_effect=Exception("Erro genérico")):
-                # Act
-                modification_time = fs_service.get_modification_time(temp_file)
+        with mock.patch('fotix.infrastructure.file_system.os.stat',
+                        side_effect=_failing_stat(temp_file, Exception("Erro genérico"))):
+            # Act
+            modification_time = fs_service.get_modification_time(temp_file)
 
-                # Assert
-                assert modification_time is None
+        # Assert
+        assert modification_time is None
 
     def test_get_creation_time_error(self, fs_service, temp_file):
         """Testa get_creation_time com um erro genérico."""
         # Arrange
-        with mock.patch('pathlib.Path.exists', return_value=True):
-            with mock.patch('pathlib.Path.stat', side_effect=Exception("Erro genérico")):
-                # Act
-                creation_time = fs_service.get_creation_time(temp_file)
+        with mock.patch('fotix.infrastructure.file_system.os.stat',
+                        side_effect=_failing_stat(temp_file, Exception("Erro genérico"))):
+            # Act
+            creation_time = fs_service.get_creation_time(temp_file)
+
+        # Assert
+        assert creation_time is None
+
+
+class TestFastCopy:
+    """Testes para a função fast_copy."""
 
-                # Assert
-                assert creation_time is None
+    @pytest.fixture
+    def temp_dir(self):
+        """Fixture que cria um diretório temporário para testes."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_fast_copy_preserves_content_and_metadata(self, temp_dir):
+        """Testa se fast_copy copia o conteúdo e preserva a data de modificação."""
+        # Arrange
+        source = temp_dir / "origem.bin"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(source, (1600000000, 1600000000))
+        destination = temp_dir / "destino.bin"
+
+        # Act
+        fast_copy(source, destination)
+
+        # Assert
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime == source.stat().st_mtime
+
+    def test_fast_copy_falls_back_when_copy_file_range_unsupported(self, temp_dir, monkeypatch):
+        """Testa se fast_copy recorre a shutil.copy2 quando copy_file_range não é suportado."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+        destination = temp_dir / "destino.txt"
+
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Cross-device link")
+
+        monkeypatch.setattr(fs_module, "fcntl", None)
+        monkeypatch.setattr(fs_module, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(fs_module.os, "copy_file_range", unsupported, raising=False)
+
+        # Act
+        with mock.patch("fotix.infrastructure.file_system.shutil.copy2", wraps=shutil.copy2) as mock_copy2:
+            fast_copy(source, destination)
+
+        # Assert
+        mock_copy2.assert_called_once_with(source, destination)
+        assert destination.read_text() == "conteudo"
+
+    @pytest.mark.skipif(fs_module.fcntl is None, reason="fcntl indisponível")
+    def test_fast_copy_uses_reflink_when_supported(self, temp_dir, monkeypatch):
+        """Testa se fast_copy clona o arquivo por reflink, sem recorrer a copy_file_range."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+        destination = temp_dir / "destino.txt"
+        ioctl_calls = []
+
+        def fake_ficlone(dst_fd, request, src_fd):
+            ioctl_calls.append(request)
+            os.write(dst_fd, os.pread(src_fd, 1024, 0))
+
+        def unexpected(*args, **kwargs):
+            raise AssertionError("copy_file_range não deveria ser usado")
+
+        monkeypatch.setattr(fs_module.fcntl, "ioctl", fake_ficlone)
+        monkeypatch.setattr(fs_module, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(fs_module.os, "copy_file_range", unexpected, raising=False)
+
+        # Act
+        fast_copy(source, destination)
+
+        # Assert
+        assert ioctl_calls == [fs_module.FICLONE]
+        assert destination.read_text() == "conteudo"
+
+    @pytest.mark.skipif(fs_module.fcntl is None, reason="fcntl indisponível")
+    def test_fast_copy_falls_back_when_reflink_unsupported(self, temp_dir, monkeypatch):
+        """Testa se fast_copy continua com a cópia normal quando o reflink não é suportado."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+        destination = temp_dir / "destino.txt"
+
+        def unsupported(*args):
+            raise OSError(errno.ENOTTY, "Inappropriate ioctl for device")
+
+        monkeypatch.setattr(fs_module.fcntl, "ioctl", unsupported)
+
+        # Act
+        fast_copy(source, destination)
+
+        # Assert
+        assert destination.read_text() == "conteudo"
+
+    def test_fast_copy_missing_source(self, temp_dir):
+        """Testa se fast_copy propaga FileNotFoundError para uma origem inexistente."""
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            fast_copy(temp_dir / "inexistente.txt", temp_dir / "destino.txt")
+
+    def test_fast_copy_same_path_raises(self, temp_dir):
+        """Testa se fast_copy recusa copiar um arquivo sobre ele mesmo sem truncá-lo."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+
+        # Act & Assert
+        with pytest.raises(shutil.SameFileError):
+            fast_copy(source, source)
+        assert source.read_text() == "conteudo"
+
+    def test_fast_copy_hardlink_destination_raises(self, temp_dir):
+        """Testa se fast_copy recusa copiar sobre um hardlink da origem sem truncá-la."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+        link = temp_dir / "link.txt"
+        try:
+            os.link(source, link)
+        except (OSError, NotImplementedError):
+            pytest.skip("Hardlinks não suportados")
+
+        # Act & Assert
+        with pytest.raises(shutil.SameFileError):
+            fast_copy(source, link)
+        assert source.read_text() == "conteudo"
+        assert link.read_text() == "conteudo"
+
+    def test_copy_file_uses_fast_copy(self, temp_dir):
+        """Testa se FileSystemService.copy_file copia por meio de fast_copy."""
+        # Arrange
+        source = temp_dir / "origem.txt"
+        source.write_text("conteudo")
+        destination = temp_dir / "sub" / "destino.txt"
+
+        # Act
+        with mock.patch("fotix.infrastructure.file_system.fast_copy", wraps=fast_copy) as mock_fast_copy:
+            FileSystemService().copy_file(source, destination)
+
+        # Assert
+        mock_fast_copy.assert_called_once_with(source, destination)
+        assert destination.read_text() == "conteudo"
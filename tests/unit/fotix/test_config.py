@@ -5,6 +5,7 @@ Testes unitários para o módulo de configuração.
 import json
 import logging
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from unittest import mock
@@ -26,6 +27,13 @@ from fotix.config import (
 class TestDefaultConfigPath:
     """Testes para a função get_default_config_path."""
 
+    @pytest.fixture(autouse=True)
+    def clear_path_cache(self):
+        """Limpa o cache do caminho padrão antes e depois de cada teste."""
+        get_default_config_path.cache_clear()
+        yield
+        get_default_config_path.cache_clear()
+
     @mock.patch('fotix.config.os.name', 'nt')
     @mock.patch('fotix.config.os.environ', {'APPDATA': r'C:\Users\Test\AppData\Roaming'})
     @mock.patch('fotix.config.Path')
@@ -39,7 +47,8 @@ class TestDefaultConfigPath:
         mock_path_instance.__truediv__.return_value = mock_fotix_instance
         mock_fotix_instance.__truediv__.return_value = mock.MagicMock()
 
-        # Configurar mkdir para não fazer nada
+        # Configurar o diretório como inexistente e mkdir para não fazer nada
+        mock_fotix_instance.is_dir.return_value = False
         mock_fotix_instance.mkdir.return_value = None
 
         get_default_config_path()
@@ -73,6 +82,20 @@ class TestDefaultConfigPath:
         # Verificar se o operador / foi chamado com 'fotix'
         mock_config_path.__truediv__.assert_called_with('fotix')
 
+    @mock.patch('fotix.config.os.name', 'posix')
+    @mock.patch('fotix.config.Path')
+    def test_default_config_path_is_cached(self, mock_path):
+        """Testa se o caminho padrão é calculado e o diretório verificado apenas uma vez."""
+        mock_fotix_path = mock_path.home.return_value.__truediv__.return_value.__truediv__.return_value
+        mock_fotix_path.is_dir.return_value = True
+
+        first = get_default_config_path()
+        second = get_default_config_path()
+
+        assert first is second
+        mock_path.home.assert_called_once()
+        mock_fotix_path.mkdir.assert_not_called()
+
 
 class TestLoadConfig:
     """Testes para a função load_config."""
@@ -159,6 +182,19 @@ class TestLoadConfig:
                 load_config(config_path)
 
 
+    @mock.patch('fotix.config.orjson', None)
+    def test_load_and_save_without_orjson(self):
+        """Testa se a configuração funciona com o json da biblioteca padrão quando orjson não está disponível."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+
+            save_config({"log_level": "DEBUG", "max_workers": 8}, config_path)
+            config = load_config(config_path)
+
+            assert config["log_level"] == "DEBUG"
+            assert config["max_workers"] == 8
+
+
 class TestSaveConfig:
     """Testes para a função save_config."""
 
@@ -215,6 +251,77 @@ class TestSaveConfig:
                 saved_config = json.load(f)
             assert saved_config == custom_config
 
+    def test_save_config_creates_parent_only_once(self):
+        """Testa se o diretório pai é criado apenas na primeira gravação."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "sub" / "config.json"
+
+            with mock.patch('pathlib.Path.mkdir', autospec=True,
+                            side_effect=lambda self, **kw: os.makedirs(self, exist_ok=True)) as mock_mkdir:
+                save_config({"log_level": "INFO"}, config_path)
+                save_config({"log_level": "DEBUG"}, config_path)
+
+            # mkdir só deve ser chamado para o diretório pai na primeira gravação
+            assert mock_mkdir.call_count == 1
+            with open(config_path, 'r', encoding='utf-8') as f:
+                assert json.load(f) == {"log_level": "DEBUG"}
+
+    def test_save_config_recreates_removed_parent(self):
+        """Testa se o diretório pai é recriado quando removido entre duas gravações."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "sub" / "config.json"
+
+            save_config({"log_level": "INFO"}, config_path)
+            shutil.rmtree(config_path.parent)
+            save_config({"log_level": "DEBUG"}, config_path)
+
+            with open(config_path, 'r', encoding='utf-8') as f:
+                assert json.load(f) == {"log_level": "DEBUG"}
+
+    def test_save_config_leaves_no_temp_files(self):
+        """Testa se a gravação atômica não deixa arquivos temporários no diretório."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+
+            save_config({"log_level": "INFO"}, config_path)
+            save_config({"log_level": "DEBUG"}, config_path)
+
+            assert os.listdir(temp_dir) == ["config.json"]
+
+    def test_save_config_removes_temp_file_on_failure(self):
+        """Testa se o arquivo temporário é removido quando a substituição falha."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+
+            with mock.patch('fotix.config.os.replace', side_effect=OSError("disco cheio")):
+                with pytest.raises(OSError):
+                    save_config({"log_level": "INFO"}, config_path)
+
+            assert os.listdir(temp_dir) == []
+
+    @pytest.mark.skipif(os.name != 'posix', reason="Permissões POSIX")
+    def test_save_config_honors_umask(self):
+        """Testa se o arquivo salvo recebe as permissões definidas pela umask."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+
+            old_umask = os.umask(0o022)
+            try:
+                save_config({"log_level": "INFO"}, config_path)
+            finally:
+                os.umask(old_umask)
+
+            assert config_path.stat().st_mode & 0o777 == 0o644
+
+    def test_save_config_uses_four_space_indent(self):
+        """Testa se o arquivo é indentado com 4 espaços, com ou sem orjson."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+
+            save_config({"log_level": "INFO"}, config_path)
+
+            assert config_path.read_text(encoding='utf-8') == '{\n    "log_level": "INFO"\n}'
+
 
 class TestGetConfig:
     """Testes para a função get_config."""
@@ -314,3 +421,15 @@ class TestUpdateConfig:
 
         # Verifica se save_config foi chamado com a configuração modificada
         mock_save_config.assert_called_once_with(mock_config)
+
+    @mock.patch('fotix.config.get_config')
+    @mock.patch('fotix.config.save_config')
+    def test_update_config_without_save(self, mock_save_config, mock_get_config):
+        """Testa se update_config com save=False apenas modifica a configuração em memória."""
+        mock_config = {"existing_key": "old_value"}
+        mock_get_config.return_value = mock_config
+
+        update_config("new_key", "new_value", save=False)
+
+        assert mock_config["new_key"] == "new_value"
+        mock_save_config.assert_not_called()
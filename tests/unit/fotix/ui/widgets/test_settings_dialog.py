@@ -158,8 +158,9 @@ class TestSettingsDialog:
         # Verificar que o campo foi atualizado
         assert settings_dialog._log_file_edit.text() == "/new/logs/fotix.log"
     
+    @patch('fotix.ui.widgets.settings_dialog.save_config')
     @patch('fotix.ui.widgets.settings_dialog.update_config')
-    def test_on_accept(self, mock_update_config, settings_dialog):
+    def test_on_accept(self, mock_update_config, mock_save_config, settings_dialog):
         """Testa o clique no botão OK."""
         # Configurar mocks
         settings_dialog._save_settings = MagicMock(return_value={
@@ -181,6 +182,9 @@ class TestSettingsDialog:
         # Verificar que update_config foi chamado para cada configuração
         assert mock_update_config.call_count == 5
         
+        # Verificar que o arquivo foi gravado uma única vez
+        mock_save_config.assert_called_once()
+        
         # Verificar que o sinal foi emitido
         settings_dialog.settings_changed.emit.assert_called_once()
         
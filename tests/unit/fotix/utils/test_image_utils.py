@@ -16,6 +16,7 @@ from fotix.utils.image_utils import (
     is_image_file,
     get_image_resolution,
     get_image_resolution_from_bytes,
+    get_image_resolution_from_header,
     calculate_image_quality
 )
 
@@ -146,6 +147,28 @@ class TestGetImageResolutionFromBytes:
         # Assert
         assert resolution == (1024, 768)
 
+    def test_get_resolution_from_bytes_stops_after_header(self):
+        """Testa se a leitura é interrompida assim que as dimensões estão no cabeçalho."""
+        # Arrange
+        buffer = io.BytesIO()
+        Image.new("RGB", (320, 240)).save(buffer, "PNG")
+        consumed = []
+
+        def content_provider():
+            consumed.append(1)
+            yield buffer.getvalue()
+            consumed.append(2)
+            yield b"restante_que_nao_deve_ser_lido"
+
+        # Act
+        with patch("PIL.Image.open") as mock_open:
+            resolution = get_image_resolution_from_bytes(content_provider)
+
+        # Assert
+        assert resolution == (320, 240)
+        assert consumed == [1]
+        mock_open.assert_not_called()
+
     def test_get_resolution_from_bytes_invalid_image(self):
         """Testa se a função retorna None para bytes que não representam uma imagem válida."""
         # Arrange
@@ -173,6 +196,35 @@ class TestGetImageResolutionFromBytes:
         assert resolution is None
 
 
+class TestGetImageResolutionFromHeader:
+    """Testes para a função get_image_resolution_from_header."""
+
+    @pytest.mark.parametrize("image_format", ["PNG", "GIF", "BMP", "JPEG"])
+    def test_get_resolution_from_header(self, image_format):
+        """Testa se a função extrai a resolução do cabeçalho dos formatos suportados."""
+        # Arrange
+        buffer = io.BytesIO()
+        Image.new("RGB", (123, 45)).save(buffer, image_format)
+        header = buffer.getvalue()[:4096]
+
+        # Act
+        resolution = get_image_resolution_from_header(header)
+
+        # Assert
+        assert resolution == (123, 45)
+
+    @pytest.mark.parametrize("header", [
+        b"not_an_image",
+        b"\x89PNG\r\n\x1a\n",  # PNG truncado
+        b"\xff\xd8\xff\xe0\x00\x10",  # JPEG sem o marcador SOF
+        b"",
+    ])
+    def test_get_resolution_from_header_unavailable(self, header):
+        """Testa se a função retorna None quando as dimensões não estão no cabeçalho."""
+        # Act & Assert
+        assert get_image_resolution_from_header(header) is None
+
+
 class TestCalculateImageQuality:
     """Testes para a função calculate_image_quality."""
 